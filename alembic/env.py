@@ -4,8 +4,12 @@ from alembic import context
 from sqlalchemy import engine_from_config, pool
 
 from src.entities.base import Base
-from src.entities.product.product_entity import Product
-from src.entities.category.category_entity import Category
+
+# Imported for their side effect: registering the tables on Base.metadata
+from src.entities.category.category_entity import Category  # noqa: F401
+from src.entities.counter.counter_entity import CatalogCounter  # noqa: F401
+from src.entities.import_job.import_job_entity import ProductImport  # noqa: F401
+from src.entities.product.product_entity import Product  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
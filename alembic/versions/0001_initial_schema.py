@@ -0,0 +1,67 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: str | Sequence[str] | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Databases created before the migrations were versioned already have the
+    # tables (they used to be autogenerated at startup): keep them as they are.
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table("Categories"):
+        op.create_table(
+            "Categories",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(length=100), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+    if not inspector.has_table("Products"):
+        op.create_table(
+            "Products",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(), nullable=True),
+            sa.Column("price", sa.Integer(), nullable=True),
+            sa.Column("tags", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+            sa.Column("created_at", sa.String(), nullable=True),
+            sa.Column("description", sa.String(), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_Products_id", "Products", ["id"])
+        op.create_index("ix_Products_name", "Products", ["name"])
+        op.create_index("ix_Products_price", "Products", ["price"])
+        op.create_index("ix_Products_created_at", "Products", ["created_at"])
+        op.create_index("ix_Products_description", "Products", ["description"])
+        op.create_index("ix_Products_tags", "Products", ["tags"], postgresql_using="gin")
+
+    if not inspector.has_table("ProductCategories"):
+        op.create_table(
+            "ProductCategories",
+            sa.Column("product_id", sa.Integer(), nullable=True),
+            sa.Column("category_id", sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(["category_id"], ["Categories.id"]),
+            sa.ForeignKeyConstraint(["product_id"], ["Products.id"]),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("ProductCategories")
+    op.drop_table("Products")
+    op.drop_table("Categories")
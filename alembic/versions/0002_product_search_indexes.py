@@ -0,0 +1,43 @@
+"""product search indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: str | Sequence[str] | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Same expression as SEARCH_DOCUMENT_SQL in src/search/postgres_search_backend.py
+SEARCH_DOCUMENT = (
+    "to_tsvector('simple'::regconfig, "
+    "coalesce(name, '') || ' ' || "
+    "coalesce(description, '') || ' ' || "
+    "coalesce(tags::text, ''))"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        f'CREATE INDEX IF NOT EXISTS "ix_Products_search_document" '
+        f'ON "Products" USING gin (({SEARCH_DOCUMENT}))'
+    )
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS "ix_Products_name_trgm" '
+        'ON "Products" USING gin (name gin_trgm_ops)'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP INDEX IF EXISTS "ix_Products_name_trgm"')
+    op.execute('DROP INDEX IF EXISTS "ix_Products_search_document"')
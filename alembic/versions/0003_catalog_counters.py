@@ -0,0 +1,37 @@
+"""catalog counters
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: str | Sequence[str] | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "CatalogCounters",
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("value", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    # Same name as PRODUCTS_COUNTER in src/entities/counter/counter_crud.py
+    op.execute(
+        'INSERT INTO "CatalogCounters" (name, value) '
+        "SELECT 'products', count(*) FROM \"Products\""
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("CatalogCounters")
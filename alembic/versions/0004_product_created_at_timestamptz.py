@@ -0,0 +1,39 @@
+"""product created_at as timestamptz
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: str | Sequence[str] | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('DROP INDEX IF EXISTS "ix_Products_created_at"')
+    # Rows used to be stamped with strftime("%d/%m/%Y"); anything else becomes NULL.
+    # The dates are read as UTC midnights: to_timestamp alone would use the session TimeZone
+    op.execute(
+        'ALTER TABLE "Products" ALTER COLUMN created_at TYPE timestamptz USING '
+        "CASE WHEN created_at ~ '^\\d{2}/\\d{2}/\\d{4}$' "
+        "THEN to_timestamp(created_at, 'DD/MM/YYYY')::timestamp AT TIME ZONE 'UTC' END"
+    )
+    op.create_index("ix_Products_created_at_id", "Products", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_Products_created_at_id", table_name="Products")
+    op.execute(
+        'ALTER TABLE "Products" ALTER COLUMN created_at TYPE varchar '
+        "USING to_char(created_at AT TIME ZONE 'UTC', 'DD/MM/YYYY')"
+    )
+    op.create_index("ix_Products_created_at", "Products", ["created_at"])
@@ -0,0 +1,36 @@
+"""product tags gin index
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: str | Sequence[str] | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # `tags` used to carry both index=True and a GIN index under the same name:
+    # databases created from the models may have ended up with the B-tree one,
+    # which cannot serve the ?| and @> operators. Rebuild it as GIN if needed.
+    index_definition = op.get_bind().scalar(
+        sa.text("SELECT indexdef FROM pg_indexes WHERE indexname = 'ix_Products_tags'")
+    )
+    if index_definition is not None and "USING gin" in index_definition:
+        return
+    op.execute('DROP INDEX IF EXISTS "ix_Products_tags"')
+    op.create_index("ix_Products_tags", "Products", ["tags"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The GIN index is the one declared since 0001: nothing to restore
@@ -0,0 +1,64 @@
+"""product index audit
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 11:30:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: str | Sequence[str] | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ix_Products_id duplicates the primary key; name is searched through
+    # ix_Products_name_trgm and description through ix_Products_search_document,
+    # never by B-tree (which also rejects descriptions over ~2.7kB)
+    op.execute('DROP INDEX IF EXISTS "ix_Products_id"')
+    op.execute('DROP INDEX IF EXISTS "ix_Products_name"')
+    op.execute('DROP INDEX IF EXISTS "ix_Products_description"')
+    # Replaced by (price, id): same range scans, plus ordered and index-only pages
+    op.execute('DROP INDEX IF EXISTS "ix_Products_price"')
+    op.create_index("ix_Products_price_id", "Products", ["price", "id"])
+
+    # The association table had no key: drop duplicated and half-empty links first
+    op.execute(
+        'DELETE FROM "ProductCategories" WHERE product_id IS NULL OR category_id IS NULL'
+    )
+    op.execute(
+        'DELETE FROM "ProductCategories" AS duplicate USING "ProductCategories" AS kept '
+        "WHERE duplicate.product_id = kept.product_id "
+        "AND duplicate.category_id = kept.category_id "
+        "AND duplicate.ctid > kept.ctid"
+    )
+    op.alter_column("ProductCategories", "product_id", nullable=False)
+    op.alter_column("ProductCategories", "category_id", nullable=False)
+    op.create_primary_key(
+        "ProductCategories_pkey", "ProductCategories", ["product_id", "category_id"]
+    )
+    op.create_index(
+        "ix_ProductCategories_category_id_product_id",
+        "ProductCategories",
+        ["category_id", "product_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_ProductCategories_category_id_product_id", table_name="ProductCategories")
+    op.drop_constraint("ProductCategories_pkey", "ProductCategories", type_="primary")
+    op.alter_column("ProductCategories", "category_id", nullable=True)
+    op.alter_column("ProductCategories", "product_id", nullable=True)
+
+    op.drop_index("ix_Products_price_id", table_name="Products")
+    op.create_index("ix_Products_price", "Products", ["price"])
+    op.create_index("ix_Products_description", "Products", ["description"])
+    op.create_index("ix_Products_name", "Products", ["name"])
+    op.create_index("ix_Products_id", "Products", ["id"])
@@ -0,0 +1,27 @@
+"""catalog version counter
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: str | Sequence[str] | None = "0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Same name as CATALOG_VERSION_COUNTER in src/entities/counter/counter_crud.py
+    op.execute('INSERT INTO "CatalogCounters" (name, value) VALUES (\'catalog_version\', 0)')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DELETE FROM "CatalogCounters" WHERE name = \'catalog_version\'')
@@ -0,0 +1,27 @@
+"""categories version counter
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: str | Sequence[str] | None = "0007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Same name as CATEGORIES_VERSION_COUNTER in src/entities/counter/counter_crud.py
+    op.execute('INSERT INTO "CatalogCounters" (name, value) VALUES (\'categories_version\', 0)')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DELETE FROM "CatalogCounters" WHERE name = \'categories_version\'')
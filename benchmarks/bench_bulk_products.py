@@ -0,0 +1,91 @@
+"""
+Benchmark of the bulk update/delete APIs against the per-item loop.
+
+Usage (against the database configured in `.env.db`):
+
+    uv run python -m benchmarks.bench_bulk_products --rows 5000
+
+Each scenario inserts `--rows` fresh products, then reprices and deletes them
+once with `update_product`/`delete_product` in a loop and once with
+`bulk_update_products`/`bulk_delete_products`.
+"""
+
+import argparse
+import sys
+import time
+
+from src.entities.product.product_crud import (
+    bulk_delete_products,
+    bulk_update_products,
+    create_products_bulk,
+    delete_product,
+    update_product,
+)
+from src.models.request_models import (
+    BulkDeleteProductsRequest,
+    BulkUpdateProductsRequest,
+    CreateProductRequest,
+    DeleteProductRequest,
+)
+
+
+def _seed(rows: int) -> list[int]:
+    products = [
+        CreateProductRequest(
+            name=f"Bulk bench product {i}",
+            price=100,
+            categories_name=None,
+            tags=["bench"],
+            description="Synthetic product used by the bulk benchmark",
+        )
+        for i in range(rows)
+    ]
+    return create_products_bulk(products, [[] for _ in products])
+
+
+def _timed(label: str, func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<20} {elapsed * 1000.0:>12.1f} ms")
+    return elapsed
+
+
+def _loop_update(product_ids: list[int]):
+    for product_id in product_ids:
+        update_product({"id": product_id, "price": 110})
+
+
+def _loop_delete(product_ids: list[int]):
+    for product_id in product_ids:
+        delete_product(DeleteProductRequest(id=product_id))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000)
+    args = parser.parse_args()
+
+    print(f"{args.rows} products per scenario")
+
+    product_ids = _seed(args.rows)
+    loop_update = _timed("loop update", _loop_update, product_ids)
+    loop_delete = _timed("loop delete", _loop_delete, product_ids)
+
+    product_ids = _seed(args.rows)
+    bulk_update = _timed(
+        "bulk update",
+        bulk_update_products,
+        BulkUpdateProductsRequest(ids=product_ids, price_multiplier=1.1),
+    )
+    bulk_delete = _timed(
+        "bulk delete", bulk_delete_products, BulkDeleteProductsRequest(ids=product_ids)
+    )
+
+    print(f"update speedup: {loop_update / bulk_update:.1f}x")
+    print(f"delete speedup: {loop_delete / bulk_delete:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
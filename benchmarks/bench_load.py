@@ -0,0 +1,587 @@
+"""
+End-to-end load test of the HTTP API.
+
+Usage:
+
+    uv run python -m benchmarks.bench_load --target asgi --concurrency 16 --duration 30
+    uv run python -m benchmarks.bench_load --target uvicorn --workers 4 --save load.json
+    uv run python -m benchmarks.bench_load --target uvicorn --baseline load.json
+
+`--target asgi` drives `src.main:app` in process through httpx's ASGI transport
+(no network, no server: it measures the application itself). `--target uvicorn`
+starts `uvicorn src.main:app` in a subprocess and talks to it over TCP, and
+`--base-url` points the same workload at an already running server.
+
+Every route of the product, category and chatbot routers is part of the
+workload. `--write-ratio` is the fraction of requests that modify the catalog;
+the chatbot routes call the configured LLM, so they only run with
+`--include-chatbot`. The test creates its own categories and products (prefixed
+with the run id) and deletes them at the end unless `--keep-data` is given.
+
+The script prints p50/p95/p99 latency and requests/sec per route and overall.
+`--save` writes the results as JSON; `--baseline` compares the run with a saved
+one and exits with status 1 when a p95/p99 latency grows, or the overall
+throughput drops, by more than `--max-regression`.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+
+PRODUCT = "/v1/product"
+CATEGORY = "/v1/category"
+CHATBOT = "/v1/chatbot"
+
+NOUNS = ["Lamp", "Chair", "Coffee", "Jacket", "Kettle", "Notebook", "Tea", "Watch"]
+TAGS = ["new", "sale", "eco", "premium", "gift", "outdoor", "kitchen", "office"]
+CHAT_MESSAGES = [
+    "Which products cost less than 20 euros?",
+    "Show me the categories of the catalog",
+    "How many products are there?",
+]
+# Operations with fewer samples are left out of the baseline comparison
+MIN_SAMPLES = 20
+
+
+@dataclass
+class LoadContext:
+    """State shared by the workers: the ids the load test created and may modify."""
+
+    run_id: str
+    rng: random.Random
+    category_names: list[str] = field(default_factory=list)
+    product_ids: list[int] = field(default_factory=list)
+    created_categories: list[str] = field(default_factory=list)
+    import_jobs: list[str] = field(default_factory=list)
+    sequence: int = 0
+
+    def unique_name(self, kind: str) -> str:
+        self.sequence += 1
+        return f"{self.run_id} {kind} {self.sequence}"
+
+    def random_product(self) -> dict:
+        rng = self.rng
+        return {
+            "name": self.unique_name(rng.choice(NOUNS)),
+            "price": round(rng.uniform(1, 500), 2),
+            "categories_name": rng.sample(self.category_names, k=rng.randint(1, len(self.category_names))),
+            "tags": rng.sample(TAGS, k=rng.randint(0, 3)),
+            "description": f"Product created by the load test {self.run_id}",
+        }
+
+    def random_filter(self) -> dict:
+        rng = self.rng
+        return {
+            "text_filter": rng.choice([None, None, rng.choice(NOUNS)]),
+            "category_filter": rng.choice([None, [rng.choice(self.category_names)]]),
+            "min_max_price_filter": rng.choice([None, (0, rng.choice([50, 100, 250]))]),
+            "sort_by": rng.choice([None, ("price", "asc"), ("price", "desc"), ("date", "desc")]),
+            "tags_any": rng.choice([None, None, rng.sample(TAGS, k=2)]),
+            "page": rng.randint(1, 3),
+            "page_size": rng.choice([5, 20, 50]),
+            "facets": rng.random() < 0.2,
+        }
+
+
+# A call returns None when it has nothing to do (e.g. no product left to delete):
+# the worker then picks another operation and nothing is recorded
+Call = Callable[[httpx.AsyncClient, LoadContext], Awaitable[httpx.Response | None]]
+
+
+@dataclass(frozen=True)
+class Operation:
+    name: str
+    kind: str  # "read", "write" or "chat"
+    weight: int
+    call: Call
+
+
+OPERATIONS: list[Operation] = []
+
+
+def operation(name: str, kind: str, weight: int):
+    def register(call: Call) -> Call:
+        OPERATIONS.append(Operation(name, kind, weight, call))
+        return call
+
+    return register
+
+
+# ---------------------------------------------------------------- product reads
+
+@operation("get_product_by_id", "read", 20)
+async def _get_product_by_id(client, ctx):
+    if not ctx.product_ids:
+        return None
+    return await client.request(
+        "GET", f"{PRODUCT}/get_product_by_id/", json={"id": ctx.rng.choice(ctx.product_ids)}
+    )
+
+
+@operation("get_products_list", "read", 15)
+async def _get_products_list(client, ctx):
+    return await client.get(
+        f"{PRODUCT}/get_products_list/", params={"page": ctx.rng.randint(1, 5), "page_size": 20}
+    )
+
+
+@operation("get_filtered_products", "read", 25)
+async def _get_filtered_products(client, ctx):
+    return await client.post(f"{PRODUCT}/get_filtered_products/", json=ctx.random_filter())
+
+
+@operation("get_tag_cloud", "read", 4)
+async def _get_tag_cloud(client, ctx):
+    return await client.get(f"{PRODUCT}/get_tag_cloud/", params={"limit": 20})
+
+
+@operation("get_number_of_product", "read", 2)
+async def _get_number_of_product(client, ctx):
+    return await client.get(f"{PRODUCT}/get_number_of_product/")
+
+
+@operation("get_number_of_products", "read", 2)
+async def _get_number_of_products(client, ctx):
+    return await client.get(f"{PRODUCT}/get_number_of_products/")
+
+
+@operation("export_products", "read", 1)
+async def _export_products(client, ctx):
+    return await client.get(f"{PRODUCT}/export_products/", params={"compress": ctx.rng.random() < 0.5})
+
+
+@operation("import_status", "read", 1)
+async def _import_status(client, ctx):
+    if not ctx.import_jobs:
+        return None
+    return await client.get(f"{PRODUCT}/import_status/", params={"job_id": ctx.rng.choice(ctx.import_jobs)})
+
+
+@operation("get_cache_stats", "read", 1)
+async def _get_cache_stats(client, ctx):
+    return await client.get(f"{PRODUCT}/get_cache_stats/")
+
+
+# --------------------------------------------------------------- product writes
+
+@operation("create_product", "write", 6)
+async def _create_product(client, ctx):
+    return await client.post(f"{PRODUCT}/create_product/", json=ctx.random_product())
+
+
+@operation("update_product", "write", 6)
+async def _update_product(client, ctx):
+    if not ctx.product_ids:
+        return None
+    product = ctx.random_product() | {"id": ctx.rng.choice(ctx.product_ids)}
+    return await client.put(f"{PRODUCT}/update_product/", json=product)
+
+
+@operation("delete_product", "write", 2)
+async def _delete_product(client, ctx):
+    if len(ctx.product_ids) < 2:
+        return None
+    product_id = ctx.product_ids.pop(ctx.rng.randrange(len(ctx.product_ids)))
+    return await client.request("DELETE", f"{PRODUCT}/delete_product/", json={"id": product_id})
+
+
+@operation("bulk_update_products", "write", 2)
+async def _bulk_update_products(client, ctx):
+    if not ctx.product_ids:
+        return None
+    ids = ctx.rng.sample(ctx.product_ids, k=min(10, len(ctx.product_ids)))
+    return await client.put(
+        f"{PRODUCT}/bulk_update_products/",
+        json={"ids": ids, "price_multiplier": ctx.rng.choice([0.99, 1.01])},
+    )
+
+
+@operation("bulk_delete_products", "write", 1)
+async def _bulk_delete_products(client, ctx):
+    if len(ctx.product_ids) < 10:
+        return None
+    ids = [ctx.product_ids.pop(ctx.rng.randrange(len(ctx.product_ids))) for _ in range(3)]
+    return await client.request("DELETE", f"{PRODUCT}/bulk_delete_products/", json={"ids": ids})
+
+
+@operation("import_products", "write", 1)
+async def _import_products(client, ctx):
+    body = "\n".join(json.dumps(ctx.random_product()) for _ in range(20))
+    response = await client.post(
+        f"{PRODUCT}/import_products/", params={"file_format": "ndjson"}, content=body.encode()
+    )
+    if response.status_code < 400:
+        job_id = (response.json().get("data") or {}).get("job_id")
+        if job_id:
+            ctx.import_jobs.append(job_id)
+    return response
+
+
+# ------------------------------------------------------------------- categories
+
+@operation("get_categories_list", "read", 6)
+async def _get_categories_list(client, ctx):
+    return await client.get(f"{CATEGORY}/get_categories_list/")
+
+
+@operation("get_registry_stats", "read", 1)
+async def _get_registry_stats(client, ctx):
+    return await client.get(f"{CATEGORY}/get_registry_stats/")
+
+
+@operation("create_category", "write", 1)
+async def _create_category(client, ctx):
+    name = ctx.unique_name("category")
+    response = await client.post(f"{CATEGORY}/create_category/", json={"name": name})
+    ctx.created_categories.append(name)
+    return response
+
+
+@operation("delete_category", "write", 1)
+async def _delete_category(client, ctx):
+    if not ctx.created_categories:
+        return None
+    # The create endpoint does not return the id: look it up (outside the measured call)
+    category_ids = await _category_ids(client, [ctx.created_categories.pop()])
+    if not category_ids:
+        return None
+    return await client.request("DELETE", f"{CATEGORY}/delete_category/", json={"id": category_ids[0]})
+
+
+# ---------------------------------------------------------------------- chatbot
+
+@operation("chat_with_bot", "chat", 2)
+async def _chat_with_bot(client, ctx):
+    return await client.post(f"{CHATBOT}/conversation", json={"message": ctx.rng.choice(CHAT_MESSAGES)})
+
+
+@operation("reset_conversation", "chat", 1)
+async def _reset_conversation(client, ctx):
+    return await client.post(f"{CHATBOT}/reset_conversation")
+
+
+# ------------------------------------------------------------------ setup/teardown
+
+async def _category_ids(client: httpx.AsyncClient, names: list[str]) -> list[int]:
+    response = await client.get(f"{CATEGORY}/get_categories_list/")
+    wanted = set(names)
+    return [category["id"] for category in response.json().get("data") or [] if category["name"] in wanted]
+
+
+async def _own_product_ids(client: httpx.AsyncClient, ctx: LoadContext) -> list[int]:
+    ids, page = [], 1
+    while True:
+        response = await client.post(
+            f"{PRODUCT}/get_filtered_products/",
+            json={
+                "text_filter": None,
+                "category_filter": ctx.category_names,
+                "min_max_price_filter": None,
+                "sort_by": ("date", "desc"),
+                "page": page,
+                "page_size": 100,
+            },
+        )
+        data = response.json()["data"]
+        ids.extend(product["id"] for product in data["products"])
+        if page >= data["pagination"]["total_pages"]:
+            return ids
+        page += 1
+
+
+async def setup_catalog(client: httpx.AsyncClient, ctx: LoadContext, categories: int, products: int):
+    """Create the categories and products the workload reads and modifies."""
+    ctx.category_names = [ctx.unique_name("category") for _ in range(categories)]
+    for name in ctx.category_names:
+        await client.post(f"{CATEGORY}/create_category/", json={"name": name})
+    for start in range(0, products, 50):
+        await asyncio.gather(*(
+            client.post(f"{PRODUCT}/create_product/", json=ctx.random_product())
+            for _ in range(min(50, products - start))
+        ))
+    ctx.product_ids = await _own_product_ids(client, ctx)
+    print(f"setup: {len(ctx.category_names)} categories, {len(ctx.product_ids)} products ({ctx.run_id})")
+
+
+async def teardown_catalog(client: httpx.AsyncClient, ctx: LoadContext):
+    """Delete everything created by the run (products first, they reference the categories)."""
+    await client.request(
+        "DELETE",
+        f"{PRODUCT}/bulk_delete_products/",
+        json={"product_filter": {
+            "text_filter": None,
+            "category_filter": ctx.category_names,
+            "min_max_price_filter": None,
+            "sort_by": None,
+        }},
+    )
+    names = ctx.category_names + ctx.created_categories
+    for category_id in await _category_ids(client, names):
+        await client.request("DELETE", f"{CATEGORY}/delete_category/", json={"id": category_id})
+
+
+# ------------------------------------------------------------------------ runner
+
+class Workload:
+    """Weighted choice of the next operation, honouring the write ratio."""
+
+    def __init__(self, write_ratio: float, include_chatbot: bool):
+        self.write_ratio = write_ratio
+        kinds = ("read", "chat") if include_chatbot else ("read",)
+        self.reads = [op for op in OPERATIONS if op.kind in kinds]
+        self.writes = [op for op in OPERATIONS if op.kind == "write"]
+
+    def pick(self, rng: random.Random) -> Operation:
+        pool = self.writes if rng.random() < self.write_ratio else self.reads
+        return rng.choices(pool, weights=[op.weight for op in pool])[0]
+
+
+def _failed(response: httpx.Response) -> bool:
+    if response.status_code >= 400:
+        return True
+    # The API reports errors in the `status` field of a 200 response
+    if response.headers.get("content-type", "").startswith("application/json"):
+        body = response.json()
+        return isinstance(body, dict) and isinstance(body.get("status"), int) and body["status"] >= 400
+    return False
+
+
+async def _worker(client, ctx, workload, deadline, budget, latencies, errors):
+    while time.perf_counter() < deadline and budget[0] > 0:
+        op = workload.pick(ctx.rng)
+        start = time.perf_counter()
+        try:
+            response = await op.call(client, ctx)
+        except httpx.HTTPError:
+            latencies[op.name].append(time.perf_counter() - start)
+            errors[op.name] += 1
+            budget[0] -= 1
+            continue
+        if response is None:
+            continue
+        latencies[op.name].append(time.perf_counter() - start)
+        if _failed(response):
+            errors[op.name] += 1
+        budget[0] -= 1
+
+
+def _summary(samples: list[float], errors: int, elapsed: float) -> dict:
+    if len(samples) > 1:
+        cuts = statistics.quantiles(samples, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = samples[0] if samples else 0.0
+    return {
+        "count": len(samples),
+        "errors": errors,
+        "rps": round(len(samples) / elapsed, 2),
+        "p50_ms": round(p50 * 1000, 2),
+        "p95_ms": round(p95 * 1000, 2),
+        "p99_ms": round(p99 * 1000, 2),
+    }
+
+
+async def run_load(
+    client: httpx.AsyncClient, args, on_setup: Callable[[], Awaitable[None]] | None = None
+) -> dict:
+    """Set up the catalog, run the workload, tear down; `on_setup` is awaited between setup and load."""
+    ctx = LoadContext(run_id=f"load-{int(time.time())}", rng=random.Random(args.seed))  # noqa: S311 - not security
+    await setup_catalog(client, ctx, args.setup_categories, args.setup_products)
+    if on_setup is not None:
+        await on_setup()
+
+    workload = Workload(args.write_ratio, args.include_chatbot)
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    budget = [args.requests or sys.maxsize]
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(
+            _worker(client, ctx, workload, start + args.duration, budget, latencies, errors)
+            for _ in range(args.concurrency)
+        ))
+    finally:
+        elapsed = time.perf_counter() - start
+        if not args.keep_data:
+            await teardown_catalog(client, ctx)
+
+    return {
+        "target": args.target,
+        "concurrency": args.concurrency,
+        "write_ratio": args.write_ratio,
+        "seconds": round(elapsed, 2),
+        "overall": _summary(
+            [sample for samples in latencies.values() for sample in samples],
+            sum(errors.values()),
+            elapsed,
+        ),
+        "operations": {
+            name: _summary(samples, errors[name], elapsed) for name, samples in sorted(latencies.items())
+        },
+    }
+
+
+# ------------------------------------------------------------------------ targets
+
+@asynccontextmanager
+async def asgi_client(args):
+    from src.main import app
+
+    # Unhandled errors become 500 responses, as behind a server, instead of aborting the run
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    # ASGITransport does not send lifespan events: run the app startup ourselves
+    async with app.router.lifespan_context(app), httpx.AsyncClient(
+        transport=transport, base_url="http://bench", timeout=args.timeout
+    ) as client:
+        yield client
+
+
+@asynccontextmanager
+async def http_client(args, base_url: str):
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=args.timeout, limits=limits) as client:
+        yield client
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def uvicorn_client(args):
+    port = _free_port()
+    command = [
+        sys.executable, "-m", "uvicorn", "src.main:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(args.workers), "--no-access-log", "--log-level", "warning",
+    ]
+    server = subprocess.Popen(command)  # noqa: S603 - fixed command line
+    try:
+        async with http_client(args, f"http://127.0.0.1:{port}") as client:
+            await _wait_until_ready(client, server)
+            yield client
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+async def _wait_until_ready(client: httpx.AsyncClient, server: subprocess.Popen, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with status {server.returncode}")
+        try:
+            if (await client.get("/health_check/")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError(f"uvicorn did not become ready in {timeout}s")
+
+
+# ------------------------------------------------------------------------ report
+
+def print_report(results: dict):
+    print(
+        f"\n{results['target']}: {results['concurrency']} workers, write ratio {results['write_ratio']}, "
+        f"{results['seconds']}s"
+    )
+    print(f"{'operation':<24} {'count':>7} {'errors':>7} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    rows = list(results["operations"].items()) + [("overall", results["overall"])]
+    for name, row in rows:
+        print(
+            f"{name:<24} {row['count']:>7} {row['errors']:>7} {row['rps']:>9.1f} "
+            f"{row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f}"
+        )
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> list[str]:
+    """Return a description of every metric that regressed more than `max_regression`."""
+    regressions = []
+    pairs = [("overall", results["overall"], baseline["overall"])] + [
+        (name, row, baseline["operations"][name])
+        for name, row in results["operations"].items()
+        if name in baseline["operations"]
+    ]
+    for name, row, base in pairs:
+        if min(row["count"], base["count"]) < MIN_SAMPLES:
+            continue
+        regressions.extend(
+            f"{name} {metric}: {base[metric]} -> {row[metric]}"
+            for metric in ("p95_ms", "p99_ms")
+            if base[metric] and row[metric] > base[metric] * (1 + max_regression)
+        )
+    rps, base_rps = results["overall"]["rps"], baseline["overall"]["rps"]
+    if rps < base_rps * (1 - max_regression):
+        regressions.append(f"overall rps: {base_rps} -> {rps}")
+    return regressions
+
+
+async def _run(args) -> dict:
+    if args.base_url:
+        client = http_client(args, args.base_url)
+    elif args.target == "uvicorn":
+        client = uvicorn_client(args)
+    else:
+        client = asgi_client(args)
+    async with client as connected:
+        return await run_load(connected, args)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", choices=["asgi", "uvicorn"], default="asgi")
+    parser.add_argument("--base-url", help="Load an already running server instead of starting one")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of load")
+    parser.add_argument("--requests", type=int, default=0, help="Stop after this many requests (0: no limit)")
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    parser.add_argument("--include-chatbot", action="store_true")
+    parser.add_argument("--setup-categories", type=int, default=3)
+    parser.add_argument("--setup-products", type=int, default=200)
+    parser.add_argument("--keep-data", action="store_true")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--save", type=Path, help="Write the results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="Compare with the results saved by a previous run")
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = asyncio.run(_run(args))
+    print_report(results)
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2))
+        print(f"\nResults saved to {args.save}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.max_regression)
+        for regression in regressions:
+            print(f"FAIL: {regression}")
+        if regressions:
+            return 1
+        print(f"\nNo regression above {args.max_regression:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
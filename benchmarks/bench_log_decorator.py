@@ -0,0 +1,103 @@
+"""
+Benchmark of the per-call overhead of the `frontier_logger`/`inner_logger` decorators.
+
+Usage:
+
+    uv run python -m benchmarks.bench_log_decorator --calls 20000 --products 100
+
+The decorated function returns a list of `--products` product dicts, like a list
+endpoint. Every scenario sets the logger up with `setup_logger` for its mode,
+writing the log file in a temporary directory: debug writes synchronously at
+DEBUG level, production hands the records to the bounded background sinks. The
+console sink is set to CRITICAL so it does not flood the terminal. The script
+prints the microseconds per call added on top of the undecorated function.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from src.config.log_setting import LogSetting
+from src.log.logger import flush_logger, setup_logger
+from src.log.logger_decorator import frontier_logger, inner_logger
+
+
+def _products(count: int) -> list[dict]:
+    return [
+        {
+            "id": i,
+            "name": f"Product {i}",
+            "price": 10 + i,
+            "description": "A product description long enough to look like a real one " * 2,
+            "tags": ["new", "sale", "eco"],
+            "categories": ["Kitchen", "Home"],
+            "created_at": "2025-01-01T00:00:00+00:00",
+        }
+        for i in range(count)
+    ]
+
+
+def _time(func, calls: int, payload) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func(payload, page=1)
+    return (time.perf_counter() - start) / calls * 1_000_000
+
+
+def _scenario(label: str, decorator, setting: LogSetting, calls: int, payload, baseline: float, log_dir: Path):
+    setup_logger(setting, log_dir / label.replace(" ", "_"))
+
+    @decorator(setting)
+    def list_products(products, page):
+        return products
+
+    per_call = _time(list_products, calls, payload)
+    flush_logger()
+    print(f"{label:<30} {per_call:>10.1f} us/call  overhead {per_call - baseline:>10.1f} us")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--products", type=int, default=100)
+    parser.add_argument("--sample-rate", type=float, default=0.01)
+    args = parser.parse_args()
+
+    payload = _products(args.products)
+
+    def list_products(products, page):
+        return products
+
+    baseline = _time(list_products, args.calls, payload)
+    print(f"{args.calls} calls returning {args.products} products")
+    print(f"{'undecorated':<30} {baseline:>10.1f} us/call")
+
+    quiet = {"console_level": "CRITICAL", "queue_size": args.calls * 2}
+    debug = LogSetting(mode="debug", file_level="DEBUG", **quiet)
+    production = LogSetting(mode="production", file_level="INFO", **quiet)
+    sampled = LogSetting(
+        mode="production", file_level="INFO", sample_rates={"list_products": args.sample_rate}, **quiet
+    )
+    disabled = LogSetting(mode="production", file_level="WARNING", **quiet)
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        for label, decorator, setting in [
+            ("frontier debug", frontier_logger, debug),
+            ("frontier production", frontier_logger, production),
+            (f"frontier production {args.sample_rate:.0%}", frontier_logger, sampled),
+            ("frontier level disabled", frontier_logger, disabled),
+            ("inner debug", inner_logger, debug),
+            ("inner production", inner_logger, production),
+            (f"inner production {args.sample_rate:.0%}", inner_logger, sampled),
+        ]:
+            _scenario(label, decorator, setting, args.calls, payload, baseline, Path(log_dir))
+        logger.remove()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""
+Soak test of the database connection pool.
+
+Usage:
+
+    uv run python -m benchmarks.bench_pool_soak --duration 120
+    uv run python -m benchmarks.bench_pool_soak --target uvicorn --multiplier 10
+    uv run python -m benchmarks.bench_pool_soak --base-url http://localhost:8000 --pool-size 10
+
+Runs the read/write workload of `bench_load` with `--multiplier` times the pool
+size (`DB_POOL_SIZE` of `.env.db`, or `--pool-size` for a remote server) as
+concurrent requests, far more than the pool can serve at once. Meanwhile the
+pool metrics of /metrics are sampled every `--sample-interval` seconds.
+
+Besides the latency table of `bench_load` the script prints the checkout wait
+(mean and p95/p99 estimated from the histogram buckets), the checkout timeouts
+and the peak saturation and number of waiting checkouts. It exits with status 1
+when a checkout timed out, meaning the pool (size, overflow, timeout) is too
+small for the offered load, or when more than `--max-error-rate` of the requests
+failed (a few do fail by design: the workload reads and updates products that
+concurrent requests delete).
+
+With several uvicorn workers /metrics answers from one worker at a time, so the
+pool figures describe a single process.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import re
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+from benchmarks.bench_load import (
+    asgi_client,
+    http_client,
+    print_report,
+    run_load,
+    uvicorn_client,
+)
+from src.config.db_setting import get_setting
+
+WAIT_HISTOGRAM = "db_pool_checkout_wait_seconds"
+_SAMPLE = re.compile(r'^(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(?P<labels>[^}]*)\})? (?P<value>\S+)$')
+_LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def parse_metrics(text: str) -> dict[tuple[str, tuple[tuple[str, str], ...]], float]:
+    """Samples of a Prometheus text exposition, keyed by (name, labels)."""
+    samples = {}
+    for line in text.splitlines():
+        match = _SAMPLE.match(line)
+        if match:
+            labels = tuple(_LABEL.findall(match["labels"] or ""))
+            samples[match["name"], labels] = float(match["value"])
+    return samples
+
+
+async def scrape(client: httpx.AsyncClient) -> dict:
+    response = await client.get("/metrics")
+    response.raise_for_status()
+    return parse_metrics(response.text)
+
+
+def _value(samples: dict, name: str, labels: tuple = ()) -> float:
+    return samples.get((name, labels), 0.0)
+
+
+def _wait_buckets(before: dict, after: dict) -> list[tuple[float, float]]:
+    """Cumulative (upper bound, count) of the checkouts made between the two scrapes."""
+    buckets = []
+    for (name, labels), count in after.items():
+        if name == f"{WAIT_HISTOGRAM}_bucket":
+            bound = dict(labels)["le"]
+            buckets.append((math.inf if bound == "+Inf" else float(bound), count - before.get((name, labels), 0.0)))
+    return sorted(buckets)
+
+
+def bucket_quantile(buckets: list[tuple[float, float]], q: float) -> float:
+    """Estimate the q-quantile from cumulative buckets, interpolating inside a bucket as Prometheus does."""
+    if not buckets or buckets[-1][1] == 0:
+        return 0.0
+    rank = q * buckets[-1][1]
+    lower_bound, lower_count = 0.0, 0.0
+    for bound, count in buckets:
+        if count >= rank:
+            if math.isinf(bound):
+                return lower_bound
+            return lower_bound + (bound - lower_bound) * (rank - lower_count) / max(count - lower_count, 1e-12)
+        lower_bound, lower_count = bound, count
+    return lower_bound
+
+
+async def _sample_pool(client: httpx.AsyncClient, interval: float, stop: asyncio.Event, peaks: dict):
+    while not stop.is_set():
+        try:
+            samples = await scrape(client)
+        except httpx.HTTPError:
+            samples = {}
+        peaks["saturation"] = max(peaks["saturation"], _value(samples, "db_pool_saturation"))
+        peaks["waiting"] = max(peaks["waiting"], _value(samples, "db_pool_waiting_checkouts"))
+        peaks["checked_out"] = max(
+            peaks["checked_out"], _value(samples, "db_pool_connections", (("state", "checked_out"),))
+        )
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+
+
+async def run_soak(client: httpx.AsyncClient, args) -> dict:
+    # Measured from the end of the catalog setup, whose bursts of inserts are not the soak
+    before: dict = {}
+    stop = asyncio.Event()
+    peaks = {"saturation": 0.0, "waiting": 0.0, "checked_out": 0.0}
+    sampler: asyncio.Task | None = None
+
+    async def start_sampling():
+        nonlocal sampler
+        before.update(await scrape(client))
+        sampler = asyncio.create_task(_sample_pool(client, args.sample_interval, stop, peaks))
+
+    try:
+        results = await run_load(client, args, on_setup=start_sampling)
+    finally:
+        stop.set()
+        if sampler is not None:
+            await sampler
+    after = await scrape(client)
+
+    buckets = _wait_buckets(before, after)
+    checkouts = buckets[-1][1] if buckets else 0
+    wait_sum = _value(after, f"{WAIT_HISTOGRAM}_sum") - _value(before, f"{WAIT_HISTOGRAM}_sum")
+    results["pool"] = {
+        "pool_size": args.pool_size,
+        "concurrency": args.concurrency,
+        "checkouts": int(checkouts),
+        "timeouts": int(
+            _value(after, "db_pool_checkout_timeouts_total") - _value(before, "db_pool_checkout_timeouts_total")
+        ),
+        "wait_mean_ms": round(wait_sum / checkouts * 1000, 3) if checkouts else 0.0,
+        "wait_p95_ms": round(bucket_quantile(buckets, 0.95) * 1000, 3),
+        "wait_p99_ms": round(bucket_quantile(buckets, 0.99) * 1000, 3),
+        "peak_saturation": round(peaks["saturation"], 3),
+        "peak_waiting": int(peaks["waiting"]),
+        "peak_checked_out": int(peaks["checked_out"]),
+    }
+    return results
+
+
+def print_pool_report(pool: dict):
+    print(f"\npool size {pool['pool_size']}, {pool['concurrency']} concurrent requests")
+    for key in ("checkouts", "timeouts", "wait_mean_ms", "wait_p95_ms", "wait_p99_ms",
+                "peak_saturation", "peak_waiting", "peak_checked_out"):
+        print(f"{key:<24} {pool[key]:>12}")
+
+
+async def _run(args) -> dict:
+    if args.base_url:
+        client = http_client(args, args.base_url)
+    elif args.target == "uvicorn":
+        client = uvicorn_client(args)
+    else:
+        client = asgi_client(args)
+    async with client as connected:
+        return await run_soak(connected, args)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", choices=["asgi", "uvicorn"], default="asgi")
+    parser.add_argument("--base-url", help="Soak an already running server instead of starting one")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--pool-size", type=int, help="Pool size of the server (default: DB_POOL_SIZE)")
+    parser.add_argument("--multiplier", type=int, default=10, help="Concurrent requests per pooled connection")
+    parser.add_argument("--duration", type=float, default=120.0, help="Seconds of load")
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    parser.add_argument("--sample-interval", type=float, default=0.5, help="Seconds between two /metrics scrapes")
+    parser.add_argument("--setup-categories", type=int, default=3)
+    parser.add_argument("--setup-products", type=int, default=200)
+    parser.add_argument("--keep-data", action="store_true")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--save", type=Path, help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    args.pool_size = args.pool_size or get_setting().DB_POOL_SIZE
+    args.concurrency = args.pool_size * args.multiplier
+    # run_load options the soak does not expose
+    args.requests = 0
+    args.include_chatbot = False
+
+    start = time.perf_counter()
+    results = asyncio.run(_run(args))
+    print_report(results)
+    print_pool_report(results["pool"])
+    print(f"\nSoak completed in {time.perf_counter() - start:.1f}s")
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2))
+        print(f"Results saved to {args.save}")
+
+    timeouts, overall = results["pool"]["timeouts"], results["overall"]
+    error_rate = overall["errors"] / overall["count"] if overall["count"] else 0.0
+    if timeouts or error_rate > args.max_error_rate:
+        print(f"FAIL: {timeouts} checkout timeouts, {error_rate:.1%} failed requests")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
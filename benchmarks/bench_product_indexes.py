@@ -0,0 +1,185 @@
+"""
+Write/read benchmark of the Products indexes, to compare schema revisions.
+
+Usage (against the database configured in `.env.db`):
+
+    uv run alembic upgrade 0005
+    uv run python -m benchmarks.bench_product_indexes --seed --save before.json
+    uv run alembic upgrade 0006
+    uv run python -m benchmarks.bench_product_indexes --compare before.json
+
+`--seed` tops the `Products` table up to `--rows` rows, linked to
+`--categories` categories. Each run measures the bulk insert and bulk delete
+of `--write-rows` products, the median latency of the `get_filtered_products`
+query shapes in QUERIES and, on Postgres, the size of every index.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import func, insert, select, text
+
+from src.cache.cache_factory import catalog_changed
+from src.database.database_instance.db_instance import db_session
+from src.entities.category.category_entity import Category
+from src.entities.category.category_registry import category_registry
+from src.entities.counter.counter_crud import (
+    bump_catalog_version,
+    bump_categories_version,
+)
+from src.entities.product.product_crud import (
+    bulk_delete_products,
+    create_products_bulk,
+    get_filtered_products,
+)
+from src.entities.product.product_entity import Product
+from src.models.request_models import (
+    BulkDeleteProductsRequest,
+    CreateProductRequest,
+    GetFilteredProductsRequest,
+)
+
+SEED_CHUNK = 10_000
+TAGS = ["new", "sale", "eco", "premium", "gift"]
+
+QUERIES = {
+    "price range": {"min_max_price_filter": (100, 200)},
+    "price range, price sort": {"min_max_price_filter": (100, 200), "sort_by": ("price", "desc")},
+    "category + price": {"category_filter": ["Bench category 3"], "min_max_price_filter": (100, 900)},
+    "category, date sort": {"category_filter": ["Bench category 1"], "sort_by": ("date", "desc")},
+    "date sort, deep page": {"sort_by": ("date", "asc"), "page": 500},
+    "tags any": {"tags_any": ["gift"]},
+}
+
+
+def _products(count: int, offset: int) -> list[CreateProductRequest]:
+    return [
+        CreateProductRequest(
+            name=f"Bench product {offset + i}",
+            price=(offset + i) * 7 % 2_000,
+            categories_name=None,
+            tags=[TAGS[(offset + i) % len(TAGS)]],
+            description="Synthetic product used by the index benchmark",
+        )
+        for i in range(count)
+    ]
+
+
+def seed_catalog(rows: int, categories: int) -> None:
+    names = [f"Bench category {i}" for i in range(categories)]
+    existing_names = set(db_session.scalars(select(Category.name).where(Category.name.in_(names))))
+    missing = [{"name": name} for name in names if name not in existing_names]
+    if missing:
+        db_session.execute(insert(Category), missing)
+        bump_catalog_version()
+        bump_categories_version()
+        db_session.commit()
+        catalog_changed()
+        category_registry.invalidate()
+    ids_by_name = dict(
+        db_session.execute(select(Category.name, Category.id).where(Category.name.in_(names))).all()
+    )
+    category_ids = [ids_by_name[name] for name in names]
+
+    existing = db_session.scalar(select(func.count(Product.id)))
+    while existing < rows:
+        chunk = min(SEED_CHUNK, rows - existing)
+        # Skewed membership: every product is in the first category, fewer and fewer in the next ones
+        links = [
+            [category_ids[c] for c in range(len(category_ids)) if (existing + i) % (c * 10 + 1) == 0]
+            for i in range(chunk)
+        ]
+        create_products_bulk(_products(chunk, existing), links)
+        existing += chunk
+        print(f"seeded {existing}/{rows}", file=sys.stderr)
+
+
+def _measure_writes(rows: int) -> dict:
+    start = time.perf_counter()
+    product_ids = create_products_bulk(_products(rows, 0), [[] for _ in range(rows)])
+    insert_ms = (time.perf_counter() - start) * 1000.0
+
+    start = time.perf_counter()
+    bulk_delete_products(BulkDeleteProductsRequest(ids=product_ids))
+    delete_ms = (time.perf_counter() - start) * 1000.0
+    return {"bulk insert": insert_ms, "bulk delete": delete_ms}
+
+
+def _measure_reads(repeat: int) -> dict:
+    timings = {}
+    for label, params in QUERIES.items():
+        product_filter = GetFilteredProductsRequest(
+            **{"text_filter": None, "category_filter": None, "min_max_price_filter": None, "sort_by": None}
+            | params
+        )
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            get_filtered_products(product_filter)
+            samples.append((time.perf_counter() - start) * 1000.0)
+        timings[label] = statistics.median(samples)
+    return timings
+
+
+def _index_sizes() -> dict:
+    if db_session.get_bind().dialect.name != "postgresql":
+        return {}
+    rows = db_session.execute(
+        text(
+            "SELECT indexrelname, pg_relation_size(indexrelid) FROM pg_stat_user_indexes "
+            "WHERE relname IN ('Products', 'ProductCategories') ORDER BY indexrelname"
+        )
+    ).all()
+    return {name: size / 1024 / 1024 for name, size in rows}
+
+
+def _print(title: str, unit: str, current: dict, baseline: dict):
+    print(f"\n{title:<28} | {'now ' + unit:>12} | {'before':>12} | {'change':>8}")
+    for label in sorted(current.keys() | baseline.keys()):
+        now, before = current.get(label), baseline.get(label)
+        change = f"{(now - before) / before * 100:+.0f}%" if now is not None and before else ""
+        print(
+            f"{label:<28} | {'' if now is None else f'{now:.2f}':>12} | "
+            f"{'' if before is None else f'{before:.2f}':>12} | {change:>8}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--categories", type=int, default=10)
+    parser.add_argument("--write-rows", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", action="store_true")
+    parser.add_argument("--save", type=Path)
+    parser.add_argument("--compare", type=Path)
+    args = parser.parse_args()
+
+    if args.seed:
+        seed_catalog(args.rows, args.categories)
+    if db_session.get_bind().dialect.name == "postgresql":
+        db_session.execute(text('ANALYZE "Products", "ProductCategories"'))
+        db_session.commit()
+
+    results = {
+        "writes": _measure_writes(args.write_rows),
+        "reads": _measure_reads(args.repeat),
+        "index_sizes": _index_sizes(),
+    }
+    baseline = json.loads(args.compare.read_text()) if args.compare else {}
+
+    _print("writes", "ms", results["writes"], baseline.get("writes", {}))
+    _print("reads (median)", "ms", results["reads"], baseline.get("reads", {}))
+    _print("index sizes", "MB", results["index_sizes"], baseline.get("index_sizes", {}))
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Benchmark of the streaming catalog export against materializing the whole catalog.
+
+Usage (against the database configured in `.env.db`):
+
+    uv run python -m benchmarks.bench_products_export --seed --rows 200000
+
+`--seed` tops the `Products` table up to `--rows` rows before measuring.
+For each scenario the script reports throughput and the peak Python memory
+traced while the catalog is read. The streaming export keeps one chunk in memory,
+so its peak should not grow with `--rows`; the script exits with status 1 when
+it exceeds `--max-peak-mb`.
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+from sqlalchemy import func, select
+
+from benchmarks.bench_products_pagination import seed_products
+from src.cache.result_cache import serialize
+from src.core.product_export_service import DEFAULT_CHUNK_SIZE, export_products_service
+from src.database.database_instance.db_instance import db_session
+from src.entities.product.product_entity import Product
+from src.entities.product.product_query import fetch_products, select_products
+
+
+def _measure(label: str, rows: int, consume) -> float:
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = consume()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    peak_mb = peak / 1024 / 1024
+    print(
+        f"{label:<16} {size / 1024 / 1024:>9.1f} MB {rows / elapsed:>12.0f} rows/s"
+        f"  peak {peak_mb:>8.1f} MB"
+    )
+    return peak_mb
+
+
+def _stream(chunk_size: int, compress: bool):
+    def consume() -> int:
+        return sum(
+            len(chunk)
+            for chunk in export_products_service(chunk_size=chunk_size, compress=compress)
+        )
+
+    return consume
+
+
+def _materialize() -> int:
+    products = fetch_products(select_products())
+    size = sum(len(serialize(product)) + 1 for product in products)
+    db_session.remove()
+    return size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--seed", action="store_true")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--max-peak-mb", type=float, default=64.0)
+    args = parser.parse_args()
+
+    if args.seed:
+        seed_products(args.rows)
+
+    rows = db_session.scalar(select(func.count(Product.id)))
+    print(f"{rows} products, chunk size {args.chunk_size}")
+
+    stream_peak = _measure("stream ndjson", rows, _stream(args.chunk_size, compress=False))
+    _measure("stream gzip", rows, _stream(args.chunk_size, compress=True))
+    _measure("materialize", rows, _materialize)
+
+    if stream_peak > args.max_peak_mb:
+        print(f"FAIL: streaming peak {stream_peak:.1f} MB > {args.max_peak_mb} MB")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Benchmark of `get_products_list` on deep pages: OFFSET pagination vs keyset cursor.
+
+Usage (against the database configured in `.env.db`):
+
+    uv run python -m benchmarks.bench_products_pagination --seed
+
+`--seed` tops the `Products` table up to `--rows` rows before measuring.
+The script exits with status 1 when the keyset latency on the deepest page is more
+than `--max-ratio` times the latency on page 1.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import UTC, datetime
+
+from sqlalchemy import func, insert, select
+
+from src.cache.cache_factory import catalog_changed
+from src.database.database_instance.db_instance import db_session
+from src.entities.counter.counter_crud import (
+    PRODUCTS_COUNTER,
+    add_to_counter,
+    bump_catalog_version,
+)
+from src.entities.product.product_crud import _encode_cursor, get_products_list
+from src.entities.product.product_entity import Product
+
+PAGES = (1, 10, 100, 1_000, 10_000)
+SEED_CHUNK = 10_000
+
+
+def seed_products(rows: int) -> None:
+    existing = db_session.scalar(select(func.count(Product.id)))
+    missing = rows - existing
+    created_at = datetime.now(UTC)
+    while missing > 0:
+        chunk = min(SEED_CHUNK, missing)
+        db_session.execute(
+            insert(Product),
+            [
+                {
+                    "name": f"Bench product {existing + i}",
+                    "price": (existing + i) % 2_000,
+                    "tags": ["bench"],
+                    "created_at": created_at,
+                    "description": "Synthetic product used by the pagination benchmark",
+                }
+                for i in range(chunk)
+            ],
+        )
+        # Same bookkeeping as the crud write paths: the product counter and the
+        # catalog version move in the transaction of the rows
+        add_to_counter(PRODUCTS_COUNTER, chunk)
+        bump_catalog_version()
+        db_session.commit()
+        catalog_changed()
+        existing += chunk
+        missing -= chunk
+        print(f"seeded {existing}/{rows}", file=sys.stderr)
+
+
+def _cursor_for_page(page: int, page_size: int) -> str | None:
+    if page == 1:
+        return None
+    last_id = db_session.scalar(
+        select(Product.id)
+        .order_by(Product.id.asc())
+        .offset((page - 1) * page_size - 1)
+        .limit(1)
+    )
+    return _encode_cursor(last_id)
+
+
+def _measure(repeat: int, **kwargs) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        get_products_list(**kwargs)
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--max-ratio", type=float, default=3.0)
+    parser.add_argument("--seed", action="store_true")
+    args = parser.parse_args()
+
+    if args.seed:
+        seed_products(args.rows)
+
+    print(f"{'page':>8} | {'offset ms':>10} | {'keyset ms':>10}")
+    keyset_timings = {}
+    for page in PAGES:
+        cursor = _cursor_for_page(page, args.page_size)
+        offset_ms = _measure(args.repeat, page=page, page_size=args.page_size)
+        keyset_ms = _measure(
+            args.repeat, page=page, page_size=args.page_size, cursor=cursor
+        )
+        keyset_timings[page] = keyset_ms
+        print(f"{page:>8} | {offset_ms:>10.2f} | {keyset_ms:>10.2f}")
+
+    ratio = keyset_timings[PAGES[-1]] / keyset_timings[PAGES[0]]
+    print(f"keyset page {PAGES[-1]} / page {PAGES[0]} ratio: {ratio:.2f}")
+    return 0 if ratio <= args.max_ratio else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+import hashlib
+
+from fastapi import Request, Response, status
+
+from src.cache.cache_factory import catalog_version
+from src.cache.result_cache import make_cache_key
+from src.config.cache_setting import get_cache_setting
+
+
+def catalog_etag(namespace: str, params: dict | None = None) -> str:
+    """
+    Strong ETag of a catalog read, derived from the catalog version.
+
+    The version is a primary key lookup in the database, bumped by every
+    product/category write of any process (workers, CLIs, scripts), so any
+    write changes every ETag.
+    """
+    key = make_cache_key(namespace, params or {})
+    digest = hashlib.sha256(f"{catalog_version()}:{key}".encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """
+    Return a 304 response when the client's `If-None-Match` matches `etag`.
+
+    The catalog POST reads (e.g. get_filtered_products) are safe queries, so they
+    are revalidated like GETs.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    if "*" in candidates or etag in candidates:
+        response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+        set_cache_headers(response, etag)
+        return response
+    return None
+
+
+def set_cache_headers(response: Response, etag: str):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = get_cache_setting().http_cache_control
@@ -0,0 +1,123 @@
+import hmac
+import os
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+
+from src.core.memory_service import (
+    GroupBy,
+    get_memory_diff_service,
+    get_memory_status_service,
+    get_object_counts_service,
+    start_memory_tracing_service,
+    stop_memory_tracing_service,
+    take_memory_snapshot_service,
+)
+from src.models.response_models import HTTPResponse
+from src.observability.profiling import ProfilingRoute
+
+
+def require_admin_token(x_admin_token: str | None = Header(default=None)):
+    """The admin endpoints need the ADMIN_TOKEN env var in X-Admin-Token, and do not exist without it."""
+    expected = os.getenv("ADMIN_TOKEN")
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token.encode(), expected.encode()):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token")
+
+
+admin_router = APIRouter(
+    prefix="/v1/admin",
+    tags=["Admin"],
+    route_class=ProfilingRoute,
+    dependencies=[Depends(require_admin_token)],
+)
+
+
+@admin_router.post("/memory/start/",
+                   status_code=status.HTTP_200_OK,
+                   description="Start tracemalloc, keeping `frames` frames per allocation traceback")
+def start_memory_tracing(frames: int = 1) -> HTTPResponse:
+    try:
+        result = start_memory_tracing_service(frames)
+        return HTTPResponse(
+            status=status.HTTP_200_OK,
+            message=result.get("message"),
+            data=result.get("data")
+        )
+    except ValueError as e:
+        return HTTPResponse(
+            status=status.HTTP_400_BAD_REQUEST,
+            message=str(e)
+        )
+
+@admin_router.post("/memory/stop/",
+                   status_code=status.HTTP_200_OK,
+                   description="Stop tracemalloc and drop the saved snapshots")
+def stop_memory_tracing() -> HTTPResponse:
+    result = stop_memory_tracing_service()
+    return HTTPResponse(
+        status=status.HTTP_200_OK,
+        message=result.get("message"),
+        data=result.get("data")
+    )
+
+@admin_router.get("/memory/status/",
+                  status_code=status.HTTP_200_OK,
+                  description="Tracing state, traced memory, saved snapshots and process RSS")
+def get_memory_status() -> HTTPResponse:
+    result = get_memory_status_service()
+    return HTTPResponse(
+        status=status.HTTP_200_OK,
+        message=result.get("message"),
+        data=result.get("data")
+    )
+
+@admin_router.post("/memory/snapshot/",
+                   status_code=status.HTTP_200_OK,
+                   description="Take a tracemalloc snapshot and keep it under `name`")
+def take_memory_snapshot(name: str) -> HTTPResponse:
+    try:
+        result = take_memory_snapshot_service(name)
+        return HTTPResponse(
+            status=status.HTTP_200_OK,
+            message=result.get("message"),
+            data=result.get("data")
+        )
+    except ValueError as e:
+        return HTTPResponse(
+            status=status.HTTP_400_BAD_REQUEST,
+            message=str(e)
+        )
+
+@admin_router.get("/memory/diff/",
+                  status_code=status.HTTP_200_OK,
+                  description="Top allocation differences from snapshot `base` to snapshot `target` "
+                              "(or to the current memory when `target` is omitted), by file or line")
+def get_memory_diff(base: str,
+                    target: str | None = None,
+                    top: int = 20,
+                    group_by: GroupBy = "lineno") -> HTTPResponse:
+    try:
+        result = get_memory_diff_service(base, target, top, group_by)
+        return HTTPResponse(
+            status=status.HTTP_200_OK,
+            message=result.get("message"),
+            data=result.get("data")
+        )
+    except ValueError as e:
+        return HTTPResponse(
+            status=status.HTTP_400_BAD_REQUEST,
+            message=str(e)
+        )
+
+@admin_router.get("/memory/objects/",
+                  status_code=status.HTTP_200_OK,
+                  description="Live Product, Category and BaseMessage instances, session identity maps "
+                              "and queued log records")
+def get_object_counts() -> HTTPResponse:
+    result = get_object_counts_service()
+    return HTTPResponse(
+        status=status.HTTP_200_OK,
+        message=result.get("message"),
+        data=result.get("data")
+    )
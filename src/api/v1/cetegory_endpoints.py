@@ -1,16 +1,22 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, Request, Response, status
 
+from src.api.http_cache import catalog_etag, not_modified, set_cache_headers
 from src.core.category_service import (
     create_category_service,
     delete_category_service,
     get_categories_list_service,
+    get_category_registry_stats_service,
 )
+from src.database.database_instance.db_instance import request_session
 from src.models.request_models import CreateCategoryRequest, DeleteCategoryRequest
 from src.models.response_models import HTTPResponse
+from src.observability.profiling import ProfilingRoute
 
 category_router = APIRouter(
     prefix="/v1/category",
-    tags=["Category"]
+    tags=["Category"],
+    route_class=ProfilingRoute,
+    dependencies=[Depends(request_session)],
 )
 
 
@@ -34,9 +40,13 @@ def create_category(category: CreateCategoryRequest) -> HTTPResponse:
 @category_router.get("/get_categories_list/",
                      status_code=status.HTTP_200_OK,
                      description="Get a list of all categories")
-def get_categories_list() -> HTTPResponse:
+def get_categories_list(request: Request, response: Response) -> HTTPResponse:
+    etag = catalog_etag("categories_list")
+    if cached := not_modified(request, etag):
+        return cached
     try:
         result = get_categories_list_service()
+        set_cache_headers(response, etag)
         return HTTPResponse(
             status=status.HTTP_200_OK,
             message=result.get("message"),
@@ -63,3 +73,15 @@ def delete_category(category_id: DeleteCategoryRequest):
             status=status.HTTP_400_BAD_REQUEST,
             message=str(e)
         )
+
+
+@category_router.get("/get_registry_stats/",
+                     status_code=status.HTTP_200_OK,
+                     description="Get hit/miss counters of the category name registry")
+def get_registry_stats() -> HTTPResponse:
+    result = get_category_registry_stats_service()
+    return HTTPResponse(
+        status=status.HTTP_200_OK,
+        message=result.get("message"),
+        data=result.get("data")
+    )
@@ -1,12 +1,16 @@
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from src.core.chatbot_service import ChatbotService
+from src.database.database_instance.db_instance import request_session
 from src.models.request_models import ChatRequest
+from src.observability.profiling import ProfilingRoute
 from loguru import logger
 chatbot_router = APIRouter(
     prefix="/v1/chatbot",
-    tags=["Chatbot"]
+    tags=["Chatbot"],
+    route_class=ProfilingRoute,
+    dependencies=[Depends(request_session)],
 )
 
 chatbot_service = ChatbotService()
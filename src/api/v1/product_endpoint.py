@@ -1,15 +1,34 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
+from src.api.http_cache import catalog_etag, not_modified, set_cache_headers
+from src.core.product_export_service import DEFAULT_CHUNK_SIZE, export_products_service
+from src.core.product_import_service import (
+    DEFAULT_BATCH_SIZE,
+    ImportFormat,
+    get_import_job,
+    register_import_job,
+    run_import_job,
+    spool_upload,
+)
 from src.core.product_service import (
+    bulk_delete_products_service,
+    bulk_update_products_service,
     create_product_service,
     delete_product_service,
+    get_cache_stats_service,
     get_filtered_products_service,
     get_number_of_product_service,
     get_product_service,
     get_products_list_service,
+    get_tag_cloud_service,
     update_product_service,
 )
+from src.database.database_instance.db_instance import request_session
 from src.models.request_models import (
+    BulkDeleteProductsRequest,
+    BulkUpdateProductsRequest,
     CreateProductRequest,
     DeleteProductRequest,
     GetFilteredProductsRequest,
@@ -17,10 +36,13 @@ from src.models.request_models import (
     UpdateProductRequest,
 )
 from src.models.response_models import HTTPResponse
+from src.observability.profiling import ProfilingRoute
 
 product_router = APIRouter(
     prefix="/v1/product",
     tags=["Product"],
+    route_class=ProfilingRoute,
+    dependencies=[Depends(request_session)],
 )
 
 
@@ -74,12 +96,50 @@ def delete_product(product: DeleteProductRequest):
             message=str(e)
         )
 
+@product_router.put("/bulk_update_products/",
+                    status_code=status.HTTP_200_OK,
+                    description="Update all the products selected by ids, by filter or with all=true in one transaction")
+def bulk_update_products(request: BulkUpdateProductsRequest) -> HTTPResponse:
+    try:
+        result = bulk_update_products_service(request)
+        return HTTPResponse(
+            status=status.HTTP_200_OK,
+            message=result.get("message"),
+            data=result.get("data")
+        )
+    except ValueError as e:
+        return HTTPResponse(
+            status=status.HTTP_400_BAD_REQUEST,
+            message=str(e)
+        )
+
+@product_router.delete("/bulk_delete_products/",
+                       status_code=status.HTTP_200_OK,
+                       description="Delete all the products selected by ids, by filter or with all=true in one transaction")
+def bulk_delete_products(request: BulkDeleteProductsRequest) -> HTTPResponse:
+    try:
+        result = bulk_delete_products_service(request)
+        return HTTPResponse(
+            status=status.HTTP_200_OK,
+            message=result.get("message"),
+            data=result.get("data")
+        )
+    except ValueError as e:
+        return HTTPResponse(
+            status=status.HTTP_400_BAD_REQUEST,
+            message=str(e)
+        )
+
 @product_router.get("/get_product_by_id/",
                     status_code=status.HTTP_200_OK,
                     description="Get a product by id")
-def get_product(product: GetProductRequest):
+def get_product(product: GetProductRequest, request: Request, response: Response):
+    etag = catalog_etag("product", product.model_dump())
+    if cached := not_modified(request, etag):
+        return cached
     try:
         result = get_product_service(product)
+        set_cache_headers(response, etag)
         return HTTPResponse(
             status=status.HTTP_200_OK,
             message=result.get("message"),
@@ -93,10 +153,19 @@ def get_product(product: GetProductRequest):
 
 @product_router.get("/get_products_list/",
                     status_code=status.HTTP_200_OK,
-                    description="Get a list of all products")
-def get_products_list(page: int = 1, page_size: int = 5) -> HTTPResponse:
+                    description="Get a page of products. Pass the returned "
+                                "`next_cursor` as `cursor` to fetch the following page")
+def get_products_list(request: Request,
+                      response: Response,
+                      page: int = 1,
+                      page_size: int = 5,
+                      cursor: str | None = None) -> HTTPResponse:
+    etag = catalog_etag("products_list", {"page": page, "page_size": page_size, "cursor": cursor})
+    if cached := not_modified(request, etag):
+        return cached
     try:
-        result = get_products_list_service(page=page, page_size=page_size)
+        result = get_products_list_service(page=page, page_size=page_size, cursor=cursor)
+        set_cache_headers(response, etag)
         return HTTPResponse(
             status=status.HTTP_200_OK,
             message=result.get("message"),
@@ -111,9 +180,36 @@ def get_products_list(page: int = 1, page_size: int = 5) -> HTTPResponse:
 @product_router.post("/get_filtered_products/",
                     status_code=status.HTTP_200_OK,
                     description="Get filtered products")
-def get_filtered_products(product_filter: GetFilteredProductsRequest) -> HTTPResponse:
+def get_filtered_products(product_filter: GetFilteredProductsRequest,
+                          request: Request,
+                          response: Response) -> HTTPResponse:
+    etag = catalog_etag("filtered_products", product_filter.model_dump())
+    if cached := not_modified(request, etag):
+        return cached
     try:
         result = get_filtered_products_service(product_filter)
+        set_cache_headers(response, etag)
+        return HTTPResponse(
+            status=status.HTTP_200_OK,
+            message=result.get("message"),
+            data=result.get("data", None)
+        )
+    except ValueError as e:
+        return HTTPResponse(
+            status=status.HTTP_400_BAD_REQUEST,
+            message=str(e)
+        )
+
+@product_router.get("/get_tag_cloud/",
+                    status_code=status.HTTP_200_OK,
+                    description="Get the most used tags with their number of products")
+def get_tag_cloud(request: Request, response: Response, limit: int = 50) -> HTTPResponse:
+    etag = catalog_etag("tag_cloud", {"limit": limit})
+    if cached := not_modified(request, etag):
+        return cached
+    try:
+        result = get_tag_cloud_service(limit=limit)
+        set_cache_headers(response, etag)
         return HTTPResponse(
             status=status.HTTP_200_OK,
             message=result.get("message"),
@@ -159,3 +255,75 @@ def get_number_of_products() -> HTTPResponse:
             message=str(e)
         )
 
+
+@product_router.get("/export_products/",
+                    status_code=status.HTTP_200_OK,
+                    response_model=None,
+                    description="Stream the whole catalog as NDJSON, one product per line. "
+                                "With `compress=true` the stream is gzip-encoded")
+def export_products(chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    compress: bool = False) -> StreamingResponse | HTTPResponse:
+    try:
+        stream = export_products_service(chunk_size=chunk_size, compress=compress)
+    except ValueError as e:
+        return HTTPResponse(
+            status=status.HTTP_400_BAD_REQUEST,
+            message=str(e)
+        )
+
+    filename = "products.ndjson.gz" if compress else "products.ndjson"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(stream, media_type="application/x-ndjson", headers=headers)
+
+
+@product_router.post("/import_products/",
+                     status_code=status.HTTP_202_ACCEPTED,
+                     description="Bulk import products from a CSV or NDJSON request body. "
+                                 "The import runs in background: poll /import_status/ with the returned job_id")
+async def import_products(request: Request,
+                          background_tasks: BackgroundTasks,
+                          file_format: ImportFormat = "ndjson",
+                          batch_size: int = DEFAULT_BATCH_SIZE) -> HTTPResponse:
+    if batch_size < 1:
+        return HTTPResponse(
+            status=status.HTTP_400_BAD_REQUEST,
+            message="Batch size must be greater than 0"
+        )
+    # Registered once the body is on disk: a failed upload leaves no pending job behind
+    path = await spool_upload(request.stream(), file_format)
+    job = await run_in_threadpool(register_import_job, file_format)
+    background_tasks.add_task(run_import_job, path, job, batch_size)
+    return HTTPResponse(
+        status=status.HTTP_202_ACCEPTED,
+        message="Products import started",
+        data=job.to_dict()
+    )
+
+@product_router.get("/import_status/",
+                    status_code=status.HTTP_200_OK,
+                    description="Get progress, throughput and per-row errors of a products import")
+def import_status(job_id: str) -> HTTPResponse:
+    job = get_import_job(job_id)
+    if job is None:
+        return HTTPResponse(
+            status=status.HTTP_404_NOT_FOUND,
+            message="Import job not found"
+        )
+    return HTTPResponse(
+        status=status.HTTP_200_OK,
+        message="Import job status retrieved successfully",
+        data=job.to_dict()
+    )
+
+@product_router.get("/get_cache_stats/",
+                    status_code=status.HTTP_200_OK,
+                    description="Get hit rate, evictions and memory use of the catalog result cache")
+def get_cache_stats() -> HTTPResponse:
+    result = get_cache_stats_service()
+    return HTTPResponse(
+        status=status.HTTP_200_OK,
+        message=result.get("message"),
+        data=result.get("data")
+    )
@@ -0,0 +1,62 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.cache.result_cache import MemoryResultCache, ResultCache
+from src.cache.sqlite_result_cache import SqliteResultCache
+from src.config.cache_setting import get_cache_setting
+from src.database.database_instance.db_instance import db_session
+from src.entities.counter.counter_crud import get_catalog_version
+
+# Key of the catalog version read by the current transaction in Session.info
+_CATALOG_VERSION_INFO = "catalog_version"
+
+
+class ResultCacheFactory:
+    _instance = None
+
+    @classmethod
+    def get_cache(cls) -> ResultCache:
+        if cls._instance is None:
+            setting = get_cache_setting()
+            bounds = {
+                "max_entries": setting.max_entries,
+                "max_memory_bytes": setting.max_memory_bytes,
+                "ttl_seconds": setting.ttl_seconds,
+            }
+            if setting.backend == "sqlite":
+                cls._instance = SqliteResultCache(setting.sqlite_path, **bounds)
+            else:
+                cls._instance = MemoryResultCache(**bounds)
+        return cls._instance
+
+
+def catalog_version() -> int:
+    """
+    Current catalog version, read from the database once per transaction.
+
+    Writes bump it in their own transaction (`bump_catalog_version`), whichever
+    process or script made them, so it is the reference of every cache. The
+    result cache is brought to it, dropping the entries of other versions.
+
+    A request opens one session, so the ETag and the result cache of a read
+    share a single primary key lookup; a commit or rollback forgets the version
+    and the next call reads it again.
+    """
+    session = db_session()
+    version = session.info.get(_CATALOG_VERSION_INFO)
+    if version is None:
+        version = get_catalog_version()
+        session.info[_CATALOG_VERSION_INFO] = version
+        ResultCacheFactory.get_cache().sync_version(version)
+    return version
+
+
+@event.listens_for(db_session, "after_commit")
+@event.listens_for(db_session, "after_rollback")
+def _forget_catalog_version(session: Session):
+    session.info.pop(_CATALOG_VERSION_INFO, None)
+
+
+def catalog_changed():
+    """Drop the cached catalog results now. Call after any committed product/category write."""
+    catalog_version()
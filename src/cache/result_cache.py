@@ -0,0 +1,165 @@
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Any
+
+
+def make_cache_key(namespace: str, params: dict) -> str:
+    """Build a deterministic key from a namespace and JSON-serializable parameters."""
+    return f"{namespace}:{json.dumps(params, sort_keys=True, separators=(',', ':'), default=str)}"
+
+
+def serialize(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+def deserialize(payload: bytes) -> Any:
+    return json.loads(payload)
+
+
+def _json_default(value):
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ResultCache(ABC):
+    """
+    Versioned result cache.
+
+    Every entry is stored with the catalog version it was computed at. The
+    version comes from the database (`catalog_version`): when it moves the cache
+    follows it and entries computed at another version are never served again,
+    even if they have not been evicted yet.
+    Values are stored serialized: callers always get a fresh copy.
+    """
+
+    def __init__(self, max_entries: int, max_memory_bytes: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.ttl_seconds = ttl_seconds
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @abstractmethod
+    def get_version(self) -> int:
+        """Catalog version the cache was last synced to."""
+
+    @abstractmethod
+    def sync_version(self, version: int):
+        """Move the cache to `version`, dropping the entries of any other version."""
+
+    @abstractmethod
+    def _get(self, key: str, version: int) -> bytes | None:
+        """Return the payload of a live entry computed at `version`, or None."""
+
+    @abstractmethod
+    def _set(self, key: str, version: int, payload: bytes):
+        """Store a payload and evict entries until the bounds are respected."""
+
+    @abstractmethod
+    def _usage(self) -> tuple[int, int]:
+        """Return (entries, bytes) currently stored."""
+
+    def get(self, key: str, version: int) -> Any | None:
+        payload = self._get(key, version)
+        with self._stats_lock:
+            if payload is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return deserialize(payload)
+
+    def set(self, key: str, version: int, value: Any):
+        """Store `value` as computed at `version` (read it with catalog_version() *before* computing)."""
+        payload = serialize(value)
+        if len(payload) > self.max_memory_bytes:
+            return
+        self._set(key, version, payload)
+
+    def _record_evictions(self, count: int):
+        if count:
+            with self._stats_lock:
+                self._evictions += count
+
+    def stats(self) -> dict:
+        entries, memory_bytes = self._usage()
+        with self._stats_lock:
+            lookups = self._hits + self._misses
+            return {
+                "backend": type(self).__name__,
+                "version": self.get_version(),
+                "entries": entries,
+                "memory_bytes": memory_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+class MemoryResultCache(ResultCache):
+    """In-process LRU + TTL cache bounded by entry count and payload bytes."""
+
+    def __init__(self, max_entries: int, max_memory_bytes: int, ttl_seconds: float):
+        super().__init__(max_entries, max_memory_bytes, ttl_seconds)
+        self._lock = threading.Lock()
+        self._version = 0
+        self._entries: OrderedDict[str, tuple[int, float, bytes]] = OrderedDict()
+        self._memory_bytes = 0
+
+    def get_version(self) -> int:
+        return self._version
+
+    def sync_version(self, version: int):
+        # Not only forward: a recreated database restarts from 0
+        if version == self._version:
+            return
+        with self._lock:
+            if version != self._version:
+                self._version = version
+                self._entries.clear()
+                self._memory_bytes = 0
+
+    def _get(self, key, version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry_version, expires_at, payload = entry
+            if entry_version != version or entry_version != self._version or expires_at < time.monotonic():
+                self._pop(key)
+                self._record_evictions(1)
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def _set(self, key, version, payload):
+        with self._lock:
+            if version != self._version:
+                return
+            self._pop(key)
+            self._entries[key] = (version, time.monotonic() + self.ttl_seconds, payload)
+            self._memory_bytes += len(key) + len(payload)
+
+            evicted = 0
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._memory_bytes > self.max_memory_bytes
+            ):
+                self._pop(next(iter(self._entries)))
+                evicted += 1
+        self._record_evictions(evicted)
+
+    def _pop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= len(key) + len(entry[2])
+
+    def _usage(self):
+        with self._lock:
+            return len(self._entries), self._memory_bytes
@@ -0,0 +1,127 @@
+import sqlite3
+import threading
+import time
+
+from src.cache.result_cache import ResultCache
+
+_SCHEMA = (
+    "PRAGMA journal_mode=WAL",
+    """CREATE TABLE IF NOT EXISTS cache_entries (
+        key TEXT PRIMARY KEY,
+        version INTEGER NOT NULL,
+        payload BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        expires_at REAL NOT NULL,
+        accessed_at REAL NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS ix_cache_entries_accessed_at ON cache_entries (accessed_at)",
+    "CREATE TABLE IF NOT EXISTS cache_meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+    "INSERT OR IGNORE INTO cache_meta (name, value) VALUES ('catalog_version', 0)",
+)
+
+
+class SqliteResultCache(ResultCache):
+    """
+    Cache shared by all the worker processes of a host through a local SQLite file.
+
+    The version the entries are valid for lives in the same file, so the first
+    worker seeing a new catalog version drops the entries for every worker.
+    Hit/miss/eviction counters are per process; entries and memory usage are global.
+    """
+
+    def __init__(self, path: str, max_entries: int, max_memory_bytes: int, ttl_seconds: float):
+        super().__init__(max_entries, max_memory_bytes, ttl_seconds)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=5, isolation_level=None, check_same_thread=False
+        )
+        with self._lock:
+            for statement in _SCHEMA:
+                self._connection.execute(statement)
+
+    def get_version(self) -> int:
+        with self._lock:
+            return self._read_version()
+
+    def sync_version(self, version: int):
+        with self._lock:
+            if version == self._read_version():
+                return
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                if self._connection.execute(
+                    "UPDATE cache_meta SET value = ? WHERE name = 'catalog_version' AND value != ?",
+                    (version, version),
+                ).rowcount:
+                    self._connection.execute("DELETE FROM cache_entries")
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+
+    def _read_version(self) -> int:
+        return self._connection.execute(
+            "SELECT value FROM cache_meta WHERE name = 'catalog_version'"
+        ).fetchone()[0]
+
+    def _get(self, key, version):
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT e.payload FROM cache_entries e JOIN cache_meta m ON m.name = 'catalog_version' "
+                "WHERE e.key = ? AND e.version = ? AND e.version = m.value AND e.expires_at >= ?",
+                (key, version, now),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            return row[0]
+
+    def _set(self, key, version, payload):
+        now = time.time()
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                if version != self._read_version():
+                    self._connection.execute("COMMIT")
+                    return
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO cache_entries (key, version, payload, size, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, version, payload, len(key) + len(payload), now + self.ttl_seconds, now),
+                )
+                evicted = self._connection.execute(
+                    "DELETE FROM cache_entries WHERE expires_at < ?", (now,)
+                ).rowcount
+                evicted += self._evict_over_bounds()
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+        self._record_evictions(evicted)
+
+    def _evict_over_bounds(self) -> int:
+        evicted = 0
+        entries, memory_bytes = self._read_usage()
+        while entries > self.max_entries or memory_bytes > self.max_memory_bytes:
+            # Drop the least recently used tenth of the entries (at least one)
+            batch = max(1, entries // 10, entries - self.max_entries)
+            evicted += self._connection.execute(
+                "DELETE FROM cache_entries WHERE key IN "
+                "(SELECT key FROM cache_entries ORDER BY accessed_at LIMIT ?)",
+                (batch,),
+            ).rowcount
+            entries, memory_bytes = self._read_usage()
+        return evicted
+
+    def _read_usage(self) -> tuple[int, int]:
+        entries, memory_bytes = self._connection.execute(
+            "SELECT count(*), coalesce(sum(size), 0) FROM cache_entries"
+        ).fetchone()
+        return entries, memory_bytes
+
+    def _usage(self):
+        with self._lock:
+            return self._read_usage()
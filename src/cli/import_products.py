@@ -0,0 +1,53 @@
+"""
+Bulk import products from a CSV or NDJSON file.
+
+    uv run python -m src.cli.import_products products.ndjson
+    uv run python -m src.cli.import_products products.csv --batch-size 5000
+
+CSV files need a header with `name,price,description,categories_name,tags`;
+list fields are separated by `|`. NDJSON lines use the fields of the
+create_product request. Use `-` to read from stdin.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from src.core.product_import_service import (
+    DEFAULT_BATCH_SIZE,
+    import_products,
+    import_products_from_file,
+    register_import_job,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("path", help="CSV/NDJSON file, or - for stdin")
+    parser.add_argument("--format", choices=("csv", "ndjson"), dest="file_format")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    file_format = args.file_format
+    if file_format is None:
+        file_format = "csv" if args.path.lower().endswith(".csv") else "ndjson"
+
+    job = register_import_job(file_format)
+    if args.path == "-":
+        import_products(sys.stdin, job, batch_size=args.batch_size)
+    else:
+        import_products_from_file(Path(args.path), job, batch_size=args.batch_size)
+
+    print(
+        f"{job.status}: {job.processed} rows processed, {job.inserted} inserted, "
+        f"{job.failed} failed ({job.rows_per_second} rows/s)"
+    )
+    for error in job.errors:
+        print(f"line {error['line']}: {error['error']}", file=sys.stderr)
+    return 0 if job.status == "completed" and not job.failed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,20 @@
+from functools import lru_cache
+from typing import Literal
+
+from pydantic import BaseModel
+
+from src.utilis.sys_utilis import read_yaml_file
+
+
+class CacheSetting(BaseModel):
+    backend: Literal["memory", "sqlite"] = "memory"
+    max_entries: int = 2048
+    max_memory_bytes: int = 64 * 1024 * 1024
+    ttl_seconds: float = 300
+    sqlite_path: str = "/tmp/sgr_products_cache.sqlite3"  # noqa: S108
+    http_cache_control: str = "private, no-cache"
+
+
+@lru_cache
+def get_cache_setting() -> CacheSetting:
+    return CacheSetting(**read_yaml_file(file_name="cache_config.yml"))
@@ -1,6 +1,7 @@
 from functools import lru_cache
+from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from src.utilis.sys_utilis import load_env_config
 
@@ -13,11 +14,37 @@ class DatabaseSetting(BaseModel):
     DB_HOST: str
     DB_PORT: str
     DB_NAME: str
+    # Text search backend used by get_filtered_products. When not set it is
+    # derived from DB_TYPE (postgresql -> postgres, sqlite -> sqlite).
+    # "memory" keeps a trigram index in each process: writes made elsewhere
+    # (other workers, the seed and import CLIs) cost that process a full rebuild
+    # on its next search, so it suits small catalogs and a single worker.
+    DB_SEARCH_BACKEND: Literal["postgres", "sqlite", "memory"] | None = None
+    # Connection pool (QueuePool). Up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections
+    # are open at once; past that a checkout waits DB_POOL_TIMEOUT seconds, then fails.
+    DB_POOL_SIZE: int = Field(default=10, ge=1)
+    DB_MAX_OVERFLOW: int = Field(default=20, ge=0)
+    DB_POOL_TIMEOUT: float = Field(default=10, gt=0)
+    # Connections older than this many seconds are replaced on checkout (-1: never),
+    # before a firewall or the server drops them while idle
+    DB_POOL_RECYCLE: int = Field(default=1800, ge=-1)
+    # Test every connection with a cheap round trip on checkout, reconnecting the stale ones
+    DB_POOL_PRE_PING: bool = True
+    # Compiled SQL kept by SQLAlchemy per engine (query_cache_size); 0 disables it
+    DB_STATEMENT_CACHE_SIZE: int = Field(default=500, ge=0)
 
     @property
     def DATABASE_URL(self):
+        if self.DB_TYPE == "sqlite":
+            return f"sqlite:///{self.DB_NAME}"
         return f"{self.DB_TYPE}+{self.DB_DRIVER}://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def SEARCH_BACKEND(self) -> str:
+        if self.DB_SEARCH_BACKEND:
+            return self.DB_SEARCH_BACKEND
+        return {"postgresql": "postgres", "sqlite": "sqlite"}.get(self.DB_TYPE, "memory")
+
 
 @lru_cache
 def get_setting() -> DatabaseSetting:
@@ -0,0 +1,34 @@
+from functools import lru_cache
+from typing import Literal
+
+from pydantic import BaseModel
+
+from src.utilis.sys_utilis import read_yaml_file
+
+
+class LogSetting(BaseModel):
+    # "debug" logs full arguments and results synchronously; "production" logs
+    # truncated summaries, samples the decorated calls and writes the file in background
+    mode: Literal["debug", "production"] = "debug"
+    file_level: str = "DEBUG"
+    console_level: str = "INFO"
+    # Longest repr of an argument or result written in production mode
+    max_repr_length: int = 256
+    # Fraction of the calls of a decorated function that log ENTER/EXIT (exceptions are always logged),
+    # by function name; functions not listed use default_sample_rate
+    default_sample_rate: float = 1.0
+    sample_rates: dict[str, float] = {}
+    # Records waiting for the background sinks in production mode; more are dropped
+    queue_size: int = 10_000
+
+    @property
+    def production(self) -> bool:
+        return self.mode == "production"
+
+
+@lru_cache
+def get_log_setting() -> LogSetting:
+    try:
+        return LogSetting(**read_yaml_file(file_name="log_config.yml"))
+    except FileNotFoundError:
+        return LogSetting()
@@ -0,0 +1,31 @@
+from functools import lru_cache
+
+from pydantic import BaseModel
+
+from src.utilis.sys_utilis import read_yaml_file
+
+
+class ObservabilitySetting(BaseModel):
+    # Add X-DB-* headers (query count, DB time, suspected N+1) to every response
+    debug_headers: bool = False
+    # Statements slower than this are logged with the shape of their parameters
+    slow_query_ms: float = 200.0
+    # The same statement executed this many times in one request is reported as a suspected N+1
+    n_plus_one_threshold: int = 5
+    # Per-request cProfile of the endpoints: a request is profiled when it sends
+    # profiling_header (any value but "0") or is drawn with profiling_sample_rate
+    # The profile covers the whole process, concurrent requests included
+    profiling_enabled: bool = False
+    profiling_header: str = "X-Profile"
+    profiling_sample_rate: float = 0.0
+    # One .pstats file per profiled request; only the newest profiling_max_files are kept
+    profiling_dir: str = "/tmp/sgr_profiles"  # noqa: S108
+    profiling_max_files: int = 50
+
+
+@lru_cache
+def get_observability_setting() -> ObservabilitySetting:
+    try:
+        return ObservabilitySetting(**read_yaml_file(file_name="observability_config.yml"))
+    except FileNotFoundError:
+        return ObservabilitySetting()
@@ -0,0 +1,176 @@
+import itertools
+import math
+import random
+import time
+from collections.abc import Iterator
+from datetime import UTC, date, datetime, timedelta
+
+from loguru import logger
+from pydantic import BaseModel
+from sqlalchemy import func, insert, select
+
+from src.cache.cache_factory import catalog_changed
+from src.database.database_instance.db_instance import db_session
+from src.entities.category.category_entity import Category
+from src.entities.category.category_registry import category_registry
+from src.entities.counter.counter_crud import (
+    bump_catalog_version,
+    bump_categories_version,
+)
+from src.entities.product.product_crud import copy_products
+
+ADJECTIVES = [
+    "Classic", "Compact", "Deluxe", "Eco", "Essential", "Fresh", "Handmade", "Light",
+    "Modern", "Organic", "Portable", "Premium", "Pro", "Rustic", "Smart", "Vintage",
+]
+NOUNS = [
+    "Backpack", "Blender", "Candle", "Chair", "Coffee", "Headphones", "Jacket", "Kettle",
+    "Lamp", "Mug", "Notebook", "Olive oil", "Pasta", "Sneakers", "Tea", "Watch",
+]
+CATEGORY_WORDS = [
+    "Home", "Kitchen", "Garden", "Sport", "Outdoor", "Books", "Music", "Toys", "Beauty",
+    "Health", "Food", "Drinks", "Fashion", "Shoes", "Office", "Pets", "Tools", "Auto",
+]
+
+
+class CatalogSpec(BaseModel):
+    """Shape of a synthetic catalog. The same spec and seed always produce the same catalog."""
+
+    products: int = 100_000
+    categories: int = 50
+    tags: int = 200
+    seed: int = 42
+    # Zipf exponents: 0 is uniform, higher concentrates products on the first categories/tags
+    category_skew: float = 1.1
+    tag_skew: float = 1.3
+    max_categories_per_product: int = 3
+    max_tags_per_product: int = 5
+    # Prices are log-normal around median_price, clipped to [1, max_price]
+    median_price: int = 40
+    price_sigma: float = 1.0
+    max_price: int = 5_000
+    # created_at is spread uniformly over the `days` days before anchor_date (midnight UTC).
+    # A fixed date rather than today, so that a run on another day gives the same catalog
+    anchor_date: date = date(2026, 1, 1)
+    days: int = 730
+
+
+def _zipf_cum_weights(size: int, skew: float) -> list[float]:
+    return list(itertools.accumulate(1.0 / (rank + 1) ** skew for rank in range(size)))
+
+
+class CatalogGenerator:
+    """
+    Deterministic generator of synthetic products.
+
+    Category membership and tags follow Zipf distributions, prices a log-normal
+    one: a few categories and tags are huge and most are small, like in a real
+    catalog. Every random draw comes from one seeded `random.Random`.
+    """
+
+    def __init__(self, spec: CatalogSpec, category_ids: list[int]):
+        self.spec = spec
+        self.category_ids = category_ids
+        self._rng = random.Random(spec.seed)  # noqa: S311 - reproducibility, not security
+        self._category_weights = _zipf_cum_weights(len(category_ids), spec.category_skew)
+        self._tag_names = [f"tag-{i:04d}" for i in range(spec.tags)]
+        self._tag_weights = _zipf_cum_weights(spec.tags, spec.tag_skew)
+        anchor = spec.anchor_date
+        self._anchor = datetime(anchor.year, anchor.month, anchor.day, tzinfo=UTC)
+
+    def products(self, chunk_size: int) -> Iterator[tuple[list[tuple], list[list[int]]]]:
+        """Yield `(product rows, category ids per product)` chunks, as expected by `copy_products`."""
+        for start in range(0, self.spec.products, chunk_size):
+            rows, links = [], []
+            for number in range(start, min(start + chunk_size, self.spec.products)):
+                rows.append(self._product(number))
+                links.append(self._categories())
+            yield rows, links
+
+    def _product(self, number: int) -> tuple:
+        rng, spec = self._rng, self.spec
+        adjective, noun = rng.choice(ADJECTIVES), rng.choice(NOUNS)
+        price = rng.lognormvariate(math.log(spec.median_price), spec.price_sigma)
+        tags = rng.choices(
+            self._tag_names, cum_weights=self._tag_weights, k=rng.randint(0, spec.max_tags_per_product)
+        )
+        created_at = self._anchor - timedelta(seconds=rng.uniform(0, spec.days * 86_400))
+        return (
+            f"{adjective} {noun} {number}",
+            min(max(round(price), 1), spec.max_price),
+            list(dict.fromkeys(tags)),
+            created_at,
+            f"{adjective} {noun.lower()} from the synthetic catalog, item {number}",
+        )
+
+    def _categories(self) -> list[int]:
+        if not self.category_ids:
+            return []
+        picks = self._rng.choices(
+            self.category_ids,
+            cum_weights=self._category_weights,
+            k=self._rng.randint(1, self.spec.max_categories_per_product),
+        )
+        return list(dict.fromkeys(picks))
+
+
+def create_generated_categories(spec: CatalogSpec) -> list[int]:
+    """
+    Return the ids of the `spec.categories` generated categories, most popular first.
+
+    The ones left by a previous run are reused and only the missing ones are
+    inserted, so seeding twice does not duplicate the category names.
+    """
+    if not spec.categories:
+        return []
+    names = [
+        f"{CATEGORY_WORDS[i % len(CATEGORY_WORDS)]} {i // len(CATEGORY_WORDS) + 1}"
+        for i in range(spec.categories)
+    ]
+    try:
+        ids_by_name = dict(
+            db_session.execute(
+                select(Category.name, func.min(Category.id))
+                .where(Category.name.in_(names))
+                .group_by(Category.name)
+            ).all()
+        )
+        missing = [name for name in names if name not in ids_by_name]
+        if missing:
+            created_ids = db_session.scalars(
+                insert(Category).returning(Category.id, sort_by_parameter_order=True),
+                [{"name": name} for name in missing],
+            ).all()
+            ids_by_name.update(zip(missing, created_ids, strict=True))
+            bump_catalog_version()
+            bump_categories_version()
+            db_session.commit()
+            catalog_changed()
+            category_registry.invalidate()
+        return [ids_by_name[name] for name in names]
+    except Exception as e:
+        db_session.rollback()
+        logger.exception(f"Error creating generated categories: {e}")
+        raise RuntimeError("Failed to create categories") from e
+
+
+def seed_catalog(spec: CatalogSpec, chunk_size: int = 50_000) -> dict:
+    """Generate the catalog described by `spec` and write it chunk by chunk."""
+    start = time.monotonic()
+    category_ids = create_generated_categories(spec)
+    generator = CatalogGenerator(spec, category_ids)
+
+    written = 0
+    for rows, links in generator.products(chunk_size):
+        copy_products(rows, links)
+        written += len(rows)
+        elapsed = time.monotonic() - start
+        logger.info(f"Seeded {written}/{spec.products} products ({written / elapsed:.0f} rows/s)")
+
+    elapsed = time.monotonic() - start
+    return {
+        "categories": len(category_ids),
+        "products": written,
+        "seconds": round(elapsed, 2),
+        "rows_per_second": round(written / elapsed, 2) if elapsed > 0 else 0.0,
+    }
@@ -3,6 +3,7 @@ from src.entities.category.category_crud import (
     create_category,
     delete_category,
     get_categories_list,
+    get_category_registry_stats,
 )
 from src.models.request_models import CreateCategoryRequest, DeleteCategoryRequest
 
@@ -31,4 +32,11 @@ def delete_category_service(category: DeleteCategoryRequest):
         delete_category(category)
         return {"message": "Category deleted successfully"}
     except Exception as e:
-        raise ValueError(str(e)) from e
\ No newline at end of file
+        raise ValueError(str(e)) from e
+
+
+def get_category_registry_stats_service() -> dict:
+    return {
+        "message": "Category registry stats retrieved successfully",
+        "data": get_category_registry_stats()
+    }
@@ -0,0 +1,47 @@
+from typing import Literal
+
+from src.observability.memory import memory_inspector, object_counts
+
+MAX_TRACEBACK_FRAMES = 50
+MAX_DIFF_TOP = 200
+
+GroupBy = Literal["lineno", "filename"]
+
+
+def start_memory_tracing_service(frames: int) -> dict:
+    if frames < 1 or frames > MAX_TRACEBACK_FRAMES:
+        raise ValueError(f"Frames must be between 1 and {MAX_TRACEBACK_FRAMES}")
+    return {"message": "Memory tracing started", "data": memory_inspector.start(frames)}
+
+
+def stop_memory_tracing_service() -> dict:
+    return {"message": "Memory tracing stopped", "data": memory_inspector.stop()}
+
+
+def get_memory_status_service() -> dict:
+    return {"message": "Memory status retrieved successfully", "data": memory_inspector.status()}
+
+
+def take_memory_snapshot_service(name: str) -> dict:
+    if not name:
+        raise ValueError("Snapshot name must not be empty")
+    try:
+        return {"message": "Memory snapshot taken", "data": memory_inspector.take_snapshot(name)}
+    except RuntimeError as e:
+        raise ValueError(str(e)) from e
+
+
+def get_memory_diff_service(base: str, target: str | None, top: int, group_by: GroupBy) -> dict:
+    if top < 1 or top > MAX_DIFF_TOP:
+        raise ValueError(f"Top must be between 1 and {MAX_DIFF_TOP}")
+    try:
+        return {
+            "message": "Memory diff computed successfully",
+            "data": memory_inspector.diff(base, target, top, group_by),
+        }
+    except (KeyError, RuntimeError) as e:
+        raise ValueError(str(e.args[0])) from e
+
+
+def get_object_counts_service() -> dict:
+    return {"message": "Object counts retrieved successfully", "data": object_counts()}
@@ -0,0 +1,42 @@
+import zlib
+from collections.abc import Iterator
+
+from loguru import logger
+
+from src.cache.result_cache import serialize
+from src.entities.product.product_crud import iter_products
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_CHUNK_SIZE = 10_000
+GZIP_LEVEL = 6
+
+
+def export_products_service(chunk_size: int = DEFAULT_CHUNK_SIZE, compress: bool = False) -> Iterator[bytes]:
+    """
+    Validate the export parameters and return the NDJSON byte stream of the catalog.
+
+    Validation happens eagerly, so a bad request is reported before the response
+    starts; the database is only read once the stream is consumed.
+    """
+    if chunk_size < 1 or chunk_size > MAX_CHUNK_SIZE:
+        raise ValueError(f"Chunk size must be between 1 and {MAX_CHUNK_SIZE}")
+    stream = _ndjson_chunks(chunk_size)
+    return _gzip_chunks(stream) if compress else stream
+
+
+def _ndjson_chunks(chunk_size: int) -> Iterator[bytes]:
+    exported = 0
+    for products in iter_products(chunk_size):
+        exported += len(products)
+        yield b"".join(serialize(product) + b"\n" for product in products)
+    logger.info(f"Exported {exported} products")
+
+
+def _gzip_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    # wbits=31 writes a gzip header/trailer instead of a raw zlib stream
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -0,0 +1,282 @@
+import csv
+import json
+import tempfile
+import uuid
+from collections.abc import AsyncIterator, Iterable, Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Literal
+
+from loguru import logger
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+
+from src.database.database_instance.db_instance import session_scope
+from src.entities.category.category_registry import category_registry
+from src.entities.import_job.import_job_crud import (
+    create_import_job,
+    get_import_job_by_id,
+    update_import_job,
+)
+from src.entities.product.product_crud import create_products_bulk
+from src.models.request_models import CreateProductRequest
+
+ImportFormat = Literal["csv", "ndjson"]
+
+DEFAULT_BATCH_SIZE = 1000
+# Per-row errors kept on a job: past this only the counters keep growing
+MAX_REPORTED_ERRORS = 100
+# Jobs kept in the database for the status endpoint; registering one more drops the oldest
+MAX_TRACKED_JOBS = 50
+# CSV list fields (categories_name, tags) use this separator
+CSV_LIST_SEPARATOR = "|"
+
+
+class ImportJob:
+    """
+    Progress and outcome of a bulk product import.
+
+    The job lives in the database (`ProductImports`), saved after every batch,
+    so the status endpoint answers from any worker, not only the one running it.
+    """
+
+    def __init__(self, source_format: ImportFormat, job_id: str | None = None):
+        self.id = job_id or uuid.uuid4().hex
+        self.format = source_format
+        self.status: Literal["pending", "running", "completed", "failed"] = "pending"
+        self.processed = 0
+        self.inserted = 0
+        self.failed = 0
+        self.errors: list[dict] = []
+        self.created_at = datetime.now(UTC)
+        self.started_at: datetime | None = None
+        self.finished_at: datetime | None = None
+
+    @classmethod
+    def from_row(cls, row: dict) -> "ImportJob":
+        job = cls(row["format"], job_id=row["id"])
+        for field in ("status", "processed", "inserted", "failed", "errors"):
+            setattr(job, field, row[field])
+        for field in ("created_at", "started_at", "finished_at"):
+            # SQLite gives the dates back without their timezone: they are stored in UTC
+            value = row[field]
+            setattr(job, field, value.replace(tzinfo=UTC) if value and value.tzinfo is None else value)
+        return job
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        # Wall clock, not monotonic: the job may be read by another process than the one running it
+        elapsed = ((self.finished_at or datetime.now(UTC)) - self.started_at).total_seconds()
+        return round(self.processed / elapsed, 2) if elapsed > 0 else 0.0
+
+    def add_error(self, line: int, error: str):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": error})
+
+    def progress(self) -> dict:
+        """The columns of the job that change while it runs."""
+        return {
+            "status": self.status,
+            "processed": self.processed,
+            "inserted": self.inserted,
+            "failed": self.failed,
+            "errors": self.errors,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "format": self.format,
+            "status": self.status,
+            "processed": self.processed,
+            "inserted": self.inserted,
+            "failed": self.failed,
+            "rows_per_second": self.rows_per_second,
+            "errors": self.errors,
+        }
+
+
+def register_import_job(source_format: ImportFormat) -> ImportJob:
+    job = ImportJob(source_format)
+    create_import_job(
+        {"id": job.id, "format": job.format, "created_at": job.created_at, **job.progress()},
+        max_tracked_jobs=MAX_TRACKED_JOBS,
+    )
+    return job
+
+
+def get_import_job(job_id: str) -> ImportJob | None:
+    row = get_import_job_by_id(job_id)
+    return ImportJob.from_row(row) if row else None
+
+
+def _save_progress(job: ImportJob):
+    try:
+        update_import_job(job.id, job.progress())
+    except RuntimeError:
+        # Already logged: a status that lags behind must not fail the import itself
+        pass
+
+
+def iter_records(lines: Iterable[str], source_format: ImportFormat) -> Iterator[tuple[int, dict | str]]:
+    """
+    Yield `(line_number, record)` pairs from a CSV or NDJSON stream.
+
+    A line that cannot be decoded yields the error message instead of the record,
+    so one bad line does not stop the import.
+    """
+    if source_format == "csv":
+        reader = csv.DictReader(lines)
+        for record in reader:
+            yield reader.line_num, {
+                "name": record.get("name"),
+                "price": record.get("price"),
+                "description": record.get("description"),
+                "categories_name": _split_csv_list(record.get("categories_name")),
+                "tags": _split_csv_list(record.get("tags")),
+            }
+        return
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, "Invalid record: expected a JSON object"
+            continue
+        record.setdefault("categories_name", None)
+        record.setdefault("tags", None)
+        yield line_number, record
+
+
+def _split_csv_list(value: str | None) -> list[str] | None:
+    if not value:
+        return None
+    return [item.strip() for item in value.split(CSV_LIST_SEPARATOR) if item.strip()]
+
+
+def import_products(
+    lines: Iterable[str],
+    job: ImportJob,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> ImportJob:
+    """
+    Stream records from `lines` into the database in batches of `batch_size`.
+
+    Memory is bounded by one batch. Invalid rows are reported on the job and
+    skipped; a batch rejected by the database marks all of its rows as failed.
+    """
+    job.status = "running"
+    job.started_at = datetime.now(UTC)
+    _save_progress(job)
+    batch: list[tuple[int, CreateProductRequest]] = []
+    try:
+        for line_number, record in iter_records(lines, job.format):
+            job.processed += 1
+            if isinstance(record, str):
+                job.add_error(line_number, record)
+                continue
+            try:
+                product = CreateProductRequest(**record)
+            except ValidationError as e:
+                job.add_error(line_number, str(e.errors(include_url=False)))
+                continue
+            if product.price < 0:
+                job.add_error(line_number, "Price cannot be negative")
+                continue
+
+            batch.append((line_number, product))
+            if len(batch) >= batch_size:
+                _flush_batch(batch, job)
+                _save_progress(job)
+                batch = []
+
+        _flush_batch(batch, job)
+        job.status = "completed"
+    except Exception as e:
+        job.status = "failed"
+        job.errors.append({"line": None, "error": str(e)})
+        logger.exception(f"Product import {job.id} failed: {e}")
+    finally:
+        job.finished_at = datetime.now(UTC)
+        _save_progress(job)
+        logger.info(
+            f"Product import {job.id} {job.status}: {job.inserted} inserted, "
+            f"{job.failed} failed, {job.rows_per_second} rows/s"
+        )
+    return job
+
+
+def _flush_batch(batch: list[tuple[int, CreateProductRequest]], job: ImportJob):
+    if not batch:
+        return
+
+    # One registry lookup for all the category names of the batch
+    names = {name for _, product in batch for name in product.categories_name or []}
+    known = category_registry.lookup(list(names))
+
+    line_numbers, products, category_ids = [], [], []
+    for line_number, product in batch:
+        unknown = [name for name in product.categories_name or [] if name.lower() not in known]
+        if unknown:
+            job.add_error(line_number, f"Category '{unknown[0]}' not found")
+            continue
+        line_numbers.append(line_number)
+        products.append(product)
+        category_ids.append(
+            list(dict.fromkeys(known[name.lower()] for name in product.categories_name or []))
+        )
+
+    try:
+        job.inserted += len(create_products_bulk(products, category_ids))
+    except RuntimeError as e:
+        for line_number in line_numbers:
+            job.add_error(line_number, str(e))
+
+
+def import_products_from_file(path: Path, job: ImportJob, batch_size: int = DEFAULT_BATCH_SIZE) -> ImportJob:
+    """Run an import from a file on disk (used by the background job and the CLI)."""
+    with path.open(encoding="utf-8", newline="") as file:
+        return import_products(file, job, batch_size=batch_size)
+
+
+async def spool_upload(chunks: AsyncIterator[bytes], source_format: ImportFormat) -> Path:
+    """
+    Write an uploaded body to a temporary file chunk by chunk, without holding it in memory.
+
+    The disk writes run in the threadpool, off the event loop. If the upload
+    fails (e.g. the client disconnects) the partial file is deleted.
+    """
+    file = await run_in_threadpool(
+        tempfile.NamedTemporaryFile,
+        mode="wb", prefix="products_import_", suffix=f".{source_format}", delete=False,
+    )
+    path = Path(file.name)
+    try:
+        async for chunk in chunks:
+            await run_in_threadpool(file.write, chunk)
+        await run_in_threadpool(file.close)
+    except BaseException:
+        file.close()
+        path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def run_import_job(path: Path, job: ImportJob, batch_size: int = DEFAULT_BATCH_SIZE):
+    """Background task: import the spooled file, then delete it."""
+    try:
+        # Runs after the response is sent, outside the request's session
+        with session_scope():
+            import_products_from_file(path, job, batch_size=batch_size)
+    finally:
+        path.unlink(missing_ok=True)
@@ -1,14 +1,24 @@
+from datetime import UTC
 
+from src.cache.cache_factory import ResultCacheFactory, catalog_version
+from src.cache.result_cache import make_cache_key
 from src.entities.product.product_crud import (
+    FILTERED_COUNT_EXACT_LIMIT,
+    bulk_delete_products,
+    bulk_update_products,
     create_product,
     delete_product,
     get_filtered_products,
     get_number_of_product,
     get_product_by_id,
+    get_product_facets,
     get_products_list,
+    get_tag_cloud,
     update_product,
 )
 from src.models.request_models import (
+    BulkDeleteProductsRequest,
+    BulkUpdateProductsRequest,
     CreateProductRequest,
     DeleteProductRequest,
     GetFilteredProductsRequest,
@@ -16,6 +26,16 @@ from src.models.request_models import (
     UpdateProductRequest,
 )
 
+MAX_PAGE_SIZE = 100
+FACET_PRICE_BUCKETS = 10
+MAX_TAG_CLOUD_SIZE = 200
+# Fields of GetFilteredProductsRequest that restrict the matches (sorting and paging do not)
+FILTER_CRITERIA = (
+    "text_filter", "category_filter", "min_max_price_filter",
+    "tags_any", "tags_all", "created_after", "created_before",
+)
+BULK_UPDATE_FIELDS = ("name", "price", "price_multiplier", "categories_name", "tags", "description")
+
 
 def create_product_service(product: CreateProductRequest) -> dict:
     if product.price < 0:
@@ -56,23 +76,41 @@ def get_product_service(product: GetProductRequest) -> dict:
     except Exception as e:
         raise ValueError(str(e)) from e
 
-def get_products_list_service(page: int, page_size: int) -> dict:
+def get_products_list_service(page: int, page_size: int, cursor: str | None = None) -> dict:
+    _check_page(page, page_size)
     try:
-        products = get_products_list(page=page, page_size=page_size)
+        products, next_cursor = get_products_list(page=page, page_size=page_size, cursor=cursor)
         return {
             "message": "Products list retrieved successfully",
-            "data": products
+            "data": {
+                "products": products,
+                "pagination": {
+                    "current_page": None if cursor else page,
+                    "page_size": page_size,
+                    "next_cursor": next_cursor
+                }
+            }
         }
     except Exception as e:
         raise ValueError(str(e)) from e
 
 def get_filtered_products_service(product_filter: GetFilteredProductsRequest) -> dict:
+    _check_page(product_filter.page, product_filter.page_size)
+    product_filter = _with_normalized_text(_with_utc_dates(product_filter))
+    if (
+        product_filter.created_after
+        and product_filter.created_before
+        and product_filter.created_after >= product_filter.created_before
+    ):
+        raise ValueError("created_after must be earlier than created_before")
     try:
-        products, total_count = get_filtered_products(product_filter=product_filter)
+        products, total_count = _get_filtered_products_cached(product_filter)
         total_pages = (total_count + product_filter.page_size - 1) // product_filter.page_size  # Ceiling division
+        # Large filtered sets are not counted exactly: the total is the planner estimate
+        total_count_estimated = total_count > FILTERED_COUNT_EXACT_LIMIT
 
         if not products:
-            return {
+            result = {
                 "message": "No products found",
                 "data": {
                     "products": [],
@@ -80,22 +118,29 @@ def get_filtered_products_service(product_filter: GetFilteredProductsRequest) ->
                         "current_page": product_filter.page,
                         "page_size": product_filter.page_size,
                         "total_count": total_count,
+                        "total_count_estimated": total_count_estimated,
                         "total_pages": total_pages
                     }
                 }
             }
-        return {
-            "message": "Filtered products list retrieved successfully",
-            "data": {
-                "products": products,
-                "pagination": {
-                    "current_page": product_filter.page,
-                    "page_size": product_filter.page_size,
-                    "total_count": total_count,
-                    "total_pages": total_pages
+        else:
+            result = {
+                "message": "Filtered products list retrieved successfully",
+                "data": {
+                    "products": products,
+                    "pagination": {
+                        "current_page": product_filter.page,
+                        "page_size": product_filter.page_size,
+                        "total_count": total_count,
+                        "total_count_estimated": total_count_estimated,
+                        "total_pages": total_pages
+                    }
                 }
             }
-        }
+
+        if product_filter.facets:
+            result["data"]["facets"] = _get_product_facets_cached(product_filter)
+        return result
     except Exception as e:
         raise ValueError(str(e)) from e
 
@@ -108,3 +153,141 @@ def get_number_of_product_service() -> dict:
         }
     except Exception as e:
         raise ValueError(str(e)) from e
+
+
+def bulk_update_products_service(request: BulkUpdateProductsRequest) -> dict:
+    _check_bulk_selection(request.ids, request.product_filter, request.all)
+    if all(getattr(request, field) is None for field in BULK_UPDATE_FIELDS):
+        raise ValueError(f"Nothing to update: set at least one of {', '.join(BULK_UPDATE_FIELDS)}")
+    if request.price is not None and request.price < 0:
+        raise ValueError("Price cannot be negative")
+    if request.price_multiplier is not None and request.price_multiplier < 0:
+        raise ValueError("Price multiplier cannot be negative")
+    if request.price is not None and request.price_multiplier is not None:
+        raise ValueError("Use either price or price_multiplier, not both")
+    try:
+        updated = bulk_update_products(request)
+        return {"message": "Products updated successfully", "data": {"updated": updated}}
+    except Exception as e:
+        raise ValueError(str(e)) from e
+
+
+def bulk_delete_products_service(request: BulkDeleteProductsRequest) -> dict:
+    _check_bulk_selection(request.ids, request.product_filter, request.all)
+    try:
+        deleted = bulk_delete_products(request)
+        return {"message": "Products deleted successfully", "data": {"deleted": deleted}}
+    except Exception as e:
+        raise ValueError(str(e)) from e
+
+
+def _check_page(page: int, page_size: int):
+    if page < 1:
+        raise ValueError("Page must be greater than 0")
+    if page_size < 1 or page_size > MAX_PAGE_SIZE:
+        raise ValueError(f"Page size must be between 1 and {MAX_PAGE_SIZE}")
+
+
+def _check_bulk_selection(ids, product_filter, select_all: bool):
+    # A filter without criteria matches every product: the whole catalog must be asked for with all
+    has_criteria = product_filter is not None and any(
+        getattr(product_filter, field) for field in FILTER_CRITERIA
+    )
+    if select_all:
+        if ids is not None or product_filter is not None:
+            raise ValueError("all selects every product: do not combine it with ids or product_filter")
+        return
+    if ids is None and not has_criteria:
+        raise ValueError("Select the products with ids or a product_filter criterion, or set all to true")
+
+
+def _get_filtered_products_cached(product_filter: GetFilteredProductsRequest) -> tuple[list[dict], int]:
+    cache = ResultCacheFactory.get_cache()
+    key = make_cache_key("filtered_products", _normalize_filter(product_filter))
+    # Read the version before querying: a write landing in between makes the
+    # result stale, and the cache refuses to store it under an old version
+    version = catalog_version()
+    cached = cache.get(key, version)
+    if cached is not None:
+        products, total_count = cached
+        return products, total_count
+
+    products, total_count = get_filtered_products(product_filter=product_filter)
+    cache.set(key, version, [products, total_count])
+    return products, total_count
+
+
+def _get_product_facets_cached(product_filter: GetFilteredProductsRequest) -> dict:
+    cache = ResultCacheFactory.get_cache()
+    # Facets do not depend on the page or the sort: every page of a filter shares them
+    key = make_cache_key("product_facets", {**_filter_criteria(product_filter), "price_buckets": FACET_PRICE_BUCKETS})
+    version = catalog_version()
+    cached = cache.get(key, version)
+    if cached is not None:
+        return cached
+
+    facets = get_product_facets(product_filter, price_buckets=FACET_PRICE_BUCKETS)
+    cache.set(key, version, facets)
+    return facets
+
+
+def _with_utc_dates(product_filter: GetFilteredProductsRequest) -> GetFilteredProductsRequest:
+    """Read dates without a timezone (e.g. "2026-10-01") as UTC, like the stored created_at."""
+    dates = {
+        field: value.replace(tzinfo=UTC)
+        for field in ("created_after", "created_before")
+        if (value := getattr(product_filter, field)) is not None and value.tzinfo is None
+    }
+    return product_filter.model_copy(update=dates) if dates else product_filter
+
+
+def _with_normalized_text(product_filter: GetFilteredProductsRequest) -> GetFilteredProductsRequest:
+    """
+    Lowercase the text filter and collapse its whitespace.
+
+    The query runs with the normalized text too, not only the cache key: the
+    SQLite backend matches the text as one phrase, so two spellings sharing a
+    cache entry must also match the same products.
+    """
+    text = product_filter.text_filter
+    if not text:
+        return product_filter
+    normalized = " ".join(text.lower().split())
+    return product_filter if normalized == text else product_filter.model_copy(update={"text_filter": normalized})
+
+
+def _normalize_filter(product_filter: GetFilteredProductsRequest) -> dict:
+    """Equivalent filters (order of the categories and tags) share one cache entry; the text is already normalized."""
+    normalized = product_filter.model_dump()
+    for field in ("category_filter", "tags_any", "tags_all"):
+        if normalized[field]:
+            normalized[field] = sorted(set(normalized[field]))
+    return normalized
+
+
+def _filter_criteria(product_filter: GetFilteredProductsRequest) -> dict:
+    """The normalized filter without its page, sort and facets flag."""
+    return {field: value for field, value in _normalize_filter(product_filter).items() if field in FILTER_CRITERIA}
+
+
+def get_tag_cloud_service(limit: int) -> dict:
+    if limit < 1 or limit > MAX_TAG_CLOUD_SIZE:
+        raise ValueError(f"Limit must be between 1 and {MAX_TAG_CLOUD_SIZE}")
+    try:
+        cache = ResultCacheFactory.get_cache()
+        key = make_cache_key("tag_cloud", {"limit": limit})
+        version = catalog_version()
+        tags = cache.get(key, version)
+        if tags is None:
+            tags = get_tag_cloud(limit=limit)
+            cache.set(key, version, tags)
+        return {"message": "Tag cloud retrieved successfully", "data": tags}
+    except Exception as e:
+        raise ValueError(str(e)) from e
+
+
+def get_cache_stats_service() -> dict:
+    return {
+        "message": "Cache stats retrieved successfully",
+        "data": ResultCacheFactory.get_cache().stats()
+    }
@@ -1,7 +1,23 @@
+import threading
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import anyio
 from sqlalchemy.orm import scoped_session, sessionmaker
 
+from src.config.db_setting import get_setting
 from src.database.db_factory import DatabaseFactory
 
+# Key of the current session scope, set by session_scope() and request_session()
+_session_scope: ContextVar[object | None] = ContextVar("db_session_scope", default=None)
+
+
+def _scope_key() -> object:
+    # Inside a scope (an HTTP request, the chatbot, a background job) the session
+    # belongs to that scope; outside (scripts, CLI) it falls back to the thread
+    return _session_scope.get() or threading.get_ident()
+
 
 class DatabaseSession:
     _instance = None
@@ -10,8 +26,64 @@ class DatabaseSession:
         if cls._instance is None:
             engine = DatabaseFactory.create_engine()
             session_factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
-            cls._instance = scoped_session(session_factory)
+            cls._instance = scoped_session(session_factory, scopefunc=_scope_key)
         return cls._instance
 
 
-db_session = DatabaseSession()
\ No newline at end of file
+db_session = DatabaseSession()
+
+
+@contextmanager
+def session_scope() -> Iterator[scoped_session]:
+    """
+    Give the enclosed code its own `db_session`, for callers outside an HTTP request.
+
+    On exit the session is committed (rolled back on error) and closed, so its
+    connection goes back to the pool and its identity map is released.
+    """
+    token = _session_scope.set(object())
+    try:
+        yield db_session
+        if db_session.registry.has():
+            db_session.commit()
+    except BaseException:
+        if db_session.registry.has():
+            db_session.rollback()
+        raise
+    finally:
+        db_session.remove()
+        _session_scope.reset(token)
+
+
+# Worker threads committing/closing request sessions. At most pool size + overflow
+# sessions hold a connection, so as many threads always let them all release it
+_setting = get_setting()
+_release_limiter = anyio.CapacityLimiter(_setting.DB_POOL_SIZE + _setting.DB_MAX_OVERFLOW)
+
+
+async def _release(method):
+    await anyio.to_thread.run_sync(method, limiter=_release_limiter)
+
+
+async def request_session() -> AsyncIterator[None]:
+    """
+    Router dependency giving every request its own `db_session`, like `session_scope`.
+
+    It is async on purpose: the scope is set in the request context, which the
+    threadpool running the sync endpoints copies. The blocking commit/close run
+    in worker threads of their own limiter, not of the default threadpool: when
+    every worker of the threadpool is an endpoint waiting for a pooled connection,
+    the requests holding the connections must still be able to release them.
+    """
+    token = _session_scope.set(object())
+    try:
+        yield
+        if db_session.registry.has():
+            await _release(db_session.commit)
+    except BaseException:
+        if db_session.registry.has():
+            await _release(db_session.rollback)
+        raise
+    finally:
+        await _release(db_session.remove)
+        _session_scope.reset(token)
@@ -1,10 +1,50 @@
+import math
+import sqlite3
+
 import sqlalchemy as sql
+from sqlalchemy import Engine, event
 
-from src.config.db_setting import get_setting
+from src.config.db_setting import DatabaseSetting, get_setting
+from src.observability.db_metrics import TimedQueuePool, instrument_engine
+from src.observability.query_tracker import instrument_queries
 
 
 class DatabaseFactory:
     @staticmethod
-    def create_engine():
-        engine = sql.create_engine(get_setting().DATABASE_URL)
+    def create_engine(setting: DatabaseSetting | None = None):
+        setting = setting or get_setting()
+        url = sql.make_url(setting.DATABASE_URL)
+        options = {
+            "pool_pre_ping": setting.DB_POOL_PRE_PING,
+            "pool_recycle": setting.DB_POOL_RECYCLE,
+            "query_cache_size": setting.DB_STATEMENT_CACHE_SIZE,
+        }
+        # An in-memory SQLite database lives in a single connection: keep its default pool
+        queue_pool = not (url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"))
+        if queue_pool:
+            options |= {
+                "poolclass": TimedQueuePool,
+                "pool_size": setting.DB_POOL_SIZE,
+                "max_overflow": setting.DB_MAX_OVERFLOW,
+                "pool_timeout": setting.DB_POOL_TIMEOUT,
+            }
+        engine = sql.create_engine(url, **options)
+        if url.get_backend_name() == "sqlite":
+            register_sqlite_functions(engine)
+        instrument_engine(engine, max_overflow=setting.DB_MAX_OVERFLOW if queue_pool else None)
+        instrument_queries(engine)
         return engine
+
+
+def register_sqlite_functions(engine: Engine):
+    """Register a FLOOR fallback on the SQLite connections of `engine` when the build lacks it."""
+
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, connection_record):
+        try:
+            dbapi_connection.execute("SELECT floor(0.5)").close()
+        except sqlite3.OperationalError:
+            # Built without SQLITE_ENABLE_MATH_FUNCTIONS: "no such function: floor"
+            dbapi_connection.create_function(
+                "floor", 1, lambda value: None if value is None else math.floor(value), deterministic=True
+            )
@@ -1,7 +1,13 @@
 from loguru import logger
 
+from src.cache.cache_factory import catalog_changed
 from src.database.database_instance.db_instance import db_session
 from src.entities.category.category_entity import Category
+from src.entities.category.category_registry import category_registry
+from src.entities.counter.counter_crud import (
+    bump_catalog_version,
+    bump_categories_version,
+)
 from src.models.request_models import CreateCategoryRequest, DeleteCategoryRequest
 
 
@@ -11,8 +17,12 @@ def create_category(category: CreateCategoryRequest):
             name = category.name
         )
         db_session.add(category_instance)
+        bump_catalog_version()
+        bump_categories_version()
         db_session.commit()
+        catalog_changed()
         db_session.refresh(category_instance)
+        category_registry.invalidate()
         logger.success("Category created successfully")
     except Exception as e:
         db_session.rollback()
@@ -36,10 +46,18 @@ def delete_category(category: DeleteCategoryRequest):
         if not category_instance:
             raise ValueError("Category not found")
         db_session.delete(category_instance)
+        bump_catalog_version()
+        bump_categories_version()
         db_session.commit()
+        catalog_changed()
+        category_registry.invalidate()
 
         logger.success("Category deleted successfully")
     except Exception as e:
         db_session.rollback()
         logger.exception(f"Error deleting category: {e}")
-        raise RuntimeError("Failed to delete category") from e
\ No newline at end of file
+        raise RuntimeError("Failed to delete category") from e
+
+
+def get_category_registry_stats() -> dict:
+    return category_registry.stats()
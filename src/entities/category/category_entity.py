@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, Table
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Table
 from sqlalchemy.orm import relationship
 
 from src.entities.base import Base
@@ -6,8 +6,10 @@ from src.entities.base import Base
 product_category = Table(
     "ProductCategories",
     Base.metadata,
-    Column("product_id", Integer, ForeignKey("Products.id")),
-    Column("category_id", Integer, ForeignKey("Categories.id")),
+    Column("product_id", Integer, ForeignKey("Products.id"), primary_key=True),
+    Column("category_id", Integer, ForeignKey("Categories.id"), primary_key=True),
+    # The primary key serves product -> categories, this one category -> products
+    Index("ix_ProductCategories_category_id_product_id", "category_id", "product_id"),
 )
 
 
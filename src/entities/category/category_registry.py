@@ -0,0 +1,104 @@
+import math
+import threading
+import time
+
+from sqlalchemy import func, select
+
+from src.database.database_instance.db_instance import db_session
+from src.entities.category.category_entity import Category
+from src.entities.counter.counter_crud import get_categories_version
+
+
+class CategoryRegistry:
+    """
+    In-process, case-insensitive cache of category names to ids.
+
+    Names already seen are resolved without touching the database; the missing
+    ones are looked up together with a single `lower(name) IN (...)` query.
+    Unknown names are never cached, so a category created later is found on the
+    next lookup.
+
+    Writes of this process call `invalidate()`. Categories may also change in
+    another process (a worker, a seeding script): at most every
+    `version_check_seconds` a lookup reads the categories version, a primary key
+    lookup, and drops the cached ids when it moved. In between, hits cost no
+    round trip at all. Names differing only by case resolve to the lowest id.
+    """
+
+    def __init__(self, version_check_seconds: float = 5.0):
+        self._lock = threading.Lock()
+        self._ids: dict[str, int] = {}
+        self._version: int | None = None
+        self._version_check_seconds = version_check_seconds
+        self._version_checked_at = -math.inf
+        self._hits = 0
+        self._misses = 0
+
+    def lookup(self, names: list[str]) -> dict[str, int]:
+        """Return `{lowercased name: id}` for the known names, silently skipping the unknown ones."""
+        keys = [name.lower() for name in names]
+        self._check_version()
+        with self._lock:
+            missing = [key for key in keys if key not in self._ids]
+            self._hits += len(keys) - len(missing)
+            self._misses += len(missing)
+
+        if missing:
+            rows = db_session.execute(
+                select(func.lower(Category.name), Category.id)
+                .where(func.lower(Category.name).in_(set(missing)))
+                .order_by(Category.id)
+            ).all()
+            with self._lock:
+                for key, category_id in rows:
+                    self._ids.setdefault(key, category_id)
+
+        with self._lock:
+            return {key: self._ids[key] for key in keys if key in self._ids}
+
+    def _check_version(self):
+        now = time.monotonic()
+        with self._lock:
+            if now - self._version_checked_at < self._version_check_seconds:
+                return
+        # Read before the names: ids loaded while a category write lands are
+        # cached under the old version and dropped by the next check
+        version = get_categories_version()
+        with self._lock:
+            if version is None or version != self._version:
+                self._ids.clear()
+                self._version = version
+            self._version_checked_at = now
+
+    def resolve(self, names: list[str]) -> list[int]:
+        """Return the ids of `names` (deduplicated, in order) or raise ValueError for the first unknown one."""
+        known = self.lookup(names)
+        category_ids = []
+        for name in names:
+            category_id = known.get(name.lower())
+            if category_id is None:
+                raise ValueError(f"Category '{name}' not found")
+            if category_id not in category_ids:
+                category_ids.append(category_id)
+        return category_ids
+
+    def invalidate(self):
+        """Drop the cached ids now, in the process that changed the categories."""
+        with self._lock:
+            self._ids.clear()
+            self._version = None
+            self._version_checked_at = -math.inf
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._ids),
+                "version": self._version,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+category_registry = CategoryRegistry()
@@ -0,0 +1,98 @@
+from loguru import logger
+from sqlalchemy import Select, insert, literal, select, update
+
+from src.database.database_instance.db_instance import db_session
+from src.entities.counter.counter_entity import CatalogCounter
+
+PRODUCTS_COUNTER = "products"
+# Incremented by every catalog write: the result caches and ETags of all the
+# processes compare against it
+CATALOG_VERSION_COUNTER = "catalog_version"
+# Key of the catalog version committed by the session's last write in Session.info
+_WRITTEN_CATALOG_VERSION_INFO = "written_catalog_version"
+# Incremented by the category writes only: the category registry of all the
+# processes compares against it, so that product writes leave it warm
+CATEGORIES_VERSION_COUNTER = "categories_version"
+
+
+def add_to_counter(name: str, delta: int):
+    """
+    Add `delta` to a counter inside the caller's transaction.
+
+    The counter moves together with the rows it counts: it is committed or rolled
+    back by the write path that changed them.
+    """
+    if delta:
+        db_session.execute(
+            update(CatalogCounter)
+            .where(CatalogCounter.name == name)
+            .values(value=CatalogCounter.value + delta)
+        )
+
+
+def get_counter(name: str, initial_count: Select) -> int:
+    """
+    Read a counter with a primary key lookup.
+
+    A counter missing from the table (e.g. a schema created without the
+    migrations) is initialized once from `initial_count`.
+    """
+    value = read_counter(name)
+    if value is not None:
+        return value
+
+    try:
+        value = db_session.scalar(initial_count)
+        db_session.execute(insert(CatalogCounter).values(name=name, value=value))
+        db_session.commit()
+        logger.info(f"Counter {name} initialized to {value}")
+        return value
+    except Exception:
+        # Another worker initialized it first
+        db_session.rollback()
+        return read_counter(name)
+
+
+def read_counter(name: str) -> int | None:
+    """Read a counter with a primary key lookup; None when it is missing from the table."""
+    return db_session.scalar(select(CatalogCounter.value).where(CatalogCounter.name == name))
+
+
+def bump_catalog_version():
+    """
+    Mark the catalog as changed, inside the caller's transaction (call it before the commit).
+
+    The new version is remembered on the session: after the commit,
+    `written_catalog_version` tells which version this write produced.
+    """
+    db_session.info[_WRITTEN_CATALOG_VERSION_INFO] = db_session.scalar(
+        update(CatalogCounter)
+        .where(CatalogCounter.name == CATALOG_VERSION_COUNTER)
+        .values(value=CatalogCounter.value + 1)
+        .returning(CatalogCounter.value)
+    )
+
+
+def written_catalog_version() -> int | None:
+    """Catalog version produced by the last write of the current session (None without the counter row)."""
+    return db_session.info.get(_WRITTEN_CATALOG_VERSION_INFO)
+
+
+def get_catalog_version() -> int:
+    return get_counter(CATALOG_VERSION_COUNTER, select(literal(0)))
+
+
+def bump_categories_version():
+    """Mark the categories as changed, inside the caller's transaction (call it before the commit)."""
+    add_to_counter(CATEGORIES_VERSION_COUNTER, 1)
+
+
+def get_categories_version() -> int | None:
+    """
+    Current categories version, or None without the counter row.
+
+    Read inside write transactions (products resolve their categories before
+    inserting), so unlike `get_counter` it never initializes the row: that would
+    commit the caller's pending writes.
+    """
+    return read_counter(CATEGORIES_VERSION_COUNTER)
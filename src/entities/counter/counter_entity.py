@@ -0,0 +1,10 @@
+from sqlalchemy import BigInteger, Column, String
+
+from src.entities.base import Base
+
+
+class CatalogCounter(Base):
+
+    __tablename__ = "CatalogCounters"
+    name = Column(String(50), primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,38 @@
+from loguru import logger
+from sqlalchemy import delete, insert, select, update
+
+from src.database.database_instance.db_instance import db_session
+from src.entities.import_job.import_job_entity import ProductImport
+
+
+def create_import_job(job: dict, max_tracked_jobs: int):
+    """Store a new import job, committed right away, and drop the oldest past `max_tracked_jobs`."""
+    try:
+        db_session.execute(insert(ProductImport).values(**job))
+        newest = select(ProductImport.id).order_by(ProductImport.created_at.desc()).limit(max_tracked_jobs)
+        db_session.execute(delete(ProductImport).where(ProductImport.id.not_in(newest.scalar_subquery())))
+        db_session.commit()
+    except Exception as e:
+        db_session.rollback()
+        logger.exception(f"Error creating import job: {e}")
+        raise RuntimeError("Failed to create import job") from e
+
+
+def update_import_job(job_id: str, progress: dict):
+    """Save the progress of a running import in its own commit, visible to every worker."""
+    try:
+        db_session.execute(update(ProductImport).where(ProductImport.id == job_id).values(**progress))
+        db_session.commit()
+    except Exception as e:
+        db_session.rollback()
+        logger.exception(f"Error updating import job: {e}")
+        raise RuntimeError("Failed to update import job") from e
+
+
+def get_import_job_by_id(job_id: str) -> dict | None:
+    try:
+        row = db_session.execute(select(ProductImport.__table__).where(ProductImport.id == job_id)).first()
+        return row._asdict() if row else None
+    except Exception as e:
+        logger.exception(f"Error getting import job: {e}")
+        raise RuntimeError("Failed to get import job") from e
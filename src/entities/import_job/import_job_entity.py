@@ -0,0 +1,21 @@
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String
+
+from src.entities.base import Base
+
+
+class ProductImport(Base):
+
+    __tablename__ = "ProductImports"
+    id = Column(String(32), primary_key=True)
+    format = Column(String(10), nullable=False)
+    status = Column(String(20), nullable=False)
+    processed = Column(Integer, nullable=False, default=0)
+    inserted = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    errors = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+
+# Serves the pruning of the oldest jobs
+Index('ix_ProductImports_created_at', ProductImport.created_at)
@@ -1,47 +1,81 @@
-from datetime import datetime
+import base64
+import binascii
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
 
 from loguru import logger
-from thefuzz import fuzz
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Integer,
+    Select,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    true,
+    update,
+)
 
+from src.cache.cache_factory import catalog_changed
 from src.database.database_instance.db_instance import db_session
-from src.entities.category.category_entity import Category
+from src.entities.category.category_entity import Category, product_category
+from src.entities.category.category_registry import category_registry
+from src.entities.counter.counter_crud import (
+    PRODUCTS_COUNTER,
+    add_to_counter,
+    bump_catalog_version,
+    get_counter,
+)
 from src.entities.product.product_entity import Product
+from src.entities.product.product_query import (
+    ProductRow,
+    estimated_rows,
+    fetch_products,
+    select_products,
+    tag_elements,
+    tags_all_clause,
+    tags_any_clause,
+)
 from src.models.request_models import (
+    BulkDeleteProductsRequest,
+    BulkUpdateProductsRequest,
     CreateProductRequest,
     DeleteProductRequest,
     GetFilteredProductsRequest,
     GetProductRequest,
 )
+from src.search.search_factory import SearchBackendFactory
 
 
 def create_product(product: CreateProductRequest):
-    product_categories = []
-    if product.categories_name:
-        for category_name in product.categories_name:
-            category = (
-                db_session.query(Category)
-                .filter(Category.name.ilike(category_name))
-                .first()
-            )
-            if not category:
-                raise ValueError(f"Category '{category_name}' not found")
-            product_categories.append(category)
+    category_ids = category_registry.resolve(product.categories_name or [])
 
     try:
         product_instance = Product(
             name = product.name,
             price = product.price,
             tags = product.tags,
-            created_at = datetime.now().strftime("%d/%m/%Y"),
+            created_at = datetime.now(UTC),
             description = product.description,
         )
 
-        if product_categories:
-            product_instance.category_id.extend(product_categories)
-
         db_session.add(product_instance)
+        db_session.flush()
+        _set_product_categories(product_instance.id, category_ids)
+        add_to_counter(PRODUCTS_COUNTER, 1)
+        bump_catalog_version()
         db_session.commit()
+        catalog_changed()
         db_session.refresh(product_instance)
+        _index_product(product_instance)
         logger.success("Product created successfully")
 
     except Exception as e:
@@ -62,22 +96,19 @@ def update_product(product: dict):
                 continue
 
             if key == "categories_name" and value is not None:
-                product_categories = []
-                for category_name in value:
-                    category = (
-                        db_session.query(Category)
-                        .filter(Category.name.ilike(category_name))
-                        .first()
-                    )
-                    if not category:
-                        raise ValueError(f"Category '{category_name}' not found")
-                    product_categories.append(category)
-                product_instance.category_id = product_categories
+                db_session.execute(
+                    delete(product_category).where(product_category.c.product_id == product_instance.id)
+                )
+                _set_product_categories(product_instance.id, category_registry.resolve(value))
             elif value is not None and hasattr(product_instance, key):
                 setattr(product_instance, key, value)
 
+        bump_catalog_version()
         db_session.commit()
+
+        catalog_changed()
         db_session.refresh(product_instance)
+        _index_product(product_instance)
         logger.success("Product updated successfully")
 
     except Exception as e:
@@ -85,135 +116,603 @@ def update_product(product: dict):
         logger.exception(f"Error updating product: {e}")
         raise RuntimeError("Failed to update product") from e
 
+def create_products_bulk(products: list[CreateProductRequest], category_ids: list[list[int]]) -> list[int]:
+    """
+    Insert a batch of products and their category links in one transaction.
+
+    Products go in with a single multi-row INSERT ... RETURNING id and the
+    association rows with a single executemany, instead of one commit and one
+    refresh per product.
+    """
+    if not products:
+        return []
+    try:
+        created_at = datetime.now(UTC)
+        product_ids = db_session.scalars(
+            insert(Product).returning(Product.id, sort_by_parameter_order=True),
+            [
+                {
+                    "name": product.name,
+                    "price": product.price,
+                    "tags": product.tags,
+                    "created_at": created_at,
+                    "description": product.description,
+                }
+                for product in products
+            ],
+        ).all()
+
+        associations = [
+            {"product_id": product_id, "category_id": category_id}
+            for product_id, product_category_ids in zip(product_ids, category_ids, strict=True)
+            for category_id in product_category_ids
+        ]
+        if associations:
+            db_session.execute(insert(product_category), associations)
+        add_to_counter(PRODUCTS_COUNTER, len(product_ids))
+        bump_catalog_version()
+        db_session.commit()
+        catalog_changed()
+    except Exception as e:
+        db_session.rollback()
+        logger.exception(f"Error creating products in bulk: {e}")
+        raise RuntimeError("Failed to create products") from e
+
+    search_backend = SearchBackendFactory.get_search_backend()
+    for product_id, product in zip(product_ids, products, strict=True):
+        search_backend.index_product(product_id, product.name, product.description, product.tags)
+    return product_ids
+
+# COPY column lists, in the order of the rows written by copy_products
+PRODUCTS_COPY_SQL = (
+    'COPY "Products" (id, name, price, tags, created_at, description) FROM STDIN WITH (FORMAT csv)'
+)
+PRODUCT_CATEGORIES_COPY_SQL = (
+    'COPY "ProductCategories" (product_id, category_id) FROM STDIN WITH (FORMAT csv)'
+)
+
+
+def copy_products(products: list[tuple], category_ids: list[list[int]]) -> range:
+    """
+    Write pre-built product rows `(name, price, tags, created_at, description)` and their category links.
+
+    Meant for seeding large catalogs: the ids are reserved up front, so products
+    and links go in without RETURNING, with COPY on Postgres and one executemany
+    per table elsewhere. Search hooks are not called; database-side indexes
+    (GIN, FTS triggers) still see the rows. Returns the ids of the products.
+    """
+    if not products:
+        return range(0)
+    try:
+        first_id = _reserve_product_ids(len(products))
+        product_ids = range(first_id, first_id + len(products))
+        links = [
+            (product_id, category_id)
+            for product_id, product_category_ids in zip(product_ids, category_ids, strict=True)
+            for category_id in product_category_ids
+        ]
+
+        rows = zip(product_ids, products, strict=True)
+        if db_session.get_bind().dialect.driver == "psycopg2":
+            _copy_rows(
+                PRODUCTS_COPY_SQL,
+                (
+                    (product_id, name, price, None if tags is None else json.dumps(tags), created_at.isoformat(), description)
+                    for product_id, (name, price, tags, created_at, description) in rows
+                ),
+            )
+            _copy_rows(PRODUCT_CATEGORIES_COPY_SQL, links)
+        else:
+            db_session.execute(
+                insert(Product),
+                [
+                    dict(zip(("id", "name", "price", "tags", "created_at", "description"), (product_id, *row), strict=True))
+                    for product_id, row in rows
+                ],
+            )
+            if links:
+                db_session.execute(
+                    insert(product_category),
+                    [{"product_id": product_id, "category_id": category_id} for product_id, category_id in links],
+                )
+
+        add_to_counter(PRODUCTS_COUNTER, len(products))
+        bump_catalog_version()
+        db_session.commit()
+        catalog_changed()
+        return product_ids
+    except Exception as e:
+        db_session.rollback()
+        logger.exception(f"Error copying products: {e}")
+        raise RuntimeError("Failed to copy products") from e
+
+
+def _reserve_product_ids(count: int) -> int:
+    """Reserve `count` consecutive product ids for the current transaction and return the first."""
+    if db_session.get_bind().dialect.name == "postgresql":
+        # Holding this lock, concurrent INSERTs wait before drawing from the sequence
+        db_session.execute(text('LOCK TABLE "Products" IN SHARE ROW EXCLUSIVE MODE'))
+        last_id = db_session.scalar(
+            text(
+                "SELECT setval(pg_get_serial_sequence('\"Products\"', 'id'), "
+                "nextval(pg_get_serial_sequence('\"Products\"', 'id')) + :count - 1)"
+            ),
+            {"count": count},
+        )
+        return last_id - count + 1
+    return (db_session.scalar(select(func.max(Product.id))) or 0) + 1
+
+
+def _copy_rows(copy_sql: str, rows: Iterable[tuple]):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    with db_session.connection().connection.cursor() as cursor:
+        cursor.copy_expert(copy_sql, buffer)
+
+
+def _set_product_categories(product_id: int, category_ids: list[int]):
+    if category_ids:
+        db_session.execute(
+            insert(product_category),
+            [{"product_id": product_id, "category_id": category_id} for category_id in category_ids],
+        )
+
 def delete_product(product: DeleteProductRequest):
     try:
         product_instance = db_session.query(Product).filter(Product.id == product.id).first()
         if not product_instance:
             raise ValueError("Product not found")
         db_session.delete(product_instance)
+        add_to_counter(PRODUCTS_COUNTER, -1)
+        bump_catalog_version()
         db_session.commit()
+        catalog_changed()
+        SearchBackendFactory.get_search_backend().remove_product(product.id)
         logger.success("Product deleted successfully")
     except Exception as e:
         db_session.rollback()
         logger.exception(f"Error deleting product: {e}")
         raise RuntimeError("Failed to delete product") from e
 
-def get_product_by_id(product: GetProductRequest):
+# Ids per statement in bulk operations; keeps the bound parameters under the driver limits
+BULK_CHUNK_SIZE = 10_000
+SEARCHABLE_FIELDS = {"name", "description", "tags"}
+
+
+def bulk_update_products(request: BulkUpdateProductsRequest) -> int:
+    """
+    Update every selected product with set-based statements in one transaction.
+
+    The selection is resolved once, then each chunk of BULK_CHUNK_SIZE ids costs
+    one UPDATE ... WHERE id IN (...), plus one DELETE and one INSERT ... SELECT per
+    category when the categories are replaced. Returns the number of products updated.
+    """
+    values = {
+        key: getattr(request, key)
+        for key in ("name", "price", "tags", "description")
+        if getattr(request, key) is not None
+    }
+    if request.price_multiplier is not None:
+        values["price"] = func.round(Product.price * request.price_multiplier)
+    category_ids = (
+        category_registry.resolve(request.categories_name)
+        if request.categories_name is not None
+        else None
+    )
+
     try:
-        product_instance = db_session.query(Product).filter(Product.id == product.id).first()
-        return product_instance
+        product_ids = _select_bulk_targets(request.ids, request.product_filter)
+        for chunk in _chunks(product_ids):
+            if values:
+                db_session.execute(
+                    update(Product).where(Product.id.in_(chunk)).values(**values),
+                    execution_options={"synchronize_session": False},
+                )
+            if category_ids is not None:
+                db_session.execute(
+                    delete(product_category).where(product_category.c.product_id.in_(chunk))
+                )
+                for category_id in category_ids:
+                    db_session.execute(
+                        insert(product_category).from_select(
+                            ["product_id", "category_id"],
+                            select(Product.id, literal(category_id)).where(Product.id.in_(chunk)),
+                        )
+                    )
+        bump_catalog_version()
+        db_session.commit()
+        catalog_changed()
+    except Exception as e:
+        db_session.rollback()
+        logger.exception(f"Error updating products in bulk: {e}")
+        raise RuntimeError("Failed to update products") from e
+
+    if SEARCHABLE_FIELDS & values.keys():
+        SearchBackendFactory.get_search_backend().refresh_products(product_ids)
+    logger.success(f"{len(product_ids)} products updated")
+    return len(product_ids)
+
+
+def bulk_delete_products(request: BulkDeleteProductsRequest) -> int:
+    """
+    Delete every selected product and its category links in one transaction.
+
+    Each chunk of BULK_CHUNK_SIZE ids costs one DELETE on ProductCategories and one
+    on Products. Returns the number of products deleted.
+    """
+    try:
+        product_ids = _select_bulk_targets(request.ids, request.product_filter)
+        deleted = 0
+        for chunk in _chunks(product_ids):
+            db_session.execute(
+                delete(product_category).where(product_category.c.product_id.in_(chunk))
+            )
+            result = db_session.execute(
+                delete(Product).where(Product.id.in_(chunk)),
+                execution_options={"synchronize_session": False},
+            )
+            deleted += result.rowcount
+        add_to_counter(PRODUCTS_COUNTER, -deleted)
+        bump_catalog_version()
+        db_session.commit()
+        catalog_changed()
+    except Exception as e:
+        db_session.rollback()
+        logger.exception(f"Error deleting products in bulk: {e}")
+        raise RuntimeError("Failed to delete products") from e
+
+    search_backend = SearchBackendFactory.get_search_backend()
+    for product_id in product_ids:
+        search_backend.remove_product(product_id)
+    logger.success(f"{deleted} products deleted")
+    return deleted
+
+
+def _select_bulk_targets(ids: list[int] | None, product_filter: GetFilteredProductsRequest | None) -> list[int]:
+    """
+    Resolve the selection of a bulk operation to a list of ids with one SELECT.
+
+    The ids are materialized because the statements that follow (e.g. removing
+    category links) would change the result of a filter evaluated again later.
+    """
+    query = select(Product.id)
+    if ids is not None:
+        query = query.where(Product.id.in_(ids))
+    if product_filter is not None:
+        query, _ = _apply_product_filter(query, product_filter)
+    return list(db_session.scalars(query.order_by(Product.id)))
+
+
+def _chunks(product_ids: list[int]):
+    for start in range(0, len(product_ids), BULK_CHUNK_SIZE):
+        yield product_ids[start : start + BULK_CHUNK_SIZE]
+
+def get_product_by_id(product: GetProductRequest) -> dict | None:
+    try:
+        products = fetch_products(select_products().where(Product.id == product.id))
+        return products[0] if products else None
     except Exception as e:
         logger.exception(f"Error getting product: {e}")
         raise RuntimeError("Failed to get product") from e
 
-def get_products_list(page: int, page_size: int) -> list[dict]:
+def get_products_list(
+    page: int, page_size: int, cursor: str | None = None
+) -> tuple[list[dict], str | None]:
+    """
+    Return one page of products ordered by id, plus the cursor of the next page.
+
+    Without a cursor the page is selected with OFFSET/LIMIT, which is fine for the
+    first pages but degrades linearly with depth. With a cursor (as returned by a
+    previous call) the page is selected by keyset (`id > last_id`), which walks the
+    primary key index and costs the same on page 1 and page 10.000.
+    """
+    last_id = _decode_cursor(cursor) if cursor else None
     try:
-        products = db_session.query(Product).all()
+        statement = select_products().order_by(Product.id.asc())
 
-        return _convert_products_to_dict(products=products)
+        if last_id is not None:
+            statement = statement.where(Product.id > last_id)
+        else:
+            statement = statement.offset((page - 1) * page_size)
+
+        # Fetch one extra row to know whether a next page exists
+        products = fetch_products(statement.limit(page_size + 1))
+        has_next = len(products) > page_size
+        products = products[:page_size]
+
+        next_cursor = _encode_cursor(products[-1]["id"]) if has_next else None
+        return products, next_cursor
     except Exception as e:
         logger.exception(f"Error getting products list: {e}")
         raise RuntimeError("Failed to get products list") from e
 
+
+def iter_products(chunk_size: int) -> Iterator[list[dict]]:
+    """
+    Stream the whole catalog ordered by id, `chunk_size` products at a time.
+
+    The statement runs on a dedicated connection with a server-side cursor
+    (`stream_results`), so only one chunk is held in memory at any time no matter
+    how big the catalog is. Rows bypass the ORM session entirely.
+    """
+    statement = select_products().order_by(Product.id.asc())
+    try:
+        with db_session.get_bind().connect() as connection:
+            result = connection.execution_options(
+                stream_results=True, yield_per=chunk_size
+            ).execute(statement)
+            for partition in result.partitions():
+                yield [ProductRow(*row).to_dict() for row in partition]
+    except Exception as e:
+        logger.exception(f"Error streaming products: {e}")
+        raise RuntimeError("Failed to stream products") from e
+
+
+def _encode_cursor(last_id: int) -> str:
+    payload = json.dumps({"id": last_id}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> int:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return int(payload["id"])
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+# Filtered totals are counted exactly up to this many products, estimated above
+FILTERED_COUNT_EXACT_LIMIT = 5_000
+
+
 def get_filtered_products(product_filter: GetFilteredProductsRequest) -> tuple[list[dict], int]:
+    """
+    Return one page of filtered products and the size of the whole filtered set.
+
+    Both come from a single statement. An inner query applies the filters,
+    sorts, and paginates the matching ids, so a sorted page stops after LIMIT
+    rows of its index; the outer query loads the columns and categories of the
+    page rows only. The total is counted next to it over at most
+    FILTERED_COUNT_EXACT_LIMIT + 1 matches: a `count(*) OVER ()` window would
+    read the whole filtered set on every page. Past the limit the total is the
+    planner estimate (an exact count where there is none, i.e. SQLite).
+    """
     try:
-        query = db_session.query(Product)
-        if product_filter.category_filter:
-            query = query.filter(Product.category_id.any(Category.name.in_(product_filter.category_filter)))
+        query, rank = _apply_product_filter(select_products(), product_filter)
+        order_by = _filtered_products_order(product_filter, rank)
+        matches = query.with_only_columns(Product.id, maintain_column_froms=True)
+
+        page = (
+            matches.add_columns(func.row_number().over(order_by=order_by).label("position"))
+            .order_by(*order_by)
+            .offset((product_filter.page - 1) * product_filter.page_size)
+            .limit(product_filter.page_size)
+            .subquery("page")
+        )
+        capped_count = (
+            select(func.count().label("total_count"))
+            .select_from(matches.limit(FILTERED_COUNT_EXACT_LIMIT + 1).subquery("matches"))
+            .subquery("capped_count")
+        )
+        # One row with a NULL product when the page is empty (e.g. past the last page)
+        statement = (
+            select_products()
+            .add_columns(capped_count.c.total_count)
+            .select_from(capped_count)
+            .outerjoin(page.join(Product, page.c.id == Product.id), true())
+            .order_by(page.c.position)
+        )
+        rows = db_session.execute(statement).all()
 
-        # sostituire nel corpo di `get_filtered_products`
-        if product_filter.min_max_price_filter:
-            try:
-                min_price, max_price = product_filter.min_max_price_filter
-            except Exception:
-                min_price, max_price = None, None
-
-            def _to_num(v):
-                try:
-                    return float(v) if v is not None else None
-                except Exception:
-                    return None
-
-            min_price = _to_num(min_price)
-            max_price = _to_num(max_price)
-
-            if min_price is not None and max_price is not None:
-                query = query.filter(Product.price >= min_price, Product.price <= max_price)
-            elif min_price is not None:
-                query = query.filter(Product.price >= min_price)
-            elif max_price is not None:
-                query = query.filter(Product.price <= max_price)
-
-
-        if product_filter.sort_by:
-            field, direction = product_filter.sort_by
-            if field == "price":
-                if direction == "asc":
-                    query = query.order_by(Product.price.asc())
-                else:
-                    query = query.order_by(Product.price.desc())
-
-            elif field == "date":
-                if direction == "asc":
-                    query = query.order_by(Product.created_at.asc())
-                else:
-                    query = query.order_by(Product.created_at.desc())
-
-        # Get total count before applying pagination
-        total_count = query.count()
-
-        # Apply pagination
-        offset = (product_filter.page - 1) * product_filter.page_size
-        query = query.offset(offset).limit(product_filter.page_size)
-
-        results = query.all()
-
-        if product_filter.text_filter:
-            results = sorted(
-                results,
-                key=lambda prod: fuzz.partial_ratio(product_filter.text_filter.lower(), prod.name.lower()),
-                reverse=True
-            )
-            results = [r for r in results if fuzz.partial_ratio(product_filter.text_filter.lower(), r.name.lower()) > 60]
+        total_count = rows[0].total_count
+        if total_count > FILTERED_COUNT_EXACT_LIMIT:
+            estimate = estimated_rows(matches)
+            if estimate is None:
+                total_count = db_session.scalar(select(func.count()).select_from(matches.subquery()))
+            else:
+                total_count = max(estimate, FILTERED_COUNT_EXACT_LIMIT + 1)
 
-        return _convert_products_to_dict(products=results), total_count
+        return [ProductRow(*row[:-1]).to_dict() for row in rows if row.id is not None], total_count
 
     except Exception as e:
         logger.exception(f"Error getting filtered products: {e}")
         raise RuntimeError("Failed to get filtered products") from e
 
 
-def _convert_products_to_dict(products: list[Product]) -> list[dict]:
-    if not products:
-        return []
-
-    products_dicts = []
-    for product in products:
-        if hasattr(product, "__table__"):
-            prod_dict = {col.name: getattr(product, col.name) for col in product.__table__.columns}
-        else:
-            prod_dict = {
-                k: v for k, v in product.__dict__.items() if k != "_sa_instance_state"
+def _filtered_products_order(product_filter: GetFilteredProductsRequest, rank: ColumnElement | None) -> list[ColumnElement]:
+    order_by = []
+    if product_filter.sort_by:
+        field, direction = product_filter.sort_by
+        if field == "price":
+            if direction == "asc":
+                order_by.append(Product.price.asc())
+            else:
+                order_by.append(Product.price.desc())
+
+        elif field == "date":
+            if direction == "asc":
+                order_by.append(Product.created_at.asc())
+            else:
+                order_by.append(Product.created_at.desc())
+
+    # An explicit sort wins, relevance breaks the ties; the id keeps pages stable
+    if rank is not None:
+        order_by.append(rank.desc())
+    if product_filter.sort_by and product_filter.sort_by[1] == "desc" and rank is None:
+        # Same direction as the sort key, so its (key, id) index is scanned backwards
+        order_by.append(Product.id.desc())
+    else:
+        order_by.append(Product.id.asc())
+    return order_by
+
+
+def get_product_facets(product_filter: GetFilteredProductsRequest, price_buckets: int) -> dict:
+    """
+    Aggregate the products matching `product_filter` for the filter sidebar.
+
+    Returns the match count per category, the price bounds and a histogram of
+    `price_buckets` equal-width buckets between them. Sorting and pagination of
+    the filter are ignored. Costs two grouped statements whatever the number of
+    categories or buckets: one over the category links, one over the prices.
+    """
+    try:
+        filtered, _ = _apply_product_filter(select(Product.id, Product.price), product_filter)
+        # A CTE: the price statement reads the filtered set twice (bounds and buckets)
+        filtered = filtered.cte("filtered")
+
+        category_rows = db_session.execute(
+            select(Category.id, Category.name, func.count().label("count"))
+            .select_from(filtered)
+            .join(product_category, product_category.c.product_id == filtered.c.id)
+            .join(Category, Category.id == product_category.c.category_id)
+            .group_by(Category.id, Category.name)
+            .order_by(func.count().desc(), Category.name.asc())
+        ).all()
+
+        bounds = (
+            select(func.min(filtered.c.price).label("low"), func.max(filtered.c.price).label("high"))
+            .subquery("bounds")
+        )
+        bucket = price_bucket(filtered.c.price, bounds.c.low, bounds.c.high, price_buckets).label("bucket")
+        histogram_rows = db_session.execute(
+            select(bounds.c.low, bounds.c.high, bucket, func.count().label("count"))
+            .select_from(filtered.join(bounds, true()))
+            .where(filtered.c.price.is_not(None))
+            .group_by(bounds.c.low, bounds.c.high, bucket)
+        ).all()
+
+        return {
+            "categories": [
+                {"id": row.id, "name": row.name, "count": row.count} for row in category_rows
+            ],
+            **_price_facets(histogram_rows, price_buckets),
+        }
+    except Exception as e:
+        logger.exception(f"Error getting product facets: {e}")
+        raise RuntimeError("Failed to get product facets") from e
+
+
+def price_bucket(price, low, high, price_buckets: int) -> ColumnElement:
+    """
+    Index (0 to `price_buckets - 1`) of the equal-width bucket of `price` between `low` and `high`.
+
+    FLOOR, not a CAST to integer: Postgres rounds when casting a float, SQLite
+    truncates. The maximum price lands on the last bucket instead of one past it.
+    A single price (`high == low`) is bucket 0, never a division by zero: the
+    CASE tests it first, and NULLIF covers a planner folding the division early.
+    SQLite builds without SQLITE_ENABLE_MATH_FUNCTIONS have no FLOOR: the engine
+    factory registers a fallback on those connections.
+    """
+    width = func.nullif(cast(high - low, Float), 0)
+    position = cast(func.floor((price - low) * price_buckets / width), Integer)
+    return case((high == low, 0), (position >= price_buckets, price_buckets - 1), else_=position)
+
+
+def _price_facets(histogram_rows, price_buckets: int) -> dict:
+    if not histogram_rows:
+        return {"price": {"min": None, "max": None}, "price_histogram": []}
+
+    low, high = histogram_rows[0].low, histogram_rows[0].high
+    if high == low:
+        # A single price collapses the histogram to one bucket
+        return {
+            "price": {"min": low, "max": high},
+            "price_histogram": [
+                {"from": low, "to": high, "count": sum(row.count for row in histogram_rows)}
+            ],
+        }
+
+    counts = {row.bucket: row.count for row in histogram_rows}
+    width = (high - low) / price_buckets
+    return {
+        "price": {"min": low, "max": high},
+        "price_histogram": [
+            {
+                "from": low + width * i,
+                "to": high if i == price_buckets - 1 else low + width * (i + 1),
+                "count": counts.get(i, 0),
             }
+            for i in range(price_buckets)
+        ],
+    }
+
+
+def _apply_product_filter(query: Select, product_filter: GetFilteredProductsRequest) -> tuple[Select, ColumnElement | None]:
+    """Apply the text, category, price, tag and date filters of `product_filter`; return the query and the relevance rank, if any."""
+    rank = None
+    if product_filter.text_filter:
+        query, rank = SearchBackendFactory.get_search_backend().apply(
+            query, product_filter.text_filter
+        )
 
-        if hasattr(product, "category_id") and product.category_id is not None:
+    if product_filter.category_filter:
+        query = query.filter(Product.category_id.any(Category.name.in_(product_filter.category_filter)))
+
+    if product_filter.min_max_price_filter:
+        try:
+            min_price, max_price = product_filter.min_max_price_filter
+        except Exception:
+            min_price, max_price = None, None
+
+        def _to_num(v):
             try:
-                prod_dict["categories"] = [
-                    {col.name: getattr(c, col.name) for col in c.__table__.columns}
-                    for c in product.category_id
-                ]
-            except Exception as _:
-                prod_dict["categories"] = prod_dict.get("category_id")
-            prod_dict.pop("category_id", None)
+                return float(v) if v is not None else None
+            except Exception:
+                return None
+
+        min_price = _to_num(min_price)
+        max_price = _to_num(max_price)
+
+        if min_price is not None and max_price is not None:
+            query = query.filter(Product.price >= min_price, Product.price <= max_price)
+        elif min_price is not None:
+            query = query.filter(Product.price >= min_price)
+        elif max_price is not None:
+            query = query.filter(Product.price <= max_price)
+
+    if product_filter.tags_any:
+        query = query.filter(tags_any_clause(product_filter.tags_any))
+    if product_filter.tags_all:
+        query = query.filter(tags_all_clause(product_filter.tags_all))
+
+    if product_filter.created_after:
+        query = query.filter(Product.created_at >= product_filter.created_after)
+    if product_filter.created_before:
+        query = query.filter(Product.created_at < product_filter.created_before)
+
+    return query, rank
+
+
+def get_tag_cloud(limit: int) -> list[dict]:
+    """Return the `limit` most used tags with the number of products carrying each."""
+    try:
+        tag = tag_elements()
+        count = func.count().label("count")
+        rows = db_session.execute(
+            select(tag.c.value.label("tag"), count)
+            .select_from(Product)
+            .join(tag, true())
+            .where(tag.c.value.is_not(None))
+            .group_by(tag.c.value)
+            .order_by(count.desc(), tag.c.value.asc())
+            .limit(limit)
+        ).all()
+        return [{"tag": row.tag, "count": row.count} for row in rows]
+    except Exception as e:
+        logger.exception(f"Error getting tag cloud: {e}")
+        raise RuntimeError("Failed to get tag cloud") from e
+
 
-        products_dicts.append(prod_dict)
+def _index_product(product: Product):
+    SearchBackendFactory.get_search_backend().index_product(
+        product.id, product.name, product.description, product.tags
+    )
 
-    return products_dicts
 
 def get_number_of_product():
     try:
-        number_of_products = db_session.query(Product).count()
-        return number_of_products
+        return get_counter(PRODUCTS_COUNTER, select(func.count(Product.id)))
     except Exception as e:
         logger.exception(f"Error getting number of products: {e}")
         raise RuntimeError("Failed to get number of products") from e
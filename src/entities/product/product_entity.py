@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Index, Integer, String
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
@@ -9,13 +9,18 @@ from src.entities.category.category_entity import product_category
 class Product(Base):
 
     __tablename__ = "Products"
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, index=True)
-    price = Column(Integer, index=True)
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    price = Column(Integer)
 
     category_id = relationship("Category", secondary=product_category, back_populates="product_id")
-    tags = Column(JSONB, index=True)
-    created_at = Column(String, index=True)
-    description = Column(String, index=True)
+    tags = Column(JSON().with_variant(JSONB(), "postgresql"))
+    created_at = Column(DateTime(timezone=True))
+    description = Column(String)
 
-Index('ix_Products_tags', Product.tags, postgresql_using='gin')
\ No newline at end of file
+# Serves the price range filter and the price sort (both directions) with an index-only scan
+Index('ix_Products_price_id', Product.price, Product.id)
+# Serves the tags_any (?|) and tags_all (@>) filters
+Index('ix_Products_tags', Product.tags, postgresql_using='gin')
+# Serves the date sort (both directions) and keyset pagination on (created_at, id)
+Index('ix_Products_created_at_id', Product.created_at, Product.id)
\ No newline at end of file
@@ -0,0 +1,126 @@
+from sqlalchemy import JSON, ColumnElement, Select, exists, func, select, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB, array
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from src.database.database_instance.db_instance import db_session
+from src.entities.category.category_entity import Category, product_category
+from src.entities.product.product_entity import Product
+
+PRODUCT_COLUMNS = (
+    Product.id,
+    Product.name,
+    Product.price,
+    Product.tags,
+    Product.created_at,
+    Product.description,
+)
+
+
+class ProductRow:
+    """
+    Read-only view of a product row with its categories.
+
+    Built straight from the result rows of `select_products()`: no ORM identity
+    map, no instrumentation and no lazy loads.
+    """
+
+    __slots__ = ("id", "name", "price", "tags", "created_at", "description", "categories")
+
+    def __init__(self, id, name, price, tags, created_at, description, categories):
+        self.id = id
+        self.name = name
+        self.price = price
+        self.tags = tags
+        self.created_at = created_at
+        self.description = description
+        self.categories = categories or []
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "price": self.price,
+            "tags": self.tags,
+            "created_at": self.created_at,
+            "description": self.description,
+            "categories": self.categories,
+        }
+
+
+def _is_postgres() -> bool:
+    return db_session.get_bind().dialect.name == "postgresql"
+
+
+def _categories_json():
+    """Correlated subquery aggregating the categories of each product as a JSON array."""
+    if _is_postgres():
+        aggregate = func.json_agg(
+            func.json_build_object("id", Category.id, "name", Category.name), type_=JSON
+        )
+    else:
+        aggregate = func.json_group_array(
+            func.json_object("id", Category.id, "name", Category.name), type_=JSON
+        )
+
+    return (
+        select(aggregate)
+        .select_from(product_category.join(Category, Category.id == product_category.c.category_id))
+        .where(product_category.c.product_id == Product.id)
+        .scalar_subquery()
+    )
+
+
+def tags_any_clause(tags: list[str]) -> ColumnElement:
+    """Products having at least one of `tags`: `tags ?| array[...]` on Postgres, served by the GIN index."""
+    if _is_postgres():
+        return type_coerce(Product.tags, JSONB).has_any(array(tags))
+    tag = func.json_each(Product.tags).table_valued("value")
+    return exists(select(tag.c.value).where(tag.c.value.in_(tags)))
+
+
+def tags_all_clause(tags: list[str]) -> ColumnElement:
+    """Products having every one of `tags`: `tags @> '[...]'` on Postgres, served by the GIN index."""
+    if _is_postgres():
+        return type_coerce(Product.tags, JSONB).contains(tags)
+    tag = func.json_each(Product.tags).table_valued("value")
+    matched = select(func.count(tag.c.value.distinct())).where(tag.c.value.in_(tags)).scalar_subquery()
+    return matched == len(set(tags))
+
+
+def tag_elements():
+    """Table-valued function expanding `Product.tags` into one `value` row per tag."""
+    if _is_postgres():
+        return func.jsonb_array_elements_text(Product.tags).table_valued("value").render_derived("tag")
+    return func.json_each(Product.tags).table_valued("value").alias("tag")
+
+
+def select_products() -> Select:
+    """Select the product columns plus their categories, in a single statement."""
+    return select(*PRODUCT_COLUMNS, _categories_json().label("categories"))
+
+
+def fetch_products(statement: Select) -> list[dict]:
+    return [ProductRow(*row).to_dict() for row in db_session.execute(statement)]
+
+
+class _Explain(Executable, ClauseElement):
+    """`EXPLAIN (FORMAT JSON)` of a statement, compiled with its own bind parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def estimated_rows(statement: Select) -> int | None:
+    """Rows the Postgres planner expects `statement` to return, without running it; None elsewhere."""
+    if not _is_postgres():
+        return None
+    plan = db_session.execute(_Explain(statement)).scalar_one()
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,171 @@
+import re
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+
+from loguru import logger
+
+_WORD_SPLIT = re.compile(r"[^\w]+", re.UNICODE)
+
+# Minimum similarity (0-1) a product needs to be returned by a text search
+MIN_SIMILARITY = 0.5
+# Matches found only in description/tags weigh less than matches on the name
+BODY_WEIGHT = 0.8
+
+
+def trigrams(text: str | None) -> frozenset[str]:
+    """
+    Split a text into pg_trgm-style trigrams.
+
+    Every word is lowercased and padded with two leading spaces and one trailing
+    space, so "Apple" produces {"  a", " ap", "app", "ppl", "ple", "le "}.
+    """
+    if not text:
+        return frozenset()
+    grams = set()
+    for word in _WORD_SPLIT.split(text.lower()):
+        if not word:
+            continue
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class ProductSearchIndex:
+    """
+    In-process trigram inverted index over product name, description and tags.
+
+    Each trigram maps to the set of product ids containing it, so a search only
+    visits the posting lists of the trigrams in the query instead of scanning the
+    whole catalog. The index is built lazily on the first search through `loader`
+    and then kept up to date by the product write paths of this process.
+
+    `version` is the catalog version the index reflects. A local write moving
+    the catalog exactly one version ahead advances it (`account_write`); any
+    other gap with the database version (writes of other workers, scripts, or
+    paths skipping the hooks like `copy_products`) makes the next search rebuild.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._version: int | None = None
+        self._name_postings: dict[str, set[int]] = defaultdict(set)
+        self._body_postings: dict[str, set[int]] = defaultdict(set)
+        self._documents: dict[int, tuple[frozenset[str], frozenset[str]]] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def version(self) -> int | None:
+        return self._version
+
+    def load(self, rows: Iterable[tuple[int, str | None, str | None, list | None]], version: int | None = None):
+        """Rebuild the index from `rows`, read at catalog `version` (or later: a newer version only costs a rebuild)."""
+        with self._lock:
+            self.clear()
+            for product_id, name, description, tags in rows:
+                self._add(product_id, name, description, tags)
+            self._loaded = True
+            self._version = version
+            logger.info(f"Product search index loaded with {len(self._documents)} products at version {version}")
+
+    def clear(self):
+        with self._lock:
+            self._name_postings.clear()
+            self._body_postings.clear()
+            self._documents.clear()
+            self._loaded = False
+            self._version = None
+
+    def account_write(self, version: int | None):
+        """
+        Record that a local write, already applied to the index, committed catalog `version`.
+
+        Only the version right after the indexed one is taken: a larger one means
+        another writer changed the catalog in between, so the index stays behind
+        and the next search rebuilds it. The same version again (one call per
+        product of a bulk write) changes nothing.
+        """
+        with self._lock:
+            if self._loaded and version is not None and self._version is not None and version == self._version + 1:
+                self._version = version
+
+    def add(self, product_id: int, name: str | None, description: str | None, tags: list | None):
+        """Index (or re-index) a product. No-op until the index has been loaded."""
+        with self._lock:
+            if not self._loaded:
+                return
+            self._remove(product_id)
+            self._add(product_id, name, description, tags)
+
+    def remove(self, product_id: int):
+        with self._lock:
+            if not self._loaded:
+                return
+            self._remove(product_id)
+
+    def search(
+        self,
+        text: str,
+        loader: Callable[[], Iterable[tuple]] | None = None,
+        min_similarity: float = MIN_SIMILARITY,
+        version: int | None = None,
+    ) -> dict[int, float]:
+        """
+        Return `{product_id: similarity}` for every product matching `text`.
+
+        The similarity is the fraction of the query trigrams found in the product
+        name, or (weighted by BODY_WEIGHT) in name, description and tags. With a
+        `version`, an index built at another catalog version is rebuilt through `loader` first.
+        """
+        query_grams = trigrams(text)
+        if not query_grams:
+            return {}
+
+        with self._lock:
+            stale = not self._loaded or (version is not None and version != self._version)
+            if stale and loader is not None:
+                self.load(loader(), version)
+
+            name_hits: dict[int, int] = defaultdict(int)
+            body_hits: dict[int, int] = defaultdict(int)
+            for gram in query_grams:
+                for product_id in self._name_postings.get(gram, ()):
+                    name_hits[product_id] += 1
+                for product_id in self._body_postings.get(gram, ()):
+                    body_hits[product_id] += 1
+
+        total = len(query_grams)
+        scores = {}
+        for product_id, hits in body_hits.items():
+            score = max(name_hits.get(product_id, 0) / total, BODY_WEIGHT * hits / total)
+            if score >= min_similarity:
+                scores[product_id] = score
+        return scores
+
+    def _add(self, product_id, name, description, tags):
+        name_grams = trigrams(name)
+        body_grams = name_grams | trigrams(description) | trigrams(" ".join(str(tag) for tag in tags or []))
+        for gram in name_grams:
+            self._name_postings[gram].add(product_id)
+        for gram in body_grams:
+            self._body_postings[gram].add(product_id)
+        self._documents[product_id] = (name_grams, body_grams)
+
+    def _remove(self, product_id):
+        document = self._documents.pop(product_id, None)
+        if document is None:
+            return
+        for postings, grams in zip(
+            (self._name_postings, self._body_postings), document, strict=True
+        ):
+            for gram in grams:
+                postings[gram].discard(product_id)
+                if not postings[gram]:
+                    del postings[gram]
+
+
+product_search_index = ProductSearchIndex()
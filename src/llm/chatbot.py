@@ -10,11 +10,15 @@ from langchain_core.prompts import (
 from langgraph.graph import END, StateGraph
 from loguru import logger
 
+from src.database.database_instance.db_instance import session_scope
 from src.entities.product.product_crud import get_products_list
 from src.llm.llm_factory import LLMFactory
 from src.models.chat_model import ChatState, MessageClassifier
 from src.utilis.sys_utilis import read_yaml_file
 
+# Products put in the prompt of the product agent (the first page, by id)
+PRODUCTS_IN_PROMPT = 100
+
 
 class ChatbotGraph:
     def __init__(self):
@@ -80,7 +84,9 @@ class ChatbotGraph:
 
         user_message = state["messages"][-1].content
 
-        products_info = get_products_list()
+        # Own session, released before the LLM call instead of held for its duration
+        with session_scope():
+            products_info, _ = get_products_list(page=1, page_size=PRODUCTS_IN_PROMPT)
 
         system_message = SystemMessagePromptTemplate.from_template(self.config["products_system_message"])
         human_message = HumanMessagePromptTemplate.from_template("{user_message}")
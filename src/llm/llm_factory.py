@@ -4,6 +4,7 @@ from langchain_groq import ChatGroq
 from langchain_openai import AzureChatOpenAI, ChatOpenAI
 
 from src.config.llm_setting import llm_get_setting
+from src.observability.llm_metrics import LLMMetricsCallback
 
 
 class LLMFactory:
@@ -23,6 +24,7 @@ class LLMFactory:
                 "model": configuration.model,
                 "temperature": configuration.temperature,
                 "api_key": configuration.api_key,
+                "callbacks": [LLMMetricsCallback(provider, configuration.model)],
             }
             if configuration.max_tokens is not None:
                 params["max_tokens"] = configuration.max_tokens
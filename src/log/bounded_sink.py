@@ -0,0 +1,76 @@
+import queue
+import threading
+from collections.abc import Callable
+
+from src.observability.metrics import REGISTRY
+
+LOG_RECORDS_DROPPED = REGISTRY.counter(
+    "log_records_dropped_total", "Log records dropped because the background sink queue was full", ("sink",)
+)
+
+# Queued by stop(): the writer thread exits when it reaches it
+_STOP = object()
+# Most records joined into one write by the writer thread
+MAX_BATCH = 1_000
+
+
+class BoundedQueueSink:
+    """
+    Loguru sink writing the formatted records from a background thread.
+
+    The calling thread only puts the message on a bounded queue, so a slow disk
+    or terminal never blocks a request. When the queue is full (the writer cannot
+    keep up) the record is dropped and counted instead of growing memory or
+    making the caller wait. The writer thread drains whatever is queued and
+    hands it to `writer` as one string, so a burst costs one write, not one per record.
+    """
+
+    def __init__(self, name: str, writer: Callable[[str], object], maxsize: int = 10_000):
+        self.name = name
+        self._writer = writer
+        self._queue: queue.Queue[str | object] = queue.Queue(maxsize)
+        self._dropped = LOG_RECORDS_DROPPED.labels(name)
+        self._thread = threading.Thread(target=self._run, name=f"log-sink-{name}", daemon=True)
+        self._thread.start()
+
+    def write(self, message: str):
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self._dropped.inc()
+
+    @property
+    def pending(self) -> int:
+        """Records waiting to be written."""
+        return self._queue.qsize()
+
+    # Not called `flush`: loguru flushes stream sinks after every record
+    def join(self):
+        """Wait until every queued record has been written."""
+        self._queue.join()
+
+    def stop(self):
+        """Write the queued records, then end the writer thread. Remove the sink from loguru first."""
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < MAX_BATCH and batch[-1] is not _STOP:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = batch[-1] is _STOP
+            messages = batch[:-1] if stopping else batch
+            try:
+                if messages:
+                    self._writer("".join(messages))
+            except Exception:  # noqa: S110 - a sink must never raise into the app
+                pass
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stopping:
+                return
@@ -3,29 +3,79 @@ from pathlib import Path
 
 from loguru import logger
 
+from src.config.log_setting import LogSetting, get_log_setting
+from src.log.bounded_sink import BoundedQueueSink
+from src.log.rotating_file import RotatingFileWriter
 
-def  setup_logger():
+# Background sinks of the production mode, drained by flush_logger()
+_background_sinks: list[BoundedQueueSink] = []
+# Rotating file of the production mode, written by the file sink thread only
+_file_writer: RotatingFileWriter | None = None
+
+
+def  setup_logger(setting: LogSetting | None = None, log_directory: Path = Path("src/log")):
+    global _file_writer
     logger.remove()
+    # A previous production setup (tests, reloads): stop its threads and close its file
+    for sink in _background_sinks:
+        sink.stop()
+    _background_sinks.clear()
+    if _file_writer is not None:
+        _file_writer.close()
+        _file_writer = None
+    setting = setting or get_log_setting()
 
 
-    log_directory = Path("src/log")
     if not log_directory.exists():
         Path.mkdir(log_directory)
 
-    logger.add(
-        log_directory / "app.log",
-        rotation="10 MB",  # Ruota il file quando raggiunge 10MB
-        retention="1 week",  # Mantiene i log per una settimana
-        compression="zip",  # Comprime i file di log ruotati
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}",
-        level="DEBUG",
-        encoding="utf-8",
-    )
+    file_options = {
+        "rotation": "10 MB",  # Ruota il file quando raggiunge 10MB
+        "retention": "1 week",  # Mantiene i log per una settimana
+        "compression": "zip",  # Comprime i file di log ruotati
+        "encoding": "utf-8",
+    }
+    file_format = "{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}"
+    console_format = "<green>{time:HH:mm:ss}</green> | <level>{level}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | <level>{message}</level>"
+
+    if not setting.production:
+        logger.add(
+            log_directory / "app.log",
+            format=file_format,
+            level=setting.file_level,
+            **file_options,
+        )
+
+        # Configura il logger per la console
+        logger.add(
+            sys.stderr,
+            format=console_format,
+            level=setting.console_level,
+            colorize=True,
+        )
+        return
 
-    # Configura il logger per la console
-    logger.add(
-        sys.stderr,
-        format="<green>{time:HH:mm:ss}</green> | <level>{level}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | <level>{message}</level>",
-        level="INFO",
-        colorize=True,
+    # Production: records are formatted by the caller and written (and the file rotated)
+    # in batches by background threads through bounded queues that drop on overload.
+    # The file is written directly, not through a second loguru logger.
+    _file_writer = RotatingFileWriter(
+        log_directory / "app.log", max_bytes=10 * 1024 * 1024, retention_seconds=7 * 24 * 3600
     )
+    file_sink = BoundedQueueSink("file", _file_writer.write, setting.queue_size)
+    console_sink = BoundedQueueSink("console", sys.stderr.write, setting.queue_size)
+    _background_sinks[:] = [file_sink, console_sink]
+
+    # Variable values in tracebacks are expensive and may leak request data
+    logger.add(file_sink, format=file_format, level=setting.file_level, diagnose=False)
+    logger.add(console_sink, format=console_format, level=setting.console_level, colorize=True, diagnose=False)
+
+
+def flush_logger():
+    """Wait until the background sinks have written every queued record."""
+    for sink in _background_sinks:
+        sink.join()
+
+
+def background_queue_sizes() -> dict[str, int]:
+    """Records waiting in each background sink (empty in debug mode)."""
+    return {sink.name: sink.pending for sink in _background_sinks}
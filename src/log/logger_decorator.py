@@ -1,4 +1,6 @@
 import asyncio
+import random
+import reprlib
 import time
 from collections.abc import Callable
 from functools import wraps
@@ -6,40 +8,96 @@ from typing import Any
 
 from loguru import logger
 
+from src.config.log_setting import LogSetting, get_log_setting
 
-def frontier_logger() -> Callable:
+# Structural summary used in production: a few items per container, short strings
+_SUMMARY_REPR = reprlib.Repr(
+    maxlevel=2, maxlist=3, maxtuple=3, maxset=3, maxdict=3, maxstring=80, maxother=80
+)
+
+
+def summarize(value: Any, max_length: int) -> str:
+    """Short repr of `value`: containers show their size and first items, long text is cut."""
+    text = _SUMMARY_REPR.repr(value)
+    if isinstance(value, list | tuple | set | frozenset | dict):
+        text = f"<{type(value).__name__} len={len(value)}> {text}"
+    if len(text) > max_length:
+        text = text[: max_length - 3] + "..."
+    return text
+
+
+class _CallLogger:
+    """
+    Logging shared by the sync and async wrappers of a decorated function.
+
+    The bound logger is built once per function. Arguments and results are
+    formatted lazily (`opt(lazy=True)`), so nothing is stringified when the level
+    is disabled or the call is not sampled.
+    """
+
+    def __init__(self, func: Callable, layer: str, setting: LogSetting):
+        self.name = func.__name__
+        self.log = logger.bind(module=func.__module__, func=func.__name__, layer=layer)
+        # depth=1: records point at the wrapper calling the helpers below, as before
+        self.lazy = self.log.opt(lazy=True, depth=1)
+        self.sample_rate = setting.sample_rates.get(self.name, setting.default_sample_rate)
+        self.production = setting.production
+        self.max_length = setting.max_repr_length
+
+    def sampled(self) -> bool:
+        return self.sample_rate >= 1 or random.random() < self.sample_rate  # noqa: S311 - sampling, not security
+
+    def format(self, value: Any) -> Callable[[], Any]:
+        if self.production:
+            return lambda: summarize(value, self.max_length)
+        return lambda: value
+
+    def exception(self):
+        self.log.opt(depth=1).exception("EXCEPTION in {func}", func=self.name)
+
+
+def frontier_logger(setting: LogSetting | None = None) -> Callable:
     """
     Decorator per funzioni esposte dalle API.
     Logga ingresso, uscita, argomenti, risultato e eccezioni.
     Supporta funzioni sincrone e async.
+    In modalità production argomenti e risultato sono riassunti e le chiamate campionate.
     """
 
     def decorator(func: Callable) -> Callable:
+        call_log = _CallLogger(func, "frontier", setting or get_log_setting())
+
+        def enter(args, kwargs):
+            call_log.lazy.log(
+                "INFO",
+                "ENTER {func} args={args} kwargs={kwargs}",
+                func=lambda: call_log.name,
+                args=call_log.format(args),
+                kwargs=call_log.format(kwargs),
+            )
+
+        def exit_(result):
+            call_log.lazy.log(
+                "SUCCESS",
+                "EXIT {func} result={result}",
+                func=lambda: call_log.name,
+                result=call_log.format(result),
+            )
+
         if asyncio.iscoroutinefunction(func):
 
             @wraps(func)
             async def async_wrapper(*args, **kwargs) -> Any:
-                log = logger.bind(
-                    module=func.__module__, func=func.__name__, layer="frontier"
-                )
-                log.log(
-                    "INFO",
-                    "ENTER {func} args={args} kwargs={kwargs}",
-                    func=func.__name__,
-                    args=args,
-                    kwargs=kwargs,
-                )
+                sampled = call_log.sampled()
+                if sampled:
+                    enter(args, kwargs)
                 try:
                     result = await func(*args, **kwargs)
-                    log.log(
-                        "SUCCESS",
-                        "EXIT {func} result={result}",
-                        func=func.__name__,
-                        result=result,
-                    )
+                    if sampled:
+                        exit_(result)
                     return result
                 except Exception:
-                    log.exception("EXCEPTION in {func}", func=func.__name__)
+                    call_log.exception()
                     raise
 
             return async_wrapper
@@ -47,27 +105,16 @@ def frontier_logger() -> Callable:
 
             @wraps(func)
             def sync_wrapper(*args, **kwargs) -> Any:
-                log = logger.bind(
-                    module=func.__module__, func=func.__name__, layer="frontier"
-                )
-                log.log(
-                    "INFO",
-                    "ENTER {func} args={args} kwargs={kwargs}",
-                    func=func.__name__,
-                    args=args,
-                    kwargs=kwargs,
-                )
+                sampled = call_log.sampled()
+                if sampled:
+                    enter(args, kwargs)
                 try:
                     result = func(*args, **kwargs)
-                    log.log(
-                        "SUCCESS",
-                        "EXIT {func} result={result}",
-                        func=func.__name__,
-                        result=result,
-                    )
+                    if sampled:
+                        exit_(result)
                     return result
                 except Exception:
-                    log.exception("EXCEPTION in {func}", func=func.__name__)
+                    call_log.exception()
                     raise
 
             return sync_wrapper
@@ -75,35 +122,41 @@ def frontier_logger() -> Callable:
     return decorator
 
 
-def inner_logger() -> Callable:
+def inner_logger(setting: LogSetting | None = None) -> Callable:
     """
     Decorator per funzioni di supporto.
     Logga ingresso/uscita in modo meno verboso e misura il tempo di esecuzione.
     Supporta funzioni sincrone e async.
+    In modalità production le chiamate sono campionate.
     """
 
     def decorator(func: Callable) -> Callable:
+        call_log = _CallLogger(func, "inner", setting or get_log_setting())
+
+        def end(start):
+            elapsed = (time.perf_counter() - start) * 1000.0
+            call_log.log.opt(depth=1).log(
+                "SUCCESS",
+                "END {func} elapsed_ms={elapsed:.2f}",
+                func=call_log.name,
+                elapsed=elapsed,
+            )
+
         if asyncio.iscoroutinefunction(func):
 
             @wraps(func)
             async def async_wrapper(*args, **kwargs) -> Any:
-                log = logger.bind(
-                    module=func.__module__, func=func.__name__, layer="inner"
-                )
+                sampled = call_log.sampled()
                 start = time.perf_counter()
-                log.log("INFO", "START {func}", func=func.__name__)
+                if sampled:
+                    call_log.log.log("INFO", "START {func}", func=call_log.name)
                 try:
                     result = await func(*args, **kwargs)
-                    elapsed = (time.perf_counter() - start) * 1000.0
-                    log.log(
-                        "SUCCESS",
-                        "END {func} elapsed_ms={elapsed:.2f}",
-                        func=func.__name__,
-                        elapsed=elapsed,
-                    )
+                    if sampled:
+                        end(start)
                     return result
                 except Exception:
-                    log.exception("EXCEPTION in {func}", func=func.__name__)
+                    call_log.exception()
                     raise
 
             return async_wrapper
@@ -111,23 +164,17 @@ def inner_logger() -> Callable:
 
             @wraps(func)
             def sync_wrapper(*args, **kwargs) -> Any:
-                log = logger.bind(
-                    module=func.__module__, func=func.__name__, layer="inner"
-                )
+                sampled = call_log.sampled()
                 start = time.perf_counter()
-                log.log("INFO", "START {func}", func=func.__name__)
+                if sampled:
+                    call_log.log.log("INFO", "START {func}", func=call_log.name)
                 try:
                     result = func(*args, **kwargs)
-                    elapsed = (time.perf_counter() - start) * 1000.0
-                    log.log(
-                        "SUCCESS",
-                        "END {func} elapsed_ms={elapsed:.2f}",
-                        func=func.__name__,
-                        elapsed=elapsed,
-                    )
+                    if sampled:
+                        end(start)
                     return result
                 except Exception:
-                    log.exception("EXCEPTION in {func}", func=func.__name__)
+                    call_log.exception()
                     raise
 
             return sync_wrapper
@@ -0,0 +1,59 @@
+import time
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+
+class RotatingFileWriter:
+    """
+    Append-only log file rotated by size, the rotated files zipped and kept for `retention_seconds`.
+
+    The file of the production mode: it is written by the file sink thread only,
+    with whole batches of formatted records, so it needs no lock and no second
+    pass through loguru. The rotated files are named like loguru's
+    (`app.2026-10-18_12-00-00_000000.log.zip`), so both modes clean up the same files.
+    """
+
+    def __init__(self, path: Path, max_bytes: int, retention_seconds: float, encoding: str = "utf-8"):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.retention_seconds = retention_seconds
+        self.encoding = encoding
+        self._file = None
+        self._size = 0
+
+    def write(self, text: str):
+        if self._file is None:
+            self._open()
+        data = text.encode(self.encoding)
+        if self._size and self._size + len(data) > self.max_bytes:
+            self._rotate()
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self):
+        self._file = self.path.open("ab")
+        self._size = self._file.tell()
+
+    def _rotate(self):
+        self.close()
+        stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f")
+        rotated = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}")
+        self.path.rename(rotated)
+        with zipfile.ZipFile(f"{rotated}.zip", "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.write(rotated, rotated.name)
+        rotated.unlink()
+        self._remove_expired()
+        self._open()
+
+    def _remove_expired(self):
+        expired = time.time() - self.retention_seconds
+        for file in self.path.parent.glob(f"{self.path.stem}.*{self.path.suffix}.zip"):
+            if file.stat().st_mtime < expired:
+                file.unlink(missing_ok=True)
@@ -1,16 +1,21 @@
 from contextlib import asynccontextmanager
 
 import uvicorn
-from fastapi import FastAPI, status
+from fastapi import FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 
+from src.api.v1.admin_endpoints import admin_router
 from src.api.v1.cetegory_endpoints import category_router
 from src.api.v1.chatbot_endpoints import chatbot_router
 from src.api.v1.product_endpoint import product_router
 from src.llm.llm_factory import setup_llm
-from src.log.logger import setup_logger
+from src.log.logger import flush_logger, setup_logger
 from src.models.response_models import HealthResponse
+from src.observability.metrics import REGISTRY
+from src.observability.middleware import MetricsMiddleware
+from src.observability.profiling import ProfilingMiddleware
+from src.observability.query_tracker import QueryTrackingMiddleware
 
 
 @asynccontextmanager
@@ -19,6 +24,8 @@ async def lifespan(app: FastAPI):
     setup_llm()
     logger.success("🚀 Avvio dell'applicazione...")
     yield
+    # Write the records still queued for the background sinks
+    flush_logger()
 
 
 # Initialize FastAPI app
@@ -37,10 +44,15 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(QueryTrackingMiddleware)
+# Added last so it is the outermost middleware and also times CORS handling
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(router=product_router)
 app.include_router(router=category_router)
 app.include_router(router=chatbot_router)
+app.include_router(router=admin_router)
 
 @app.get("/health_check/",
          status_code=status.HTTP_200_OK,
@@ -51,6 +63,15 @@ def health_check():
     )
 
 
+@app.get("/metrics",
+         include_in_schema=False)
+def metrics():
+    return Response(
+        content=REGISTRY.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 def main():
     uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
 
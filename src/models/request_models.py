@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Literal
 
 from pydantic import BaseModel
@@ -33,8 +34,35 @@ class GetFilteredProductsRequest(BaseModel):
         category_filter: list[str] | None
         min_max_price_filter: tuple[float, float] | None
         sort_by: tuple[Literal["price", "date"], Literal["asc", "desc"]] | None
+        # Products with at least one of / every one of the given tags
+        tags_any: list[str] | None = None
+        tags_all: list[str] | None = None
+        created_after: datetime | None = None
+        created_before: datetime | None = None
         page: int = 1
         page_size: int = 5
+        # Also return category counts, price bounds and a price histogram of the matches
+        facets: bool = False
+
+
+# Bulk product request models
+# Products are selected either by id or with the same filter used by get_filtered_products
+# (pagination and sorting are ignored); the whole catalog only with an explicit all=True
+class BulkUpdateProductsRequest(BaseModel):
+    ids: list[int] | None = None
+    product_filter: GetFilteredProductsRequest | None = None
+    all: bool = False
+    name: str | None = None
+    price: float | None = None
+    price_multiplier: float | None = None
+    categories_name: list[str] | None = None
+    tags: list[str] | None = None
+    description: str | None = None
+
+class BulkDeleteProductsRequest(BaseModel):
+    ids: list[int] | None = None
+    product_filter: GetFilteredProductsRequest | None = None
+    all: bool = False
 
 
 # Category-related request models
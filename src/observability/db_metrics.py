@@ -0,0 +1,96 @@
+import time
+
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from src.observability.metrics import REGISTRY
+
+DB_POOL_EVENTS = REGISTRY.counter(
+    "db_pool_events_total", "Connection pool events (connect, checkout, checkin, invalidate)", ("event",)
+)
+DB_POOL_CHECKOUT_WAIT = REGISTRY.histogram(
+    "db_pool_checkout_wait_seconds", "Time a checkout waited for a pooled connection (or for a new one to open)",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+DB_POOL_WAITING = REGISTRY.gauge(
+    "db_pool_waiting_checkouts", "Checkouts currently waiting for a connection"
+)
+DB_POOL_TIMEOUTS = REGISTRY.counter(
+    "db_pool_checkout_timeouts_total", "Checkouts that gave up after pool_timeout seconds"
+)
+
+# Instrumented engines with the max_overflow their pool was configured with
+_engines: list[tuple[Engine, int | None]] = []
+
+
+def _pool_connections() -> dict:
+    stats = {}
+    for engine, _ in _engines:
+        pool = engine.pool
+        if not isinstance(pool, QueuePool):
+            continue
+        stats[("checked_out",)] = stats.get(("checked_out",), 0) + pool.checkedout()
+        stats[("checked_in",)] = stats.get(("checked_in",), 0) + pool.checkedin()
+        stats[("overflow",)] = stats.get(("overflow",), 0) + max(pool.overflow(), 0)
+        stats[("size",)] = stats.get(("size",), 0) + pool.size()
+    return stats
+
+
+def _pool_saturation() -> dict:
+    # Share of the pool capacity (size + max_overflow) checked out, for the most
+    # saturated engine: at 1 new checkouts wait
+    ratios = [
+        engine.pool.checkedout() / (engine.pool.size() + max_overflow)
+        for engine, max_overflow in _engines
+        if isinstance(engine.pool, QueuePool) and max_overflow is not None and max_overflow >= 0
+    ]
+    return {(): max(ratios)} if ratios else {}
+
+
+REGISTRY.callback_gauge(
+    "db_pool_connections",
+    "Connections of the QueuePool by state (size is the configured pool size)",
+    ("state",),
+    _pool_connections,
+)
+REGISTRY.callback_gauge(
+    "db_pool_saturation",
+    "Checked out connections over the pool capacity (pool size + max overflow)",
+    (),
+    _pool_saturation,
+)
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool measuring how long each checkout waits for a connection.
+
+    The wait covers the time blocked on an exhausted pool and the opening of a
+    new connection; `recreate` (on dispose or invalidation) keeps the class.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        DB_POOL_WAITING.inc()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DB_POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_WAITING.dec()
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+
+def instrument_engine(engine: Engine, max_overflow: int | None = None):
+    """
+    Expose the connection pool of `engine` on /metrics.
+
+    `max_overflow` is the one the pool was created with (DB_MAX_OVERFLOW): the
+    saturation is only reported for a pool whose capacity is known.
+    """
+    _engines.append((engine, max_overflow))
+    for name in ("connect", "checkout", "checkin", "invalidate"):
+        counter = DB_POOL_EVENTS.labels(name)
+        event.listen(engine.pool, name, lambda *_, counter=counter: counter.inc())
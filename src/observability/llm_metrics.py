@@ -0,0 +1,62 @@
+import time
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from src.observability.metrics import REGISTRY
+
+LLM_CALLS = REGISTRY.counter(
+    "llm_calls_total", "LLM calls by provider, model and outcome", ("provider", "model", "outcome")
+)
+LLM_LATENCY = REGISTRY.histogram(
+    "llm_call_duration_seconds", "Duration of a single LLM call", ("provider", "model")
+)
+LLM_TOKENS = REGISTRY.counter(
+    "llm_tokens_total", "Tokens reported by the LLM provider", ("provider", "model", "kind")
+)
+
+
+class LLMMetricsCallback(BaseCallbackHandler):
+    """
+    LangChain callback timing every call of the configured chat model.
+
+    It is attached to the model itself, so the classification and the agent
+    calls of the chatbot graph are measured one by one.
+    """
+
+    def __init__(self, provider: str, model: str):
+        self.provider = provider
+        self.model = model
+        self._started: dict[UUID, float] = {}
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, **kwargs: Any):
+        self._started[run_id] = time.perf_counter()
+
+    def on_llm_start(self, serialized, prompts, *, run_id: UUID, **kwargs: Any):
+        self._started[run_id] = time.perf_counter()
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any):
+        self._finish(run_id, "success")
+        for kind, tokens in _token_usage(response).items():
+            LLM_TOKENS.labels(self.provider, self.model, kind).inc(tokens)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        self._finish(run_id, "error")
+
+    def _finish(self, run_id: UUID, outcome: str):
+        started = self._started.pop(run_id, None)
+        if started is not None:
+            LLM_LATENCY.labels(self.provider, self.model).observe(time.perf_counter() - started)
+        LLM_CALLS.labels(self.provider, self.model, outcome).inc()
+
+
+def _token_usage(response: LLMResult) -> dict[str, int]:
+    usage = {"input": 0, "output": 0}
+    for generations in response.generations:
+        for generation in generations:
+            metadata = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+            usage["input"] += metadata.get("input_tokens", 0)
+            usage["output"] += metadata.get("output_tokens", 0)
+    return {kind: tokens for kind, tokens in usage.items() if tokens}
@@ -0,0 +1,157 @@
+import gc
+import sys
+import threading
+import tracemalloc
+from collections import OrderedDict
+from pathlib import Path
+
+from langchain_core.messages import BaseMessage
+from sqlalchemy.orm import Session
+
+from src.entities.category.category_entity import Category
+from src.entities.product.product_entity import Product
+from src.log.logger import background_queue_sizes
+
+# Named snapshots kept in memory; taking one more drops the oldest
+MAX_SNAPSHOTS = 10
+# Allocations of tracemalloc itself and of the import machinery are noise in a diff
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+TRACKED_TYPES = {"Product": Product, "Category": Category, "BaseMessage": BaseMessage}
+
+
+class MemoryInspector:
+    """
+    tracemalloc snapshots and live object counts of the running process.
+
+    Tracing is off until `start` is called (it slows allocations down and keeps a
+    traceback per block), so a leak can be investigated on a live worker: start,
+    snapshot, let traffic run, snapshot again and diff the two.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshots: OrderedDict[str, tracemalloc.Snapshot] = OrderedDict()
+
+    def start(self, frames: int) -> dict:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        return self.status()
+
+    def stop(self) -> dict:
+        with self._lock:
+            self._snapshots.clear()
+        tracemalloc.stop()
+        return self.status()
+
+    def status(self) -> dict:
+        current, peak = tracemalloc.get_traced_memory()
+        with self._lock:
+            snapshots = list(self._snapshots)
+        return {
+            "tracing": tracemalloc.is_tracing(),
+            "frames": tracemalloc.get_traceback_limit(),
+            "traced_kb": round(current / 1024, 1),
+            "traced_peak_kb": round(peak / 1024, 1),
+            "snapshots": snapshots,
+            **_process_memory(),
+        }
+
+    def take_snapshot(self, name: str) -> dict:
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc is not tracing: start it first")
+        snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        with self._lock:
+            self._snapshots.pop(name, None)
+            self._snapshots[name] = snapshot
+            while len(self._snapshots) > MAX_SNAPSHOTS:
+                self._snapshots.popitem(last=False)
+        return {"name": name, "traced_kb": round(sum(stat.size for stat in snapshot.statistics("filename")) / 1024, 1)}
+
+    def diff(self, base: str, target: str | None, top: int, group_by: str) -> dict:
+        """Top `top` allocation differences from snapshot `base` to `target` (a new snapshot when None)."""
+        with self._lock:
+            base_snapshot = self._snapshots.get(base)
+            target_snapshot = self._snapshots.get(target) if target else None
+        if base_snapshot is None:
+            raise KeyError(f"Snapshot {base!r} not found")
+        if target and target_snapshot is None:
+            raise KeyError(f"Snapshot {target!r} not found")
+        if target_snapshot is None:
+            if not tracemalloc.is_tracing():
+                raise RuntimeError("tracemalloc is not tracing: start it first")
+            target_snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+        stats = target_snapshot.compare_to(base_snapshot, group_by)
+        return {
+            "base": base,
+            "target": target or "<now>",
+            "total_diff_kb": round(sum(stat.size_diff for stat in stats) / 1024, 1),
+            "top": [
+                {
+                    "location": _location(stat.traceback, group_by),
+                    "size_diff_kb": round(stat.size_diff / 1024, 1),
+                    "size_kb": round(stat.size / 1024, 1),
+                    "count_diff": stat.count_diff,
+                    "count": stat.count,
+                }
+                for stat in stats[:top]
+            ],
+        }
+
+
+def _location(traceback: tracemalloc.Traceback, group_by: str) -> str:
+    frame = traceback[0]
+    return frame.filename if group_by == "filename" else f"{frame.filename}:{frame.lineno}"
+
+
+def _process_memory() -> dict:
+    memory = {"max_rss_kb": None, "rss_kb": None}
+    # resource is Unix only: on Windows the RSS is not reported
+    if sys.platform == "win32":
+        return memory
+    import resource
+
+    # ru_maxrss is in KiB on Linux; the current RSS comes from /proc when available
+    memory["max_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    statm = Path("/proc/self/statm")
+    if statm.exists():
+        pages = int(statm.read_text().split()[1])
+        memory["rss_kb"] = pages * resource.getpagesize() // 1024
+    return memory
+
+
+def object_counts() -> dict:
+    """Live instances of the catalog entities and chat messages, and what the open sessions hold."""
+    counts = dict.fromkeys(TRACKED_TYPES, 0)
+    sessions = identity_map = 0
+    # Matched on the MRO of each type (cached), not with isinstance: pydantic's
+    # __instancecheck__ probes attributes of every object and some of them raise
+    matches: dict[type, list[str]] = {}
+    for obj in gc.get_objects():
+        obj_type = type(obj)
+        names = matches.get(obj_type)
+        if names is None:
+            names = matches[obj_type] = [
+                name for name, cls in TRACKED_TYPES.items() if cls in obj_type.__mro__
+            ]
+        for name in names:
+            counts[name] += 1
+        if Session in obj_type.__mro__:
+            sessions += 1
+            identity_map += len(obj.identity_map)
+    return {
+        "objects": counts,
+        "sessions": sessions,
+        "session_identity_map_size": identity_map,
+        "log_queue_sizes": background_queue_sizes(),
+        "gc_counts": gc.get_count(),
+        **_process_memory(),
+    }
+
+
+memory_inspector = MemoryInspector()
@@ -0,0 +1,201 @@
+import asyncio
+import cProfile
+import random
+import re
+import threading
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from pathlib import Path
+from typing import Any
+
+from fastapi.routing import APIRoute
+from loguru import logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.observability_setting import get_observability_setting
+from src.observability.middleware import route_template
+
+_SLUG = re.compile(r"[^A-Za-z0-9]+")
+
+
+@dataclass
+class ProfileRequest:
+    """Marks the current request for profiling; `path` is set once the profile is written."""
+
+    scope: Scope
+    path: Path | None = None
+
+    @property
+    def label(self) -> tuple[str, str]:
+        # The router stores the matched route in the scope before calling the endpoint
+        return self.scope["method"], route_template(self.scope)
+
+
+# Set by ProfilingMiddleware; sync endpoints see it through the copied request context
+_profile_request: ContextVar[ProfileRequest | None] = ContextVar("profile_request", default=None)
+
+# Only one profiler can be active in a process (Python 3.12+ refuses a second one):
+# a request arriving while another is being profiled is simply not profiled
+_profiler_lock = threading.Lock()
+_rotation_lock = threading.Lock()
+
+
+class ProfileStore:
+    """Directory of `.pstats` files keeping only the `max_files` most recent ones."""
+
+    def __init__(self, directory: str, max_files: int):
+        self.directory = Path(directory)
+        self.max_files = max_files
+
+    def save(self, profiler: cProfile.Profile, request: ProfileRequest, elapsed: float) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        method, route = request.label
+        slug = _SLUG.sub("_", route).strip("_") or "root"
+        stamp = f"{time.strftime('%Y%m%dT%H%M%S')}-{time.time_ns() % 1_000_000:06d}"
+        path = self.directory / f"{stamp}-{method}-{slug}-{elapsed * 1000:.0f}ms.pstats"
+        profiler.dump_stats(path)
+        self._rotate()
+        return path
+
+    def _rotate(self):
+        with _rotation_lock:
+            files = sorted(self.directory.glob("*.pstats"), key=lambda file: file.stat().st_mtime)
+            for file in files[: max(len(files) - self.max_files, 0)]:
+                file.unlink(missing_ok=True)
+
+
+def _run_profiled(call: Callable[[], Any], request: ProfileRequest, store: ProfileStore) -> Any:
+    """
+    Run a sync endpoint under cProfile, from the threadpool worker running it.
+
+    Since Python 3.12 cProfile is built on sys.monitoring, which is process-wide:
+    the event loop and the other threadpool workers running meanwhile end up in
+    the same profile, so profile under low concurrency to read it cleanly.
+    """
+    if not _profiler_lock.acquire(blocking=False):
+        return call()
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    try:
+        profiler.enable()
+        try:
+            return call()
+        finally:
+            profiler.disable()
+            request.path = store.save(profiler, request, time.perf_counter() - start)
+    finally:
+        _profiler_lock.release()
+
+
+async def _run_profiled_async(call, request: ProfileRequest, store: ProfileStore) -> Any:
+    """
+    Profile a coroutine endpoint on the event loop thread.
+
+    Other coroutines interleaved at its await points, and the threadpool workers
+    running meanwhile, end up in the same profile; for `chat_with_bot` the time
+    is dominated by the LLM calls it makes inline.
+    """
+    if not _profiler_lock.acquire(blocking=False):
+        return await call()
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    try:
+        profiler.enable()
+        try:
+            return await call()
+        finally:
+            profiler.disable()
+            request.path = store.save(profiler, request, time.perf_counter() - start)
+    finally:
+        _profiler_lock.release()
+
+
+class ProfilingRoute(APIRoute):
+    """
+    APIRoute profiling its endpoint when ProfilingMiddleware selected the request.
+
+    The endpoint itself is wrapped, so a sync endpoint is profiled inside the
+    threadpool worker that runs it and an async one on the event loop. The
+    profiler still sees every thread of the process, so concurrent requests
+    show up in the profile. With profiling disabled in config the endpoint is
+    left untouched.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs):
+        setting = get_observability_setting()
+        # include_router re-creates the routes with the already wrapped endpoint
+        if setting.profiling_enabled and not getattr(endpoint, "_profiled", False):
+            endpoint = _profiled_endpoint(endpoint, ProfileStore(setting.profiling_dir, setting.profiling_max_files))
+        super().__init__(path, endpoint, **kwargs)
+
+
+def _profiled_endpoint(endpoint: Callable[..., Any], store: ProfileStore) -> Callable[..., Any]:
+    # functools.wraps keeps the signature FastAPI reads the parameters from
+    if asyncio.iscoroutinefunction(endpoint):
+
+        @wraps(endpoint)
+        async def async_endpoint(*args, **kwargs):
+            request = _profile_request.get()
+            if request is None:
+                return await endpoint(*args, **kwargs)
+            return await _run_profiled_async(lambda: endpoint(*args, **kwargs), request, store)
+
+        async_endpoint._profiled = True
+        return async_endpoint
+
+    @wraps(endpoint)
+    def sync_endpoint(*args, **kwargs):
+        request = _profile_request.get()
+        if request is None:
+            return endpoint(*args, **kwargs)
+        return _run_profiled(lambda: endpoint(*args, **kwargs), request, store)
+
+    sync_endpoint._profiled = True
+    return sync_endpoint
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI middleware selecting the requests to profile.
+
+    A request is profiled when it carries the configured header (e.g.
+    `X-Profile: 1`) or is drawn with `profiling_sample_rate`. The profile is
+    taken by ProfilingRoute around the endpoint and its file name is returned in
+    the `X-Profile-File` response header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        setting = get_observability_setting()
+        self.enabled = setting.profiling_enabled
+        self.header = setting.profiling_header.lower().encode()
+        self.sample_rate = setting.profiling_sample_rate
+
+    def _selected(self, scope: Scope) -> bool:
+        if any(name == self.header and value not in (b"", b"0") for name, value in scope["headers"]):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate  # noqa: S311 - sampling, not security
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if not self.enabled or scope["type"] != "http" or not self._selected(scope):
+            await self.app(scope, receive, send)
+            return
+
+        request = ProfileRequest(scope)
+        token = _profile_request.set(request)
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start" and request.path is not None:
+                message["headers"] = [*message.get("headers", []), (b"x-profile-file", request.path.name.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _profile_request.reset(token)
+            if request.path is not None:
+                method, route = request.label
+                logger.info(f"Profile of {method} {route} saved to {request.path}")
@@ -0,0 +1,191 @@
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from loguru import logger
+from sqlalchemy import Engine, event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.observability_setting import get_observability_setting
+from src.observability.metrics import REGISTRY
+from src.observability.middleware import route_template
+
+DB_STATEMENTS = REGISTRY.counter(
+    "db_statements_total", "SQL statements executed, by operation", ("operation",)
+)
+DB_STATEMENT_LATENCY = REGISTRY.histogram(
+    "db_statement_duration_seconds", "Execution time of a single SQL statement", ("operation",)
+)
+DB_SLOW_STATEMENTS = REGISTRY.counter(
+    "db_slow_statements_total", "SQL statements slower than slow_query_ms", ("operation",)
+)
+DB_REQUEST_STATEMENTS = REGISTRY.histogram(
+    "db_statements_per_request", "SQL statements executed by one HTTP request", ("route",),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 500),
+)
+DB_REQUEST_TIME = REGISTRY.histogram(
+    "db_time_per_request_seconds", "Time spent executing SQL by one HTTP request", ("route",)
+)
+DB_N_PLUS_ONE = REGISTRY.counter(
+    "db_n_plus_one_suspected_total", "Requests repeating the same statement n_plus_one_threshold times", ("route",)
+)
+
+OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "COPY"}
+
+
+@dataclass
+class RequestQueries:
+    """SQL statements executed while serving one request."""
+
+    count: int = 0
+    seconds: float = 0.0
+    templates: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed: float):
+        self.count += 1
+        self.seconds += elapsed
+        self.templates[statement] += 1
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Statements executed at least `threshold` times: the signature of an N+1."""
+        return {statement: count for statement, count in self.templates.items() if count >= threshold}
+
+
+# Set by QueryTrackingMiddleware. Sync endpoints run in the threadpool with a copy
+# of the request context, so they see (and update) the same RequestQueries
+_current_request: ContextVar[RequestQueries | None] = ContextVar("current_request_queries", default=None)
+
+
+def current_request_queries() -> RequestQueries | None:
+    return _current_request.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[RequestQueries]:
+    """Record the statements of the instrumented engines executed inside the block, like a request."""
+    queries = RequestQueries()
+    token = _current_request.set(queries)
+    try:
+        yield queries
+    finally:
+        _current_request.reset(token)
+
+
+def operation_of(statement: str) -> str:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return keyword if keyword in OPERATIONS else "OTHER"
+
+
+def parameter_shape(parameters, executemany: bool = False) -> str:
+    """Types (never values) of the bound parameters, e.g. `{id_1: int, name_1: str}`."""
+    if executemany and isinstance(parameters, list | tuple):
+        first = parameter_shape(parameters[0]) if parameters else "()"
+        return f"{len(parameters)} x {first}"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{name}: {_value_shape(value)}" for name, value in parameters.items()) + "}"
+    if isinstance(parameters, list | tuple):
+        return "(" + ", ".join(_value_shape(value) for value in parameters) + ")"
+    return type(parameters).__name__
+
+
+def _value_shape(value) -> str:
+    if isinstance(value, list | tuple | set):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+def instrument_queries(engine: Engine):
+    """Time every statement of `engine`, feeding the metrics, the slow query log and the current request."""
+    slow_seconds = get_observability_setting().slow_query_ms / 1000
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _end(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        operation = operation_of(statement)
+        DB_STATEMENTS.labels(operation).inc()
+        DB_STATEMENT_LATENCY.labels(operation).observe(elapsed)
+
+        request = _current_request.get()
+        if request is not None:
+            request.record(statement, elapsed)
+
+        if elapsed >= slow_seconds:
+            DB_SLOW_STATEMENTS.labels(operation).inc()
+            logger.warning(
+                "Slow query ({elapsed_ms:.1f} ms): {statement} params={params}",
+                elapsed_ms=elapsed * 1000,
+                statement=" ".join(statement.split())[:1000],
+                params=parameter_shape(parameters, executemany),
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        # after_cursor_execute is not called for a failed statement
+        start_times = context.connection.info.get("query_start_time") if context.connection else None
+        if start_times:
+            start_times.pop()
+
+
+class QueryTrackingMiddleware:
+    """
+    Pure ASGI middleware counting the SQL statements and DB time of every HTTP request.
+
+    The totals go to the per-route histograms; statements repeated at least
+    `n_plus_one_threshold` times are logged as suspected N+1. With `debug_headers`
+    the totals are also returned in X-DB-* response headers.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        setting = get_observability_setting()
+        self.debug_headers = setting.debug_headers
+        self.n_plus_one_threshold = setting.n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = RequestQueries()
+        token = _current_request.set(queries)
+
+        async def send_wrapper(message: Message):
+            if self.debug_headers and message["type"] == "http.response.start":
+                repeated = queries.repeated(self.n_plus_one_threshold)
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-db-query-count", str(queries.count).encode()),
+                    (b"x-db-query-time-ms", f"{queries.seconds * 1000:.2f}".encode()),
+                    (b"x-db-n-plus-one", str(len(repeated)).encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_request.reset(token)
+            self._report(scope, queries)
+
+    def _report(self, scope: Scope, queries: RequestQueries):
+        route = route_template(scope)
+        DB_REQUEST_STATEMENTS.labels(route).observe(queries.count)
+        DB_REQUEST_TIME.labels(route).observe(queries.seconds)
+
+        repeated = queries.repeated(self.n_plus_one_threshold)
+        if repeated:
+            DB_N_PLUS_ONE.labels(route).inc()
+            for statement, count in repeated.items():
+                logger.warning(
+                    "Suspected N+1 in {method} {route}: {count} executions of {statement}",
+                    method=scope["method"],
+                    route=route,
+                    count=count,
+                    statement=" ".join(statement.split())[:500],
+                )
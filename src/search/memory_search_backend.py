@@ -0,0 +1,52 @@
+from sqlalchemy import Select, case, literal
+from sqlalchemy.sql import ColumnElement
+
+from src.cache.cache_factory import catalog_version
+from src.database.database_instance.db_instance import db_session
+from src.entities.counter.counter_crud import written_catalog_version
+from src.entities.product.product_entity import Product
+from src.entities.product.product_search_index import product_search_index
+from src.search.search_backend import SearchBackend
+
+
+class MemorySearchBackend(SearchBackend):
+    """
+    Search backend on top of the in-process trigram index.
+
+    Candidates and their similarity are computed in Python and pushed into the
+    query as an `IN` list plus a `CASE` rank, so it suits small catalogs and
+    databases without native text search. The index is per process: it is
+    rebuilt on the next search whenever the catalog version moved because of a
+    write it did not see (another worker, a script, `copy_products`).
+    """
+
+    def apply(self, query: Select, text: str) -> tuple[Select, ColumnElement]:
+        scores = product_search_index.search(text, loader=self._load_documents, version=catalog_version())
+        if not scores:
+            return query.filter(literal(False)), literal(0.0)
+        rank = case(scores, value=Product.id, else_=0.0)
+        return query.filter(Product.id.in_(scores.keys())), rank
+
+    def index_product(self, product_id, name, description, tags):
+        product_search_index.add(product_id, name, description, tags)
+        product_search_index.account_write(written_catalog_version())
+
+    def remove_product(self, product_id):
+        product_search_index.remove(product_id)
+        product_search_index.account_write(written_catalog_version())
+
+    def refresh_products(self, product_ids):
+        if not product_search_index.loaded:
+            return
+        rows = db_session.query(
+            Product.id, Product.name, Product.description, Product.tags
+        ).filter(Product.id.in_(product_ids))
+        for product_id, name, description, tags in rows:
+            product_search_index.add(product_id, name, description, tags)
+        product_search_index.account_write(written_catalog_version())
+
+    @staticmethod
+    def _load_documents():
+        return db_session.query(
+            Product.id, Product.name, Product.description, Product.tags
+        ).yield_per(1000)
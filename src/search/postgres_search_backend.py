@@ -0,0 +1,39 @@
+from sqlalchemy import Float, Select, bindparam, func, literal_column
+from sqlalchemy.sql import ColumnElement
+
+from src.entities.product.product_entity import Product
+from src.search.search_backend import SearchBackend
+
+# Must stay identical to the expression of the `ix_Products_search_document` GIN
+# index (see alembic/versions/0002_product_search_indexes.py), otherwise the
+# planner cannot use the index.
+SEARCH_DOCUMENT_SQL = (
+    "to_tsvector('simple'::regconfig, "
+    "coalesce(\"Products\".name, '') || ' ' || "
+    "coalesce(\"Products\".description, '') || ' ' || "
+    "coalesce(\"Products\".tags::text, ''))"
+)
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    Postgres full-text search backend.
+
+    A product matches when its name/description/tags document matches the query
+    (`tsvector @@ tsquery`, GIN index) or when the query is word-similar to the
+    name (`pg_trgm` `%>`, GIN trigram index). The rank is the best of `ts_rank`
+    and `word_similarity`.
+    """
+
+    def apply(self, query: Select, text: str) -> tuple[Select, ColumnElement]:
+        document = literal_column(SEARCH_DOCUMENT_SQL)
+        search_text = bindparam("search_text", text)
+        ts_query = func.websearch_to_tsquery(literal_column("'simple'::regconfig"), search_text)
+
+        matches = document.op("@@")(ts_query) | Product.name.op("%>")(search_text)
+        rank = func.greatest(
+            func.ts_rank(document, ts_query),
+            func.word_similarity(search_text, Product.name),
+            type_=Float,
+        )
+        return query.filter(matches), rank
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+from sqlalchemy import Select
+from sqlalchemy.sql import ColumnElement
+
+
+class SearchBackend(ABC):
+    """
+    Text search strategy used by `get_filtered_products`.
+
+    A backend restricts a product query to the rows matching a text and returns
+    a relevance expression, so that filtering, ranking and pagination are all
+    part of the same SQL statement.
+    """
+
+    @abstractmethod
+    def apply(self, query: Select, text: str) -> tuple[Select, ColumnElement]:
+        """Return `query` restricted to the products matching `text` and the rank expression (higher is better)."""
+
+    def index_product(self, product_id: int, name: str | None, description: str | None, tags: list | None):  # noqa: B027
+        """Called after a product is created or updated. Database-native backends keep their index on their own."""
+
+    def remove_product(self, product_id: int):  # noqa: B027
+        """Called after a product is deleted."""
+
+    def refresh_products(self, product_ids: list[int]):  # noqa: B027
+        """Called after a bulk update changed the searchable fields of `product_ids`."""
@@ -0,0 +1,20 @@
+from src.config.db_setting import get_setting
+from src.search.memory_search_backend import MemorySearchBackend
+from src.search.postgres_search_backend import PostgresSearchBackend
+from src.search.search_backend import SearchBackend
+from src.search.sqlite_search_backend import SqliteSearchBackend
+
+
+class SearchBackendFactory:
+    _instance = None
+
+    @classmethod
+    def get_search_backend(cls) -> SearchBackend:
+        if cls._instance is None:
+            backends = {
+                "postgres": PostgresSearchBackend,
+                "sqlite": SqliteSearchBackend,
+                "memory": MemorySearchBackend,
+            }
+            cls._instance = backends[get_setting().SEARCH_BACKEND]()
+        return cls._instance
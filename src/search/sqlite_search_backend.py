@@ -0,0 +1,80 @@
+import threading
+
+from loguru import logger
+from sqlalchemy import Select, literal_column, select, table, text
+from sqlalchemy.sql import ColumnElement
+
+from src.database.database_instance.db_instance import db_session
+from src.entities.product.product_entity import Product
+from src.search.search_backend import SearchBackend
+
+_FTS_TABLE = "products_fts"
+
+# External-content FTS5 table kept in sync with "Products" by triggers. The trigram
+# tokenizer (SQLite >= 3.34) gives substring matching similar to pg_trgm.
+_FTS_DDL = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(
+        name, description, tags, content='Products', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON "Products" BEGIN
+        INSERT INTO products_fts(rowid, name, description, tags)
+        VALUES (new.id, new.name, new.description, new.tags);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON "Products" BEGIN
+        INSERT INTO products_fts(products_fts, rowid, name, description, tags)
+        VALUES ('delete', old.id, old.name, old.description, old.tags);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE ON "Products" BEGIN
+        INSERT INTO products_fts(products_fts, rowid, name, description, tags)
+        VALUES ('delete', old.id, old.name, old.description, old.tags);
+        INSERT INTO products_fts(rowid, name, description, tags)
+        VALUES (new.id, new.name, new.description, new.tags);
+    END""",
+)
+
+
+class SqliteSearchBackend(SearchBackend):
+    """
+    SQLite FTS5 search backend, meant for local development and tests.
+
+    The FTS table and its triggers are created (and populated) on first use, as
+    SQLite databases are not managed by the Alembic migrations.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ready = False
+        self._fts = table(_FTS_TABLE, literal_column("rowid"))
+
+    def apply(self, query: Select, text: str) -> tuple[Select, ColumnElement]:
+        self._ensure_schema()
+        # Quote the text as a single FTS5 phrase so user input cannot inject operators
+        phrase = '"' + text.replace('"', '""') + '"'
+        matching = select(literal_column("rowid")).select_from(self._fts).where(
+            literal_column(_FTS_TABLE).match(phrase)
+        )
+        # FTS5 `rank` is bm25: lower is better
+        rank = -(
+            select(literal_column("rank"))
+            .select_from(self._fts)
+            .where(literal_column(_FTS_TABLE).match(phrase), literal_column("rowid") == Product.id)
+            .scalar_subquery()
+        )
+        return query.filter(Product.id.in_(matching)), rank
+
+    def _ensure_schema(self):
+        if self._ready:
+            return
+        with self._lock:
+            if self._ready:
+                return
+            with db_session.get_bind().begin() as connection:
+                exists = connection.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE name = :name"), {"name": _FTS_TABLE}
+                ).first()
+                for statement in _FTS_DDL:
+                    connection.execute(text(statement))
+                if not exists:
+                    connection.execute(text("INSERT INTO products_fts(products_fts) VALUES ('rebuild')"))
+                    logger.info(f"Created and populated the {_FTS_TABLE} FTS5 table")
+            self._ready = True
@@ -1,6 +1,5 @@
 @echo off
 
-alembic revision --autogenerate -m "update tables"
 alembic upgrade head
 
 :: Start the FastAPI application using Gunicorn
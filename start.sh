@@ -2,7 +2,6 @@
 
 # Run Alembic migrations
 echo "Running Alembic migrations..."
-uv run alembic revision --autogenerate -m "update tables"
 uv run alembic upgrade head
 
 # Start the FastAPI application using Uvicorn
@@ -0,0 +1,41 @@
+from collections.abc import Iterator
+
+from src.models.request_models import GetFilteredProductsRequest
+
+# Shape of the synthetic catalog seeded by the `seeded_catalog` fixture
+SEED = 42
+N_CATEGORIES = 20
+N_PRODUCTS = 50_000
+# Carried by RARE_PRODUCTS products only: filters on them are highly selective
+RARE_TAG = "rare"
+RARE_CATEGORY = "Rare category"
+RARE_PRODUCTS = 20
+COMMON_TAGS = ["new", "sale", "eco", "premium", "bundle", "gift", "outlet", "limited"]
+
+
+def filter_request(**fields) -> GetFilteredProductsRequest:
+    """A GetFilteredProductsRequest with the required criteria defaulting to None."""
+    criteria = {"text_filter": None, "category_filter": None, "min_max_price_filter": None, "sort_by": None}
+    return GetFilteredProductsRequest(**(criteria | fields))
+
+
+def plan_nodes(plan: dict) -> Iterator[dict]:
+    """Walk a plan from `EXPLAIN (FORMAT JSON)` depth-first, the root node included."""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def uses_index(plan: dict, index_name: str) -> bool:
+    return any(node.get("Index Name") == index_name for node in plan_nodes(plan))
+
+
+def seq_scanned(plan: dict, relation: str) -> bool:
+    return any(
+        node["Node Type"] == "Seq Scan" and node.get("Relation Name") == relation
+        for node in plan_nodes(plan)
+    )
+
+
+def used_indexes(plan: dict) -> set[str]:
+    return {node["Index Name"] for node in plan_nodes(plan) if "Index Name" in node}
@@ -0,0 +1,37 @@
+from sqlalchemy import insert, select
+
+from plan_utils import seq_scanned, used_indexes
+from src.database.database_instance.db_instance import db_session
+from src.entities.category.category_crud import delete_category
+from src.entities.category.category_entity import Category, product_category
+from src.entities.product.product_entity import Product
+from src.models.request_models import DeleteCategoryRequest
+
+LINKED_PRODUCTS = 5
+
+
+def _category_with_products() -> int:
+    category_id = db_session.scalar(insert(Category).values(name="Plan test category").returning(Category.id))
+    product_ids = db_session.scalars(select(Product.id).order_by(Product.id).limit(LINKED_PRODUCTS)).all()
+    db_session.execute(
+        insert(product_category),
+        [{"product_id": product_id, "category_id": category_id} for product_id in product_ids],
+    )
+    db_session.commit()
+    return category_id
+
+
+def test_delete_category_finds_its_products_by_index(seeded_catalog, captured_statements, explain):
+    category_id = _category_with_products()
+
+    captured_statements.clear()
+    delete_category(DeleteCategoryRequest(id=category_id))
+
+    plans = [explain(statement, parameters) for statement, parameters in captured_statements]
+    assert plans
+    assert any(
+        "ix_ProductCategories_category_id_product_id" in used_indexes(plan) for plan in plans
+    )
+    for plan in plans:
+        assert not seq_scanned(plan, "Products")
+        assert not seq_scanned(plan, "ProductCategories")
@@ -0,0 +1,159 @@
+from datetime import datetime
+
+import pytest
+
+from plan_utils import (
+    RARE_CATEGORY,
+    RARE_TAG,
+    filter_request,
+    seq_scanned,
+    used_indexes,
+    uses_index,
+)
+from src.entities.product.product_crud import (
+    FILTERED_COUNT_EXACT_LIMIT,
+    _encode_cursor,
+    create_product,
+    get_filtered_products,
+    get_products_list,
+)
+from src.models.request_models import CreateProductRequest
+
+# A selective page may cost at most this fraction of a full scan of Products
+MAX_PAGE_COST_RATIO = 0.5
+# Tables that must never be read in full by a selective query
+LARGE_TABLES = ("Products", "ProductCategories")
+
+
+
+def _plans(captured_statements, explain) -> list[dict]:
+    return [explain(statement, parameters) for statement, parameters in captured_statements]
+
+
+def _filtered_products_plan(captured_statements, explain, product_filter) -> dict:
+    captured_statements.clear()
+    get_filtered_products(product_filter)
+    assert len(captured_statements) == 1
+    return explain(*captured_statements[0])
+
+
+SELECTIVE_FILTERS = {
+    "price range, price sort": (
+        filter_request(min_max_price_filter=(100, 110), sort_by=("price", "asc")),
+        {"ix_Products_price_id"},
+    ),
+    "price range, price sort desc": (
+        filter_request(min_max_price_filter=(100, 110), sort_by=("price", "desc")),
+        {"ix_Products_price_id"},
+    ),
+    "date range, date sort": (
+        filter_request(created_before=datetime(2000, 1, 1), sort_by=("date", "desc")),
+        {"ix_Products_created_at_id"},
+    ),
+    "rare category": (
+        filter_request(category_filter=[RARE_CATEGORY]),
+        {"ix_ProductCategories_category_id_product_id", "ProductCategories_pkey"},
+    ),
+    "tags any": (
+        filter_request(tags_any=[RARE_TAG, "missing"]),
+        {"ix_Products_tags"},
+    ),
+    "tags all": (
+        filter_request(tags_all=[RARE_TAG, "sale"]),
+        {"ix_Products_tags"},
+    ),
+    "text search": (
+        filter_request(text_filter="12345"),
+        {"ix_Products_search_document", "ix_Products_name_trgm"},
+    ),
+}
+
+
+@pytest.mark.parametrize("product_filter, expected_indexes", SELECTIVE_FILTERS.values(), ids=SELECTIVE_FILTERS.keys())
+def test_selective_filter_uses_index(
+    seeded_catalog, captured_statements, explain, products_scan_cost, product_filter, expected_indexes
+):
+    plan = _filtered_products_plan(captured_statements, explain, product_filter)
+
+    assert used_indexes(plan) & expected_indexes
+    for table in LARGE_TABLES:
+        assert not seq_scanned(plan, table)
+    assert plan["Total Cost"] < products_scan_cost * MAX_PAGE_COST_RATIO
+
+
+@pytest.mark.parametrize("direction", ["asc", "desc"])
+def test_date_sorted_page_stops_after_its_rows(
+    seeded_catalog, captured_statements, explain, products_scan_cost, direction
+):
+    # The page walks the index and stops at LIMIT; the total next to it reads at most
+    # FILTERED_COUNT_EXACT_LIMIT + 1 rows (a capped scan), then falls back to the estimate
+    plan = _filtered_products_plan(captured_statements, explain, filter_request(sort_by=("date", direction)))
+
+    assert uses_index(plan, "ix_Products_created_at_id")
+    assert plan["Total Cost"] < products_scan_cost * MAX_PAGE_COST_RATIO
+
+
+def test_large_filtered_total_is_estimated(seeded_catalog, captured_statements):
+    product_filter = filter_request(sort_by=("date", "desc"))
+    captured_statements.clear()
+    _, total_count = get_filtered_products(product_filter)
+
+    # The EXPLAIN of the estimate is not captured: the page and its capped count are one statement
+    assert len(captured_statements) == 1
+    assert total_count > FILTERED_COUNT_EXACT_LIMIT
+    assert abs(total_count - seeded_catalog["products"]) < seeded_catalog["products"] * 0.1
+
+
+def test_page_past_the_end_counts_with_the_same_index(seeded_catalog, captured_statements, explain):
+    captured_statements.clear()
+    products, total_count = get_filtered_products(filter_request(min_max_price_filter=(100, 110), page=1_000))
+
+    assert products == []
+    assert total_count > 0
+    (plan,) = _plans(captured_statements, explain)
+    assert uses_index(plan, "ix_Products_price_id")
+    assert not seq_scanned(plan, "Products")
+
+
+def test_products_list_first_page_walks_primary_key(seeded_catalog, captured_statements, explain, products_scan_cost):
+    captured_statements.clear()
+    get_products_list(page=1, page_size=20)
+
+    (plan,) = _plans(captured_statements, explain)
+    assert uses_index(plan, "Products_pkey")
+    assert not seq_scanned(plan, "Products")
+    assert plan["Total Cost"] < products_scan_cost * MAX_PAGE_COST_RATIO
+
+
+def test_products_list_keyset_cost_does_not_grow_with_depth(seeded_catalog, captured_statements, explain):
+    depth = seeded_catalog["products"] - 100
+
+    captured_statements.clear()
+    get_products_list(page=1, page_size=20)
+    get_products_list(page=1, page_size=20, cursor=_encode_cursor(depth))
+    get_products_list(page=depth // 20, page_size=20)
+    first_page, keyset_page, offset_page = _plans(captured_statements, explain)
+
+    assert uses_index(keyset_page, "Products_pkey")
+    assert not seq_scanned(keyset_page, "Products")
+    assert keyset_page["Total Cost"] <= first_page["Total Cost"] * 2
+    assert offset_page["Total Cost"] > keyset_page["Total Cost"] * 10
+
+
+def test_create_product_touches_only_keys(seeded_catalog, captured_statements, explain):
+    captured_statements.clear()
+    create_product(
+        CreateProductRequest(
+            name="Plan test product",
+            price=10,
+            categories_name=[RARE_CATEGORY],
+            tags=[RARE_TAG],
+            description="Product created by the plan tests",
+        )
+    )
+
+    plans = _plans(captured_statements, explain)
+    assert len(plans) <= 5
+    for plan in plans:
+        for table in LARGE_TABLES:
+            assert not seq_scanned(plan, table)
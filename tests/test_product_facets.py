@@ -0,0 +1,97 @@
+"""
+Price histogram of the product facets.
+
+The bucket expression runs on SQLite and, when TEST_DATABASE_URL is set, on
+Postgres too: the two cast floats to integers differently (truncation vs
+rounding), so the buckets must not depend on it.
+"""
+
+import sqlite3
+
+import pytest
+import sqlalchemy as sa
+
+from src.database.db_factory import register_sqlite_functions
+from src.entities.product.product_crud import _price_facets, price_bucket
+
+BUCKETS = 10
+# low=0 and high=100: bucket i holds [10 * i, 10 * (i + 1)), the last one also holds 100
+EXPECTED_BUCKETS = {0: 0, 9: 0, 10: 1, 15: 1, 19: 1, 50: 5, 89: 8, 90: 9, 95: 9, 99: 9, 100: 9}
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def engine(request):
+    if request.param == "postgresql":
+        return request.getfixturevalue("pg_engine")
+    engine = sa.create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+def _histogram_rows(engine, prices: list[int]):
+    # Same shape as the statement of get_product_facets, over literal prices
+    filtered = sa.union_all(*(sa.select(sa.literal(price).label("price")) for price in prices)).cte("filtered")
+    bounds = sa.select(
+        sa.func.min(filtered.c.price).label("low"), sa.func.max(filtered.c.price).label("high")
+    ).subquery("bounds")
+    bucket = price_bucket(filtered.c.price, bounds.c.low, bounds.c.high, BUCKETS).label("bucket")
+    with engine.connect() as connection:
+        return connection.execute(
+            sa.select(bounds.c.low, bounds.c.high, bucket, sa.func.count().label("count"))
+            .select_from(filtered.join(bounds, sa.true()))
+            .group_by(bounds.c.low, bounds.c.high, bucket)
+        ).all()
+
+
+@pytest.mark.parametrize(("price", "expected"), EXPECTED_BUCKETS.items())
+def test_price_bucket_boundaries(engine, price, expected):
+    low, high = 0, 100
+    with engine.connect() as connection:
+        bucket = connection.scalar(
+            sa.select(price_bucket(sa.literal(price), sa.literal(low), sa.literal(high), BUCKETS))
+        )
+    assert bucket == expected
+
+
+def test_price_histogram_counts_every_product(engine):
+    prices = list(EXPECTED_BUCKETS)
+    facets = _price_facets(_histogram_rows(engine, prices), BUCKETS)
+
+    histogram = facets["price_histogram"]
+    assert facets["price"] == {"min": 0, "max": 100}
+    assert len(histogram) == BUCKETS
+    assert sum(bucket["count"] for bucket in histogram) == len(prices)
+    assert histogram[-1]["count"] == 4
+    assert histogram[1]["count"] == 3
+
+
+def test_single_price_histogram(engine):
+    facets = _price_facets(_histogram_rows(engine, [25, 25, 25]), BUCKETS)
+
+    assert facets["price"] == {"min": 25, "max": 25}
+    assert facets["price_histogram"] == [{"from": 25, "to": 25, "count": 3}]
+
+
+def _missing_floor(value):
+    raise sqlite3.OperationalError("no such function: floor")
+
+
+def test_price_histogram_without_sqlite_math_functions():
+    engine = sa.create_engine("sqlite://")
+    # Shadows the built-in FLOOR before the fallback probes for it, like a build
+    # without SQLITE_ENABLE_MATH_FUNCTIONS
+    sa.event.listen(
+        engine,
+        "connect",
+        lambda dbapi_connection, _: dbapi_connection.create_function("floor", 1, _missing_floor),
+        insert=True,
+    )
+    register_sqlite_functions(engine)
+    try:
+        facets = _price_facets(_histogram_rows(engine, list(EXPECTED_BUCKETS)), BUCKETS)
+    finally:
+        engine.dispose()
+
+    histogram = facets["price_histogram"]
+    assert sum(bucket["count"] for bucket in histogram) == len(EXPECTED_BUCKETS)
+    assert [bucket["count"] for bucket in histogram] == [2, 3, 0, 0, 0, 1, 0, 0, 1, 4]
@@ -0,0 +1,68 @@
+"""
+Import jobs are stored in the database, not in the process running them.
+
+Under several uvicorn workers the status poll lands on any of them: the job must
+be read back from the table, with the progress saved by the import. Bound to a
+SQLite file like the query count tests, so no Postgres is needed.
+"""
+
+import pytest
+import sqlalchemy as sa
+
+from src.core import product_import_service
+from src.core.product_import_service import (
+    get_import_job,
+    import_products,
+    register_import_job,
+)
+from src.database.database_instance.db_instance import db_session
+from src.entities.import_job.import_job_entity import ProductImport
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path, monkeypatch):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'imports.db'}")
+    ProductImport.__table__.create(engine)
+
+    db_session.remove()
+    monkeypatch.setitem(db_session.session_factory.kw, "bind", engine)
+    yield engine
+
+    db_session.remove()
+    engine.dispose()
+
+
+def test_registered_job_is_read_from_the_database(sqlite_engine):
+    job = register_import_job("ndjson")
+
+    stored = get_import_job(job.id)
+
+    assert stored is not job
+    assert stored.to_dict() == job.to_dict()
+    assert stored.status == "pending"
+
+
+def test_import_progress_is_saved(sqlite_engine):
+    job = register_import_job("ndjson")
+    # Rows rejected before any batch reaches the products table
+    lines = ['{"name": "A", "price": -1, "description": "x"}\n', "not json\n", "[1, 2]\n"]
+
+    import_products(lines, job)
+    stored = get_import_job(job.id)
+
+    assert stored.status == "completed"
+    assert (stored.processed, stored.inserted, stored.failed) == (3, 0, 3)
+    assert [error["line"] for error in stored.errors] == [1, 2, 3]
+    assert stored.finished_at >= stored.started_at
+
+
+def test_oldest_jobs_are_dropped(sqlite_engine, monkeypatch):
+    monkeypatch.setattr(product_import_service, "MAX_TRACKED_JOBS", 3)
+    jobs = [register_import_job("csv") for _ in range(4)]
+
+    assert get_import_job(jobs[0].id) is None
+    assert all(get_import_job(job.id) for job in jobs[1:])
+
+
+def test_unknown_job(sqlite_engine):
+    assert get_import_job("0" * 32) is None
@@ -0,0 +1,142 @@
+"""
+Number of SQL statements behind the product read paths.
+
+A page of products (with the categories of every product) must cost the same
+one or two statements whatever its size: a count growing with the page size is
+an N+1 on the categories. Counted with the per-request tracker of
+`instrument_queries`, on a SQLite file so that no Postgres is needed.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import sqlalchemy as sa
+
+from plan_utils import filter_request
+from src.database.database_instance.db_instance import db_session
+from src.entities.base import Base
+from src.entities.category.category_entity import Category, product_category
+from src.entities.product import product_crud
+from src.entities.product.product_crud import (
+    get_filtered_products,
+    get_product_by_id,
+    get_products_list,
+)
+from src.entities.product.product_entity import Product
+from src.models.request_models import GetProductRequest
+from src.observability.query_tracker import instrument_queries, track_queries
+
+N_CATEGORIES = 5
+N_PRODUCTS = 120
+PAGE_SIZES = [1, 5, 50, 100]
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path, monkeypatch):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'products.db'}")
+    Base.metadata.create_all(engine, tables=[Category.__table__, product_category, Product.__table__])
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+    with engine.begin() as connection:
+        connection.execute(sa.insert(Category), [{"id": i, "name": f"Category {i}"} for i in range(N_CATEGORIES)])
+        connection.execute(
+            sa.insert(Product),
+            [
+                {
+                    "id": i,
+                    "name": f"Product {i}",
+                    "price": i % 50,
+                    "tags": ["sale"] if i % 2 else ["new"],
+                    "created_at": created_at + timedelta(hours=i),
+                    "description": f"Product {i}",
+                }
+                for i in range(1, N_PRODUCTS + 1)
+            ],
+        )
+        # Two categories per product: one statement per product would show right away
+        connection.execute(
+            sa.insert(product_category),
+            [
+                {"product_id": i, "category_id": category_id}
+                for i in range(1, N_PRODUCTS + 1)
+                for category_id in {i % N_CATEGORIES, (i + 1) % N_CATEGORIES}
+            ],
+        )
+    instrument_queries(engine)
+
+    db_session.remove()
+    monkeypatch.setitem(db_session.session_factory.kw, "bind", engine)
+    yield engine
+
+    db_session.remove()
+    engine.dispose()
+
+
+@pytest.fixture
+def queries(sqlite_engine):
+    """Statements executed while the test runs, as QueryTrackingMiddleware counts them for a request."""
+    with track_queries() as queries:
+        yield queries
+
+
+
+@pytest.mark.parametrize("page_size", PAGE_SIZES)
+def test_products_list_is_one_statement(queries, page_size):
+    products, _ = get_products_list(page=1, page_size=page_size)
+
+    assert len(products) == page_size
+    assert all(product["categories"] for product in products)
+    assert queries.count == 1
+
+
+@pytest.mark.parametrize("page_size", PAGE_SIZES)
+def test_products_list_by_cursor_is_one_statement(queries, page_size):
+    _, cursor = get_products_list(page=1, page_size=page_size)
+    queries.count = 0
+
+    products, _ = get_products_list(page=1, page_size=page_size, cursor=cursor)
+
+    assert products
+    assert queries.count == 1
+
+
+def test_product_by_id_is_one_statement(queries):
+    product = get_product_by_id(GetProductRequest(id=7))
+
+    assert len(product["categories"]) == 2
+    assert queries.count == 1
+
+
+FILTERS = {
+    "unfiltered": {},
+    "category": {"category_filter": ["Category 1"], "sort_by": ("price", "asc")},
+    "price-tags": {"min_max_price_filter": (10, 40), "tags_any": ["sale"], "sort_by": ("date", "desc")},
+}
+
+
+@pytest.mark.parametrize("page_size", PAGE_SIZES)
+@pytest.mark.parametrize("product_filter", FILTERS.values(), ids=FILTERS.keys())
+def test_filtered_products_page_and_count_are_one_statement(queries, page_size, product_filter):
+    products, total_count = get_filtered_products(filter_request(page_size=page_size, **product_filter))
+
+    assert products
+    assert all(product["categories"] for product in products)
+    assert len(products) <= total_count <= N_PRODUCTS
+    assert queries.count == 1
+
+
+def test_filtered_products_past_the_last_page(queries):
+    products, total_count = get_filtered_products(filter_request(page=100, page_size=50))
+
+    assert products == []
+    assert total_count == N_PRODUCTS
+    assert queries.count == 1
+
+
+def test_filtered_products_above_the_exact_count_limit(queries, monkeypatch):
+    # SQLite has no planner estimate: past the limit the total is counted apart, exactly
+    monkeypatch.setattr(product_crud, "FILTERED_COUNT_EXACT_LIMIT", 10)
+    products, total_count = get_filtered_products(filter_request(page_size=5))
+
+    assert len(products) == 5
+    assert total_count == N_PRODUCTS
+    assert queries.count == 2
@@ -0,0 +1,60 @@
+"""
+Catalog version of the in-process trigram index.
+
+The index only sees the writes of its own process: a search at a catalog
+version its local writes do not account for must rebuild it from the database.
+"""
+
+from src.entities.product.product_search_index import ProductSearchIndex
+
+ROWS = [(1, "Zorbo widget", "A widget", ["new"]), (2, "Garden hose", "Green", ["sale"])]
+
+
+class Loader:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return list(self.rows)
+
+
+def _loaded_index(version: int) -> tuple[ProductSearchIndex, Loader]:
+    index, loader = ProductSearchIndex(), Loader(ROWS)
+    index.search("widget", loader=loader, version=version)
+    return index, loader
+
+
+def test_local_write_keeps_the_index():
+    index, loader = _loaded_index(version=5)
+
+    index.add(3, "Zorbo lamp", None, None)
+    index.account_write(6)
+    # A bulk write reports the same version once per product
+    index.account_write(6)
+
+    assert index.search("zorbo", loader=loader, version=6).keys() == {1, 3}
+    assert loader.calls == 1
+    assert index.version == 6
+
+
+def test_write_of_another_worker_rebuilds():
+    index, loader = _loaded_index(version=5)
+    # Product 3 was inserted by another worker at version 6
+    loader.rows = [*ROWS, (3, "Zorbo lamp", None, None)]
+
+    assert index.search("zorbo", loader=loader, version=6).keys() == {1, 3}
+    assert loader.calls == 2
+
+
+def test_local_write_after_a_remote_one_still_rebuilds():
+    index, loader = _loaded_index(version=5)
+
+    index.add(4, "Zorbo chair", None, None)
+    # Version 6 was another worker's write: this one committed 7
+    index.account_write(7)
+
+    assert index.version == 5
+    index.search("zorbo", loader=loader, version=7)
+    assert loader.calls == 2
@@ -0,0 +1,60 @@
+"""
+Validation and normalization of the product filter requests, with no database.
+
+An unchecked page size would divide by zero or let one request fetch (and
+cache) the whole filtered set; a page below 1 is a negative OFFSET, which
+SQLite reads as the first page and Postgres rejects.
+"""
+
+import pytest
+
+from plan_utils import filter_request
+from src.cache.cache_factory import ResultCacheFactory
+from src.cache.result_cache import MemoryResultCache
+from src.core import product_service
+from src.core.product_service import (
+    MAX_PAGE_SIZE,
+    get_filtered_products_service,
+    get_products_list_service,
+)
+
+INVALID_PAGES = {
+    "page-zero": ({"page": 0}, "Page must be greater than 0"),
+    "page-negative": ({"page": -3}, "Page must be greater than 0"),
+    "page-size-zero": ({"page_size": 0}, "Page size must be between 1"),
+    "page-size-too-large": ({"page_size": MAX_PAGE_SIZE + 1}, "Page size must be between 1"),
+    "page-size-huge": ({"page_size": 100_000}, "Page size must be between 1"),
+}
+
+
+@pytest.mark.parametrize(("paging", "message"), INVALID_PAGES.values(), ids=INVALID_PAGES.keys())
+def test_filtered_products_rejects_invalid_pages(paging, message):
+    with pytest.raises(ValueError, match=message):
+        get_filtered_products_service(filter_request(**paging))
+
+
+@pytest.mark.parametrize(("paging", "message"), INVALID_PAGES.values(), ids=INVALID_PAGES.keys())
+def test_products_list_rejects_invalid_pages(paging, message):
+    with pytest.raises(ValueError, match=message):
+        get_products_list_service(**({"page": 1, "page_size": 5} | paging))
+
+
+def test_filtered_products_query_the_normalized_text(monkeypatch):
+    queried = []
+
+    def _get_filtered_products(product_filter):
+        queried.append(product_filter.text_filter)
+        return [{"id": len(queried)}], 1
+
+    monkeypatch.setattr(product_service, "get_filtered_products", _get_filtered_products)
+    monkeypatch.setattr(product_service, "catalog_version", lambda: 0)
+    monkeypatch.setattr(
+        ResultCacheFactory, "_instance", MemoryResultCache(max_entries=10, max_memory_bytes=1_000_000, ttl_seconds=60)
+    )
+
+    first = get_filtered_products_service(filter_request(text_filter="Zorbo  Widget"))
+    second = get_filtered_products_service(filter_request(text_filter=" zorbo widget "))
+
+    # One query, with the text the cache key was built from; the other spelling is a hit
+    assert queried == ["zorbo widget"]
+    assert first["data"]["products"] == second["data"]["products"]
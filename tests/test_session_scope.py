@@ -0,0 +1,156 @@
+"""
+Lifecycle of `db_session` under concurrency.
+
+Unlike the plan tests these need no Postgres: they bind the session to a SQLite
+file whose pool has no overflow, so a session that kept its connection after a
+request would exhaust it and make the following requests time out.
+"""
+
+import asyncio
+import gc
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import sqlalchemy as sa
+from fastapi import APIRouter, Depends, FastAPI
+from sqlalchemy.orm import Session
+
+from src.database.database_instance.db_instance import (
+    db_session,
+    request_session,
+    session_scope,
+)
+from src.entities.category.category_entity import Category
+
+POOL_SIZE = 4
+N_CATEGORIES = 200
+N_REQUESTS = 400
+N_THREADS = 32
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path, monkeypatch):
+    engine = sa.create_engine(
+        f"sqlite:///{tmp_path / 'sessions.db'}",
+        poolclass=sa.pool.QueuePool,
+        pool_size=POOL_SIZE,
+        max_overflow=0,
+        pool_timeout=5,
+        connect_args={"check_same_thread": False},
+    )
+    Category.__table__.create(engine)
+    with engine.begin() as connection:
+        connection.execute(sa.insert(Category), [{"name": f"Category {i}"} for i in range(N_CATEGORIES)])
+
+    db_session.remove()
+    monkeypatch.setitem(db_session.session_factory.kw, "bind", engine)
+    yield engine
+
+    db_session.remove()
+    engine.dispose()
+
+
+def _open_sessions() -> list[Session]:
+    gc.collect()
+    return [obj for obj in gc.get_objects() if type(obj) is Session and obj.identity_map]
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    router = APIRouter(dependencies=[Depends(request_session)])
+
+    @router.get("/categories")
+    def categories():
+        # A session reused across requests would already hold the previous ones' objects
+        loaded_before = len(db_session.identity_map)
+        categories = db_session.query(Category).all()
+        return {"session": id(db_session()), "loaded_before": loaded_before, "loaded": len(categories)}
+
+    @router.post("/categories")
+    def create_category(fail: bool = False):
+        db_session.add(Category(name="Created in a request"))
+        db_session.flush()
+        if fail:
+            raise RuntimeError("Failure after the flush")
+        return {"created": True}
+
+    @router.get("/async")
+    async def async_categories():
+        # The chatbot pattern: an async endpoint delegating the DB work to a scope
+        with session_scope():
+            return {"loaded": db_session.query(Category).count()}
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+async def _concurrent_requests(app: FastAPI, path: str, n: int) -> list[httpx.Response]:
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(*(client.get(path) for _ in range(n)))
+
+
+def test_concurrent_requests_release_sessions_and_connections(sqlite_engine, app):
+    responses = asyncio.run(_concurrent_requests(app, "/categories", N_REQUESTS))
+
+    assert all(response.status_code == 200 for response in responses)
+    bodies = [response.json() for response in responses]
+    assert all(body["loaded"] == N_CATEGORIES for body in bodies)
+    assert all(body["loaded_before"] == 0 for body in bodies)
+
+    assert sqlite_engine.pool.checkedout() == 0
+    assert not db_session.registry.registry
+    assert not _open_sessions()
+
+
+def test_failed_request_is_rolled_back(sqlite_engine, app):
+    async def requests():
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            failed = await client.post("/categories", params={"fail": True})
+            created = await client.post("/categories")
+        return failed, created
+
+    failed, created = asyncio.run(requests())
+
+    assert failed.status_code == 500
+    assert created.status_code == 200
+    with sqlite_engine.connect() as connection:
+        count = connection.scalar(sa.select(sa.func.count()).select_from(Category))
+    assert count == N_CATEGORIES + 1
+    assert sqlite_engine.pool.checkedout() == 0
+
+
+def test_session_scope_in_async_endpoint(sqlite_engine, app):
+    responses = asyncio.run(_concurrent_requests(app, "/async", 50))
+
+    assert all(response.json() == {"loaded": N_CATEGORIES} for response in responses)
+    assert sqlite_engine.pool.checkedout() == 0
+    assert not db_session.registry.registry
+
+
+def test_session_scope_from_many_threads(sqlite_engine):
+    def load(_) -> tuple[int, int]:
+        with session_scope():
+            return id(db_session()), len(db_session.query(Category).all())
+
+    with ThreadPoolExecutor(max_workers=N_THREADS) as executor:
+        results = list(executor.map(load, range(N_REQUESTS)))
+
+    assert all(loaded == N_CATEGORIES for _, loaded in results)
+    assert sqlite_engine.pool.checkedout() == 0
+    assert not db_session.registry.registry
+    assert not _open_sessions()
+
+
+def test_session_scope_rolls_back_on_error(sqlite_engine):
+    with pytest.raises(RuntimeError), session_scope():
+        db_session.add(Category(name="Never committed"))
+        db_session.flush()
+        raise RuntimeError("Failure after the flush")
+
+    with session_scope():
+        assert db_session.query(Category).filter(Category.name == "Never committed").count() == 0
+    assert sqlite_engine.pool.checkedout() == 0